@@ -1,6 +1,7 @@
 """Pipeline configuration loaded from environment variables."""
 
 import os
+import tempfile
 from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
@@ -32,6 +33,12 @@ class Settings:
     rate_limit_delay: float = field(
         default_factory=lambda: float(os.getenv("RATE_LIMIT_DELAY", "2.0"))
     )
+    # Small on-disk caches (HTTP validators etc.); empty disables persistence
+    cache_dir: str = field(
+        default_factory=lambda: os.getenv(
+            "CACHE_DIR", os.path.join(tempfile.gettempdir(), "waterwatcher")
+        )
+    )
 
     # Craigslist regions to monitor
     craigslist_regions: list[str] = field(
@@ -67,6 +74,10 @@ class Settings:
     ridb_api_key: str = field(
         default_factory=lambda: os.getenv("RIDB_API_KEY", "")
     )
+    # Facility / rec-area listings change over weeks; reuse them this long
+    ridb_catalog_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("RIDB_CATALOG_TTL_SECONDS", "86400"))
+    )
 
     # Land agency scrape interval (minutes)
     land_agency_interval_minutes: int = field(
@@ -106,6 +117,10 @@ class Settings:
     facebook_interval_minutes: int = field(
         default_factory=lambda: int(os.getenv("FACEBOOK_INTERVAL_MINUTES", "360"))
     )
+    # Tracked rivers are reused across scrape cycles for this long
+    river_cache_ttl_seconds: int = field(
+        default_factory=lambda: int(os.getenv("RIVER_CACHE_TTL_SECONDS", "3600"))
+    )
 
 
 settings = Settings()
@@ -1,12 +1,24 @@
 """SQLAlchemy database connection for the pipeline."""
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from config.settings import settings
 
 
-engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
+def _json_dumps(value) -> str:
+    """Serialize JSON columns (raw scrape payloads, metadata) with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_engine(
+    settings.database_url,
+    echo=False,
+    pool_pre_ping=True,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(bind=engine)
 
 
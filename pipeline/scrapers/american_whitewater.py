@@ -15,16 +15,26 @@ Data extracted:
 - Hazard alerts and warnings
 """
 
+import functools
+import html
+import os
+import re
 import time
 import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
 
 from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.keywords import best_keyword_match, keyword_automaton
+from scrapers.markup import element_text
 from config.settings import settings
-from models import SessionLocal, River, Hazard
+from models import SessionLocal, River, Hazard, engine
 
 
 # AW API base URL
@@ -45,6 +55,105 @@ DIFFICULTY_MAP = {
     "VI": "Class VI",
 }
 
+# Gauge units that denote a stage height rather than a flow rate
+GAUGE_HEIGHT_UNITS = frozenset({"ft", "feet"})
+
+# Tag stripping for reach descriptions, which are short HTML snippets
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Deletes thousands separators ("1,250" -> "1250") before float()
+_THOUSANDS_SEP = str.maketrans("", "", ",")
+
+# Hazard type keywords, checked in order. Logjam runs before strainer so
+# "log jam" text is not swallowed by the broader strainer keywords.
+HAZARD_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("logjam", ("logjam", "log jam", "blockage")),
+    ("strainer", ("strainer", "tree", "wood", "debris")),
+    ("dam", ("dam", "diversion", "weir")),
+    ("closure", ("closure", "closed", "permit")),
+    ("rapid_change", ("rapid", "hole", "hydraulic", "undercut")),
+)
+
+# All hazard keywords in one automaton; priority follows HAZARD_KEYWORDS order
+_HAZARD_AUTOMATON = keyword_automaton(
+    (keyword, (priority, hazard_type))
+    for priority, (hazard_type, keywords) in enumerate(HAZARD_KEYWORDS)
+    for keyword in keywords
+)
+
+
+def _class_contains(*words: str, tags: tuple[str, ...] = ()) -> etree.XPath:
+    """Match descendants whose class contains any of ``words``, ignoring case.
+
+    The XPath equivalent of ``[class*="word" i]``, optionally limited to
+    the given tag names.
+    """
+    lowered = (
+        "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    )
+    class_test = " or ".join(f"contains({lowered}, '{word}')" for word in words)
+    tag_test = " or ".join(f"self::{tag}" for tag in tags)
+    predicate = f"[{tag_test}]" if tag_test else ""
+    return etree.XPath(f"descendant::*{predicate}[{class_test}]")
+
+
+# Reach page selectors, compiled once. Each is a callable that returns its
+# matches under an element in document order.
+_GAUGE_TABLE_SELECTOR = CSSSelector("table.gaugeTable")
+_GAUGE_SECTION_SELECTOR = CSSSelector("div#gauge-container, div.gauge-info")
+_ROW_SELECTOR = CSSSelector("tr")
+_CELL_SELECTOR = CSSSelector("td")
+_RAPID_SELECTOR = CSSSelector("div.rapid, div.rapid-detail")
+_RAPIDS_TABLE_SELECTOR = CSSSelector("table#rapids, table.rapids")
+_RAPID_NAME_SELECTORS = (
+    _class_contains("name", tags=("h3", "h4", "strong", "span")),
+    CSSSelector("h3, h4"),
+)
+_RAPID_CLASS_SELECTORS = (_class_contains("class"),)
+_REPORT_SELECTOR = CSSSelector("div.trip-report, div.report")
+_REPORT_FLOW_SELECTORS = (_class_contains("flow", "level"),)
+_REPORT_DATE_SELECTORS = (_class_contains("date"),)
+_REPORT_QUALITY_SELECTORS = (_class_contains("quality"),)
+_REPORT_COMMENT_SELECTORS = (CSSSelector("p"), CSSSelector(".comment"))
+_ALERT_SELECTOR = CSSSelector("div.alert, div.hazard")
+_ALERT_TITLE_SELECTORS = (CSSSelector("h3, h4, strong"),)
+_PARAGRAPH_SELECTORS = (CSSSelector("p"),)
+_DESCRIPTION_SELECTORS = (CSSSelector("p"), CSSSelector("div.description"))
+
+
+# One parser for every reach page. Comments are dropped while parsing since
+# nothing reads them. Each shard process parses from a single thread.
+_HTML_PARSER = lxml.html.HTMLParser(remove_comments=True)
+
+
+def _parse_html(text: str):
+    """Parse a reach page with lxml; None if the body is empty.
+
+    Reach pages are always full documents, so this goes straight to
+    ``document_fromstring`` rather than letting ``fromstring`` sniff for
+    fragments first.
+    """
+    try:
+        return lxml.html.document_fromstring(text, parser=_HTML_PARSER)
+    except etree.ParserError:
+        return None
+
+
+def _first_text(el, selectors) -> str | None:
+    """Return the stripped text of the first selector match that has any.
+
+    Each selector is tried in order and only its first match is read, so
+    the text of the matched subtree is extracted exactly once.
+    """
+    for selector in selectors:
+        found = selector(el)
+        if found:
+            text = element_text(found[0])
+            if text:
+                return text
+    return None
+
 
 class AmericanWhitewaterScraper(BaseScraper):
     """Scrapes river condition data from American Whitewater.
@@ -52,10 +161,20 @@ class AmericanWhitewaterScraper(BaseScraper):
     AW organizes rivers by 'reach' IDs. Each reach represents a specific
     section of a river. This scraper fetches reach details, gauge readings,
     rapid descriptions, and recent trip reports.
+
+    Pass ``include_raw=True`` to keep the raw reach JSON on each item
+    under ``data["raw"]``; it is omitted by default to keep items small.
+
+    Tracked reach IDs are cached on the class for
+    ``settings.river_cache_ttl_seconds``, so scheduled runs within the TTL
+    skip the database query.
     """
 
-    def __init__(self):
+    _aw_ids_entry: tuple[float, list[str]] | None = None
+
+    def __init__(self, include_raw: bool = False):
         super().__init__()
+        self._include_raw = include_raw
         self._client = httpx.Client(
             timeout=settings.request_timeout,
             headers={
@@ -70,18 +189,31 @@ class AmericanWhitewaterScraper(BaseScraper):
         return "aw"
 
     def _get_tracked_aw_ids(self) -> list[str]:
-        """Get American Whitewater reach IDs for all tracked rivers."""
+        """Get American Whitewater reach IDs for all tracked rivers, cached for the TTL."""
+        entry = AmericanWhitewaterScraper._aw_ids_entry
+        if entry is not None and time.monotonic() - entry[0] < settings.river_cache_ttl_seconds:
+            return entry[1]
+
         session = SessionLocal()
         try:
-            rivers = (
-                session.query(River)
+            # Only the AW ID column; no River entities are hydrated
+            rows = (
+                session.query(River.aw_id)
                 .filter(River.aw_id.isnot(None))
                 .all()
             )
-            return [r.aw_id for r in rivers]
+            aw_ids = [r.aw_id for r in rows]
         finally:
             session.close()
 
+        AmericanWhitewaterScraper._aw_ids_entry = (time.monotonic(), aw_ids)
+        return aw_ids
+
+    @classmethod
+    def clear_aw_id_cache(cls) -> None:
+        """Forget the cached reach IDs so the next scrape re-queries."""
+        cls._aw_ids_entry = None
+
     def _fetch_reach_detail(self, reach_id: str) -> dict | None:
         """Fetch reach detail from AW's JSON endpoint.
 
@@ -117,27 +249,27 @@ class AmericanWhitewaterScraper(BaseScraper):
         try:
             resp = self._client.get(url)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
+            doc = _parse_html(resp.text)
             gauges = []
+            if doc is None:
+                return gauges
 
             # Parse gauge info from the reach detail page
-            gauge_table = soup.find("table", class_="gaugeTable")
-            if not gauge_table:
+            gauge_tables = _GAUGE_TABLE_SELECTOR(doc)
+            if not gauge_tables:
                 # Try alternate selectors — AW layout varies
-                gauge_section = soup.find("div", id="gauge-container") or soup.find(
-                    "div", class_="gauge-info"
-                )
-                if gauge_section:
-                    return self._parse_gauge_section(gauge_section)
+                gauge_sections = _GAUGE_SECTION_SELECTOR(doc)
+                if gauge_sections:
+                    return self._parse_gauge_section(gauge_sections[0])
                 return gauges
 
-            for row in gauge_table.find_all("tr")[1:]:  # skip header
-                cells = row.find_all("td")
+            for row in _ROW_SELECTOR(gauge_tables[0])[1:]:  # skip header
+                cells = _CELL_SELECTOR(row)
                 if len(cells) >= 3:
                     gauge = {
-                        "name": cells[0].get_text(strip=True),
-                        "reading": self._parse_float(cells[1].get_text(strip=True)),
-                        "unit": cells[2].get_text(strip=True) if len(cells) > 2 else "cfs",
+                        "name": element_text(cells[0]),
+                        "reading": self._parse_float(element_text(cells[1])),
+                        "unit": element_text(cells[2]) if len(cells) > 2 else "cfs",
                     }
                     gauges.append(gauge)
 
@@ -149,10 +281,8 @@ class AmericanWhitewaterScraper(BaseScraper):
     def _parse_gauge_section(self, section) -> list[dict]:
         """Parse gauge info from a div section on the reach page."""
         gauges = []
-        text = section.get_text(" ", strip=True)
+        text = element_text(section, " ")
         # Look for patterns like "Current Level: 450 cfs"
-        import re
-
         reading_match = re.search(r"(?:current|level|reading)[:\s]+([0-9,.]+)\s*(cfs|ft)", text, re.IGNORECASE)
         if reading_match:
             gauges.append({
@@ -176,46 +306,33 @@ class AmericanWhitewaterScraper(BaseScraper):
         try:
             resp = self._client.get(url)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
+            doc = _parse_html(resp.text)
+            if doc is None:
+                return rapids
 
             # AW lists rapids in a structured section
-            rapid_elements = soup.find_all("div", class_="rapid") or soup.find_all(
-                "div", class_="rapid-detail"
-            )
-
-            for elem in rapid_elements:
-                name_el = elem.find(["h3", "h4", "strong", "span"], class_=lambda c: c and "name" in c.lower() if c else False)
-                name = name_el.get_text(strip=True) if name_el else elem.find(["h3", "h4"])
-                if name and hasattr(name, "get_text"):
-                    name = name.get_text(strip=True)
+            for elem in _RAPID_SELECTOR(doc):
+                name = _first_text(elem, _RAPID_NAME_SELECTORS)
                 if not name:
                     continue
 
-                desc_el = elem.find("p") or elem.find("div", class_="description")
-                description = desc_el.get_text(strip=True) if desc_el else None
-
-                diff_el = elem.find(class_=lambda c: c and "class" in c.lower() if c else False)
-                difficulty = diff_el.get_text(strip=True) if diff_el else None
-
                 rapids.append({
-                    "name": str(name),
-                    "difficulty": difficulty,
-                    "description": description,
+                    "name": name,
+                    "difficulty": _first_text(elem, _RAPID_CLASS_SELECTORS),
+                    "description": _first_text(elem, _DESCRIPTION_SELECTORS),
                 })
 
             # Fallback: try parsing from a rapids table
             if not rapids:
-                rapids_table = soup.find("table", id="rapids") or soup.find(
-                    "table", class_="rapids"
-                )
-                if rapids_table:
-                    for row in rapids_table.find_all("tr")[1:]:
-                        cells = row.find_all("td")
+                rapids_tables = _RAPIDS_TABLE_SELECTOR(doc)
+                if rapids_tables:
+                    for row in _ROW_SELECTOR(rapids_tables[0])[1:]:
+                        cells = _CELL_SELECTOR(row)
                         if len(cells) >= 2:
                             rapids.append({
-                                "name": cells[0].get_text(strip=True),
-                                "difficulty": cells[1].get_text(strip=True) if len(cells) > 1 else None,
-                                "description": cells[2].get_text(strip=True) if len(cells) > 2 else None,
+                                "name": element_text(cells[0]),
+                                "difficulty": element_text(cells[1]) if len(cells) > 1 else None,
+                                "description": element_text(cells[2]) if len(cells) > 2 else None,
                             })
 
         except (httpx.HTTPError, Exception) as e:
@@ -242,33 +359,19 @@ class AmericanWhitewaterScraper(BaseScraper):
             try:
                 resp = self._client.get(url)
                 resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "lxml")
-
-                report_elements = soup.find_all("div", class_="trip-report") or soup.find_all(
-                    "div", class_="report"
-                )
+                doc = _parse_html(resp.text)
+                report_elements = _REPORT_SELECTOR(doc) if doc is not None else []
 
                 if not report_elements:
                     break  # No more reports on this page
 
                 for elem in report_elements:
-                    date_el = elem.find(class_=lambda c: c and "date" in c.lower() if c else False)
-                    date_text = date_el.get_text(strip=True) if date_el else None
-
-                    flow_el = elem.find(class_=lambda c: c and ("flow" in c.lower() or "level" in c.lower()) if c else False)
-                    flow_text = flow_el.get_text(strip=True) if flow_el else None
-
-                    comment_el = elem.find("p") or elem.find(class_="comment")
-                    comment = comment_el.get_text(strip=True) if comment_el else None
-
-                    quality_el = elem.find(class_=lambda c: c and "quality" in c.lower() if c else False)
-                    quality = quality_el.get_text(strip=True) if quality_el else None
-
+                    flow_text = _first_text(elem, _REPORT_FLOW_SELECTORS)
                     reports.append({
-                        "date": date_text,
+                        "date": _first_text(elem, _REPORT_DATE_SELECTORS),
                         "flow": self._parse_float(flow_text) if flow_text else None,
-                        "quality": quality,
-                        "comment": comment,
+                        "quality": _first_text(elem, _REPORT_QUALITY_SELECTORS),
+                        "comment": _first_text(elem, _REPORT_COMMENT_SELECTORS),
                     })
 
                 # Rate limiting between pages
@@ -295,21 +398,16 @@ class AmericanWhitewaterScraper(BaseScraper):
         try:
             resp = self._client.get(url)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
-
-            alert_elements = soup.find_all("div", class_="alert") or soup.find_all(
-                "div", class_="hazard"
-            )
-
-            for elem in alert_elements:
-                title_el = elem.find(["h3", "h4", "strong"])
-                title = title_el.get_text(strip=True) if title_el else "Unknown hazard"
+            doc = _parse_html(resp.text)
+            if doc is None:
+                return hazards
 
-                desc_el = elem.find("p")
-                description = desc_el.get_text(strip=True) if desc_el else None
+            for elem in _ALERT_SELECTOR(doc):
+                title = _first_text(elem, _ALERT_TITLE_SELECTORS) or "Unknown hazard"
+                description = _first_text(elem, _PARAGRAPH_SELECTORS)
 
                 # Determine severity from CSS classes or text
-                classes = " ".join(elem.get("class", []))
+                classes = elem.get("class", "")
                 if "danger" in classes or "critical" in classes:
                     severity = "danger"
                 elif "warning" in classes or "caution" in classes:
@@ -332,20 +430,16 @@ class AmericanWhitewaterScraper(BaseScraper):
 
         return hazards
 
-    def _classify_hazard(self, title: str, description: str) -> str:
-        """Classify a hazard into a type based on its text content."""
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_hazard(title: str, description: str) -> str:
+        """Classify a hazard into a type based on its text content.
+
+        AW hazard text is largely templated, so results are memoized on the
+        ``(title, description)`` pair.
+        """
         text = f"{title} {description}".lower()
-        if any(w in text for w in ("logjam", "log jam", "blockage")):
-            return "logjam"
-        if any(w in text for w in ("strainer", "tree", "wood", "debris")):
-            return "strainer"
-        if any(w in text for w in ("dam", "diversion", "weir")):
-            return "dam"
-        if any(w in text for w in ("closure", "closed", "permit")):
-            return "closure"
-        if any(w in text for w in ("rapid", "hole", "hydraulic", "undercut")):
-            return "rapid_change"
-        return "rapid_change"
+        return best_keyword_match(_HAZARD_AUTOMATON, text, "rapid_change")
 
     def _extract_reach_data(self, reach_detail: dict) -> dict:
         """Extract structured data from AW's reach detail JSON response.
@@ -371,8 +465,7 @@ class AmericanWhitewaterScraper(BaseScraper):
         description = river_info.get("description", "")
 
         # Normalize difficulty
-        if difficulty and difficulty in DIFFICULTY_MAP:
-            difficulty = DIFFICULTY_MAP[difficulty]
+        difficulty = DIFFICULTY_MAP.get(difficulty, difficulty)
 
         # Extract recommended flow range
         flow_range = {}
@@ -400,8 +493,8 @@ class AmericanWhitewaterScraper(BaseScraper):
         """Remove HTML tags from a string."""
         if not text:
             return ""
-        soup = BeautifulSoup(text, "lxml")
-        return soup.get_text(" ", strip=True)
+        # Tags become spaces so adjacent blocks don't run together
+        return _WHITESPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text))).strip()
 
     @staticmethod
     def _parse_float(value) -> float | None:
@@ -410,10 +503,12 @@ class AmericanWhitewaterScraper(BaseScraper):
             return None
         if isinstance(value, (int, float)):
             return float(value)
+        text = value if isinstance(value, str) else str(value)
         try:
-            cleaned = str(value).replace(",", "").strip()
-            return float(cleaned) if cleaned else None
-        except (ValueError, TypeError):
+            # float() already ignores surrounding whitespace and rejects
+            # empty strings, so dropping thousands separators is enough
+            return float(text.translate(_THOUSANDS_SEP))
+        except ValueError:
             return None
 
     def _save_hazards(self, aw_id: str, hazards: list[dict]) -> None:
@@ -468,8 +563,8 @@ class AmericanWhitewaterScraper(BaseScraper):
         finally:
             session.close()
 
-    def scrape(self) -> list[ScrapedItem]:
-        """Run the American Whitewater scraper.
+    def scrape_iter(self) -> Iterator[ScrapedItem]:
+        """Run the American Whitewater scraper, yielding items as they complete.
 
         For each tracked river with an AW ID:
         1. Fetch reach details from JSON endpoint
@@ -479,8 +574,40 @@ class AmericanWhitewaterScraper(BaseScraper):
         5. Check for hazard alerts
         6. Normalize everything into ScrapedItem format
 
+        Each reach's item is yielded as soon as it is built, so consumers
+        can persist it while the next reach is being scraped instead of
+        holding every reach in memory.
+
+        Yields:
+            ScrapedItem objects with AW data, one per reach.
+        """
+        self.log_start()
+        aw_ids = self._get_tracked_aw_ids()
+
+        if not aw_ids:
+            self.logger.info("No AW IDs configured, skipping")
+            return
+
+        count = 0
+        for item in self._iter_reaches(aw_ids):
+            count += 1
+            yield item
+
+        self.log_complete(count)
+
+    def scrape_sharded(self, n_workers: int | None = None) -> list[ScrapedItem]:
+        """Run the scraper across several worker processes.
+
+        Tracked reach IDs are split into ``n_workers`` shards, and each shard
+        is scraped in its own process with its own HTTP client and DB
+        sessions. Useful when tracking enough reaches that HTML parsing on a
+        single core becomes the bottleneck.
+
+        Args:
+            n_workers: Number of worker processes. Defaults to ``os.cpu_count()``.
+
         Returns:
-            List of ScrapedItem objects with AW data.
+            List of ScrapedItem objects from every shard.
         """
         self.log_start()
         aw_ids = self._get_tracked_aw_ids()
@@ -489,88 +616,122 @@ class AmericanWhitewaterScraper(BaseScraper):
             self.logger.info("No AW IDs configured, skipping")
             return []
 
+        n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(aw_ids)))
+        shards = [aw_ids[i::n_workers] for i in range(n_workers)]
+
         items: list[ScrapedItem] = []
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(_scrape_aw_shard, shard, self._include_raw)
+                for shard in shards
+            ]
+            for future in as_completed(futures):
+                try:
+                    items.extend(future.result())
+                except Exception as e:
+                    self.log_error(e)
 
+        self.log_complete(len(items))
+        return items
+
+    def _iter_reaches(self, aw_ids: list[str]) -> Iterator[ScrapedItem]:
+        """Scrape the given reaches in order, skipping any that fail."""
         for aw_id in aw_ids:
             try:
-                view_url = f"{AW_API_BASE}/River/detail/id/{aw_id}/"
-                self.logger.info(f"Scraping AW reach {aw_id}")
+                item = self._scrape_reach(aw_id)
+            except Exception as e:
+                self.log_error(e)
+                continue
 
-                # 1. Get reach detail from JSON API
-                reach_detail = self._fetch_reach_detail(aw_id)
-                reach_data = (
-                    self._extract_reach_data(reach_detail) if reach_detail else {}
-                )
+            yield item
 
-                # Rate limit between requests
-                time.sleep(settings.rate_limit_delay)
-
-                # 2. Get gauge readings
-                gauge_data = self._fetch_gauge_data(aw_id)
-                time.sleep(settings.rate_limit_delay)
-
-                # 3. Get rapids
-                rapids = self._fetch_rapids(aw_id)
-                time.sleep(settings.rate_limit_delay)
-
-                # 4. Get recent trip reports
-                trip_reports = self._fetch_trip_reports(aw_id, max_pages=2)
-                time.sleep(settings.rate_limit_delay)
-
-                # 5. Get hazards
-                hazards = self._fetch_hazards(aw_id)
-                self._save_hazards(aw_id, hazards)
-
-                # Determine current flow from gauge readings
-                flow_rate = None
-                gauge_height = None
-                for g in gauge_data:
-                    reading = g.get("reading")
-                    unit = g.get("unit", "cfs").lower()
-                    if reading is not None:
-                        if unit == "cfs":
-                            flow_rate = reading
-                        elif unit in ("ft", "feet"):
-                            gauge_height = reading
-
-                # Build the scraped item
-                items.append(
-                    ScrapedItem(
-                        source="aw",
-                        source_url=view_url,
-                        data={
-                            "aw_id": aw_id,
-                            "name": reach_data.get("name", ""),
-                            "section": reach_data.get("section", ""),
-                            "difficulty": reach_data.get("difficulty", ""),
-                            "description": reach_data.get("description", ""),
-                            "flow_rate": flow_rate,
-                            "gauge_height": gauge_height,
-                            "flow_range": reach_data.get("flow_range", {}),
-                            "gauge_readings": gauge_data,
-                            "rapids": rapids,
-                            "trip_reports": trip_reports[:10],  # keep last 10
-                            "hazards": hazards,
-                            "raw": reach_data.get("raw_detail"),
-                        },
-                        scraped_at=datetime.now(timezone.utc),
-                    )
-                )
+            # Rate limiting between reaches
+            time.sleep(settings.rate_limit_delay)
 
-                self.logger.info(
-                    f"AW reach {aw_id}: flow={flow_rate}, "
-                    f"{len(rapids)} rapids, {len(trip_reports)} reports, "
-                    f"{len(hazards)} hazards"
-                )
+    def scrape(self) -> list[ScrapedItem]:
+        """Run the American Whitewater scraper.
 
-                # Rate limiting between reaches
-                time.sleep(settings.rate_limit_delay)
+        Thin wrapper around :meth:`scrape_iter` for callers that want
+        the full result list.
 
-            except Exception as e:
-                self.log_error(e)
+        Returns:
+            List of ScrapedItem objects with AW data.
+        """
+        return list(self.scrape_iter())
 
-        self.log_complete(len(items))
-        return items
+    def _scrape_reach(self, aw_id: str) -> ScrapedItem:
+        """Scrape every data source for a single reach into a ScrapedItem."""
+        view_url = f"{AW_API_BASE}/River/detail/id/{aw_id}/"
+        self.logger.info(f"Scraping AW reach {aw_id}")
+
+        # 1. Get reach detail from JSON API
+        reach_detail = self._fetch_reach_detail(aw_id)
+        reach_data = (
+            self._extract_reach_data(reach_detail) if reach_detail else {}
+        )
+
+        # Rate limit between requests
+        time.sleep(settings.rate_limit_delay)
+
+        # 2. Get gauge readings
+        gauge_data = self._fetch_gauge_data(aw_id)
+        time.sleep(settings.rate_limit_delay)
+
+        # 3. Get rapids
+        rapids = self._fetch_rapids(aw_id)
+        time.sleep(settings.rate_limit_delay)
+
+        # 4. Get recent trip reports
+        trip_reports = self._fetch_trip_reports(aw_id, max_pages=2)
+        time.sleep(settings.rate_limit_delay)
+
+        # 5. Get hazards
+        hazards = self._fetch_hazards(aw_id)
+        self._save_hazards(aw_id, hazards)
+
+        # Determine current flow from gauge readings
+        flow_rate = None
+        gauge_height = None
+        for g in gauge_data:
+            reading = g.get("reading")
+            unit = g.get("unit", "cfs").lower()
+            if reading is not None:
+                if unit == "cfs":
+                    flow_rate = reading
+                elif unit in GAUGE_HEIGHT_UNITS:
+                    gauge_height = reading
+
+        data = {
+            "aw_id": aw_id,
+            "name": reach_data.get("name", ""),
+            "section": reach_data.get("section", ""),
+            "difficulty": reach_data.get("difficulty", ""),
+            "description": reach_data.get("description", ""),
+            "flow_rate": flow_rate,
+            "gauge_height": gauge_height,
+            "flow_range": reach_data.get("flow_range", {}),
+            "gauge_readings": gauge_data,
+            "rapids": rapids,
+            "trip_reports": trip_reports[:10],  # keep last 10
+            "hazards": hazards,
+        }
+        # The raw reach JSON is the largest field per item — only keep it
+        # when explicitly requested.
+        if self._include_raw:
+            data["raw"] = reach_data.get("raw_detail")
+
+        self.logger.info(
+            f"AW reach {aw_id}: flow={flow_rate}, "
+            f"{len(rapids)} rapids, {len(trip_reports)} reports, "
+            f"{len(hazards)} hazards"
+        )
+
+        return ScrapedItem(
+            source="aw",
+            source_url=view_url,
+            data=data,
+            scraped_at=datetime.now(timezone.utc),
+        )
 
     def __del__(self):
         """Clean up the HTTP client."""
@@ -578,3 +739,11 @@ class AmericanWhitewaterScraper(BaseScraper):
             self._client.close()
         except Exception:
             pass
+
+
+def _scrape_aw_shard(aw_ids: list[str], include_raw: bool) -> list[ScrapedItem]:
+    """Worker-process entry point for AmericanWhitewaterScraper.scrape_sharded()."""
+    # Pooled connections inherited from the parent process must not be reused.
+    engine.dispose(close=False)
+    scraper = AmericanWhitewaterScraper(include_raw=include_raw)
+    return list(scraper._iter_reaches(aw_ids))
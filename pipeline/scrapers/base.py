@@ -1,30 +1,254 @@
 """Base scraper class that all scrapers inherit from."""
 
+import asyncio
+import json
 import logging
+import math
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
+from urllib.parse import urlsplit
+
+from config.settings import settings
 
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapedItem:
-    """A single item produced by a scraper."""
+    """A single item produced by a scraper.
+
+    Slotted: scrapers create one per advisory/post/reach, so skipping the
+    per-instance ``__dict__`` adds up over large feeds.
+    """
     source: str
     source_url: str | None = None
     data: dict[str, Any] = field(default_factory=dict)
     scraped_at: datetime = field(default_factory=_utc_now)
 
 
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Holds up to ``capacity`` tokens, refilled at ``rate`` tokens per second.
+    Each request takes one token and only waits once the bucket is empty,
+    so short bursts go out with no delay at all. An infinite ``rate``
+    never waits except when paused by ``Retry-After``. Safe to share
+    between threads, so several scraper runs can draw from one budget.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            if math.isinf(self.rate):
+                return max(0.0, self._paused_until - now)
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait (without blocking the event loop) until a token is available."""
+        wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+    def update_from_headers(self, headers) -> None:
+        """Slow down when the server signals it via rate-limit headers.
+
+        ``Retry-After`` (seconds or an HTTP date) pauses the bucket, and
+        ``X-RateLimit-Remaining: 0`` drains any tokens left.
+        """
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = 0.0
+            if delay > 0:
+                with self._lock:
+                    self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+        if headers.get("X-RateLimit-Remaining") == "0":
+            with self._lock:
+                self._tokens = min(self._tokens, 0.0)
+
+
+class _JsonFileCache:
+    """Dict of entries mirrored to a small JSON file.
+
+    A missing, unreadable or corrupt file starts the cache empty, and each
+    save is written atomically. With ``path=None`` entries only live in
+    memory.
+    """
+
+    # Used in the warning logged when the file can't be written
+    kind = "cache"
+
+    def __init__(self, path: str | None):
+        self.path = path
+        self._entries: dict[str, Any] = {}
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                return
+            if isinstance(entries, dict):
+                self._entries = entries
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.getLogger("pipeline.scrapers").warning(
+                f"Could not write {self.kind} {self.path}: {e}"
+            )
+
+
+class ValidatorCache(_JsonFileCache):
+    """Per-URL ``ETag`` / ``Last-Modified`` validators for conditional GETs.
+
+    Validators are kept in a small JSON file so they survive between
+    scrape cycles. With ``path=None`` they only live for this instance.
+    """
+
+    kind = "validator cache"
+
+    def headers_for(self, url: str) -> dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for ``url``."""
+        entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def update(self, url: str, headers) -> None:
+        """Remember the validators from a successful response to ``url``."""
+        entry = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        if not any(entry.values()):
+            if self._entries.pop(url, None) is not None:
+                self._save()
+            return
+        if self._entries.get(url) != entry:
+            self._entries[url] = entry
+            self._save()
+
+
+class CatalogCache(_JsonFileCache):
+    """Slow-changing API listings, persisted with a time-to-live.
+
+    Entries are kept in a small JSON file alongside their fetch time, so a
+    listing fetched by one scrape cycle is reused by the next ones until it
+    is ``ttl`` seconds old. With ``path=None`` entries only live for this
+    instance.
+    """
+
+    kind = "catalog cache"
+
+    def __init__(self, path: str | None, ttl: float):
+        super().__init__(path)
+        self.ttl = ttl
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None if missing or stale."""
+        entry = self._entries.get(key)
+        if not isinstance(entry, dict) or time.time() - entry.get("fetched_at", 0) > self.ttl:
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``, stamped with the current time."""
+        self._entries[key] = {"fetched_at": time.time(), "value": value}
+        self._save()
+
+    def clear(self) -> None:
+        """Drop every entry so the next lookup refetches."""
+        self._entries = {}
+        self._save()
+
+
+# Per-host token buckets of scraper classes with ``share_rate_limits`` set
+_shared_rate_limiters: dict[type, dict[str, TokenBucket]] = {}
+
+
 class BaseScraper(ABC):
     """Base class for all scrapers."""
 
+    # Per-host request budget: one request per ``settings.rate_limit_delay``
+    # seconds, with bursts of up to ``rate_limit_burst`` requests.
+    rate_limit_burst: int = 2
+    # Whether every instance in the process draws from the same per-host
+    # buckets, so overlapping runs can't exceed the budget between them
+    share_rate_limits: bool = False
+
     def __init__(self):
         self.logger = logging.getLogger(f"pipeline.scrapers.{self.name}")
+        self._rate_limiters: dict[str, TokenBucket] = (
+            _shared_rate_limiters.setdefault(type(self), {})
+            if self.share_rate_limits
+            else {}
+        )
+
+    @classmethod
+    def clear_rate_limits(cls) -> None:
+        """Forget the token buckets shared by instances of this class."""
+        _shared_rate_limiters.get(cls, {}).clear()
+
+    @property
+    def rate_limit_rate(self) -> float:
+        """Requests per second allowed per host (unlimited for a zero delay)."""
+        delay = settings.rate_limit_delay
+        return 1 / delay if delay > 0 else math.inf
+
+    def _rate_limiter(self, url: str) -> TokenBucket:
+        """Return the token bucket for the host in ``url``."""
+        host = urlsplit(url).netloc
+        bucket = self._rate_limiters.get(host)
+        if bucket is None:
+            bucket = self._rate_limiters.setdefault(
+                host, TokenBucket(self.rate_limit_rate, self.rate_limit_burst)
+            )
+        return bucket
 
     @property
     @abstractmethod
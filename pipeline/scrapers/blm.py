@@ -14,14 +14,19 @@ Data extracted:
 Source priority: 70 (per BD-002)
 """
 
-import time
+import asyncio
+import io
+import os
+import re
 import uuid
 from datetime import datetime, timezone
 
 import httpx
-from xml.etree import ElementTree
+import orjson
+from lxml import etree
 
-from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.base import BaseScraper, ScrapedItem, ValidatorCache
+from scrapers.keywords import best_keyword_match, keyword_automaton
 from config.settings import settings
 from models import SessionLocal, River
 
@@ -50,6 +55,90 @@ SEVERITY_KEYWORDS = {
     "info": ["seasonal", "permit", "information", "notice", "update", "open"],
 }
 
+# Atom namespace and the fully-qualified entry tag
+ATOM_NS = "http://www.w3.org/2005/Atom"
+ATOM_ENTRY = f"{{{ATOM_NS}}}entry"
+
+# Feed entry tag -> (title, description, link, date) child tags
+FEED_FIELDS = {
+    "item": ("title", "description", "link", "pubDate"),
+    ATOM_ENTRY: tuple(
+        f"{{{ATOM_NS}}}{name}" for name in ("title", "summary", "link", "updated")
+    ),
+}
+
+# Date formats seen in BLM feeds, for strings datetime.fromisoformat rejects
+DATE_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S%z",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+    "%a, %d %b %Y %H:%M:%S %z",  # RFC 822 (RSS)
+    "%a, %d %b %Y %H:%M:%S GMT",
+    "%m/%d/%Y",
+)
+
+# Shared stand-in for alerts without an "attributes" object; never mutated
+_EMPTY: dict = {}
+
+
+def _first(alert: dict, attrs: dict, *keys: str, attr_key: str, default=None):
+    """Return the first truthy top-level ``alert`` value among ``keys``.
+
+    Falls back to ``attrs[attr_key]`` (or ``default``) when none are set.
+    """
+    for key in keys:
+        value = alert.get(key)
+        if value:
+            return value
+    return attrs.get(attr_key, default)
+
+
+def _fast_iso(dt: datetime | None) -> str | None:
+    """Format a datetime like ``isoformat()``, fast-pathing whole-second UTC.
+
+    ``_parse_date`` normalizes naive values to UTC, so nearly every date
+    takes the fixed template; anything else defers to ``isoformat()``.
+    """
+    if dt is None:
+        return None
+    if dt.microsecond or dt.utcoffset():
+        return dt.isoformat()
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+        f"T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}+00:00"
+    )
+
+
+# Classification automata. Priority follows ADVISORY_TYPE_MAP's declaration
+# order and danger > warning > info for severity (info is also the default).
+_ADVISORY_AUTOMATON = keyword_automaton(
+    (keyword, (priority, advisory_type))
+    for priority, (keyword, advisory_type) in enumerate(ADVISORY_TYPE_MAP.items())
+)
+# Severity keyword -> priority (index into SEVERITY_LEVELS), normalized to
+# lowercase once at import. A keyword listed under two levels keeps the
+# more severe one.
+SEVERITY_LEVELS = ("danger", "warning", "info")
+_SEVERITY_TABLE: dict[str, int] = {}
+for _priority, _level in enumerate(SEVERITY_LEVELS):
+    for _keyword in SEVERITY_KEYWORDS[_level]:
+        _SEVERITY_TABLE.setdefault(_keyword.lower(), _priority)
+del _priority, _level, _keyword
+
+_SEVERITY_AUTOMATON = keyword_automaton(
+    (keyword, (priority, SEVERITY_LEVELS[priority]))
+    for keyword, priority in _SEVERITY_TABLE.items()
+)
+
+# River name patterns — "[Name] River", "[Name] Creek", etc. Checked in
+# order, so a River match anywhere in the text wins over a Creek match.
+RIVER_SUFFIXES = ("River", "Creek", "Canyon", "Fork")
+RIVER_NAME_PATTERNS = tuple(
+    re.compile(rf"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+{suffix}\b)")
+    for suffix in RIVER_SUFFIXES
+)
+
 
 class BLMScraper(BaseScraper):
     """Scrapes river corridor advisories from Bureau of Land Management.
@@ -61,54 +150,136 @@ class BLMScraper(BaseScraper):
 
     def __init__(self):
         super().__init__()
-        self._client = httpx.Client(
+        self._max_concurrency = 8  # in-flight requests to BLM per run
+        self._semaphore: asyncio.BoundedSemaphore | None = None
+        # Last strptime format that parsed successfully, per source feed
+        self._last_date_fmt: dict[str | None, str] = {}
+        # Alternation of tracked river names, loaded once on first scrape
+        self._known_rivers_re: re.Pattern | None = None
+        self._known_rivers: dict[str, str] = {}
+        # ETag / Last-Modified per feed URL, persisted between scrape cycles
+        self._validators = ValidatorCache(
+            os.path.join(settings.cache_dir, "blm_validators.json")
+            if settings.cache_dir
+            else None
+        )
+
+    @property
+    def name(self) -> str:
+        return "blm"
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the async HTTP client used for one scrape run.
+
+        HTTP/2 lets the API and RSS requests share a single TLS connection
+        to the BLM host. The pool lives for one run only, since async
+        connection pools are tied to the event loop that opened them.
+        """
+        return httpx.AsyncClient(
             timeout=settings.request_timeout,
             headers={
                 "User-Agent": "WaterWatcher/1.0 (river condition tracker)",
                 "Accept": "application/json, application/xml, text/xml",
             },
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=16,
+                keepalive_expiry=60.0,
+            ),
         )
-        self._rate_limit_delay = 2.0  # 2 second delay between requests
-
-    @property
-    def name(self) -> str:
-        return "blm"
 
     def _get_tracked_rivers(self) -> list:
-        """Get all tracked rivers from the database."""
+        """Get ``(id, name)`` rows for all tracked rivers from the database.
+
+        Only the columns river matching needs are selected, streamed in
+        batches rather than loading full River objects.
+        """
         session = SessionLocal()
         try:
-            return session.query(River).all()
+            return list(session.query(River.id, River.name).yield_per(500))
         finally:
             session.close()
 
+    def _load_known_rivers(self) -> None:
+        """Compile tracked river names into one case-insensitive alternation.
+
+        Longer names come first so "North Fork Payette River" wins over
+        "Payette River". Leaves the generic patterns as the only matcher
+        if the database is unavailable or has no rivers.
+        """
+        try:
+            rivers = self._get_tracked_rivers()
+        except Exception as e:
+            self.logger.warning(f"Could not load tracked rivers: {e}")
+            return
+
+        self._known_rivers = {r.name.lower(): r.name for r in rivers if r.name}
+        if not self._known_rivers:
+            return
+
+        names = sorted(self._known_rivers.values(), key=len, reverse=True)
+        self._known_rivers_re = re.compile(
+            r"\b(" + "|".join(re.escape(n) for n in names) + r")\b", re.IGNORECASE
+        )
+
     def scrape(self) -> list[ScrapedItem]:
         """Run the BLM scraper and return advisory items.
 
-        Fetches from BLM's recreation advisory API, parses results,
+        Synchronous entry point; see :meth:`scrape_async`.
+        """
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self) -> list[ScrapedItem]:
+        """Fetch the BLM API and RSS feed concurrently and return advisory items.
+
+        Fetches from BLM's recreation advisory API and RSS feed, parses results,
         and returns ScrapedItems with advisory data including river_name
         for name-based matching in the condition processor.
         """
         self.log_start()
         items: list[ScrapedItem] = []
+        if self._known_rivers_re is None:
+            self._load_known_rivers()
+        # Created per run: asyncio primitives bind to the running event loop.
+        self._semaphore = asyncio.BoundedSemaphore(self._max_concurrency)
+
+        async with self._make_client() as client:
+            results = await asyncio.gather(
+                self._fetch_advisories(client),
+                self._fetch_rss_advisories(client),
+                return_exceptions=True,
+            )
 
-        try:
-            # Fetch advisories from BLM API
-            api_items = self._fetch_advisories()
-            items.extend(api_items)
-
-            # Also try RSS feed for supplementary data
-            rss_items = self._fetch_rss_advisories()
-            items.extend(rss_items)
-
-        except Exception as e:
-            self.log_error(e)
+        for result in results:
+            if isinstance(result, BaseException):
+                self.log_error(result)
+            else:
+                items.extend(result)
 
         self.log_complete(len(items))
         return items
 
-    def _fetch_advisories(self) -> list[ScrapedItem]:
+    async def _get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """GET a BLM URL through the host's token bucket and concurrency limit.
+
+        Sends the validators from the last successfully parsed response, so
+        an unchanged feed comes back as an empty ``304 Not Modified``.
+        Callers store the new validators themselves once the body parses.
+        """
+        kwargs["headers"] = {**self._validators.headers_for(url), **kwargs.get("headers", {})}
+        bucket = self._rate_limiter(url)
+        await bucket.acquire_async()
+        if self._semaphore is None:
+            resp = await client.get(url, **kwargs)
+        else:
+            async with self._semaphore:
+                resp = await client.get(url, **kwargs)
+        bucket.update_from_headers(resp.headers)
+        return resp
+
+    async def _fetch_advisories(self, client: httpx.AsyncClient) -> list[ScrapedItem]:
         """Fetch advisories from BLM's recreation API."""
         items: list[ScrapedItem] = []
         base_url = settings.blm_base_url
@@ -120,9 +291,13 @@ class BLMScraper(BaseScraper):
                 "status": "active",
             }
 
-            resp = self._client.get(f"{base_url}/api/alerts", params=params)
+            url = f"{base_url}/api/alerts"
+            resp = await self._get(client, url, params=params)
+            if resp.status_code == 304:
+                self.logger.info("BLM API alerts unchanged since last scrape")
+                return items
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             alerts = []
             if isinstance(data, list):
@@ -135,7 +310,7 @@ class BLMScraper(BaseScraper):
                 if item:
                     items.append(item)
 
-            time.sleep(self._rate_limit_delay)
+            self._validators.update(url, resp.headers)
 
         except httpx.TimeoutException:
             self.logger.warning("BLM API request timed out")
@@ -146,18 +321,28 @@ class BLMScraper(BaseScraper):
 
         return items
 
-    def _fetch_rss_advisories(self) -> list[ScrapedItem]:
+    async def _fetch_rss_advisories(self, client: httpx.AsyncClient) -> list[ScrapedItem]:
         """Fetch advisories from BLM's RSS feed."""
         items: list[ScrapedItem] = []
         base_url = settings.blm_base_url
 
         try:
-            time.sleep(self._rate_limit_delay)
-
-            resp = self._client.get(f"{base_url}/rss/alerts.xml")
+            url = f"{base_url}/rss/alerts.xml"
+            resp = await self._get(client, url)
+            if resp.status_code == 304:
+                self.logger.info("BLM RSS feed unchanged since last scrape")
+                return items
             resp.raise_for_status()
 
-            items = self._parse_rss(resp.text)
+            try:
+                self._read_feed(resp.content, items)
+            except etree.XMLSyntaxError as e:
+                # Keep the partial items but not the validators, so the next
+                # scrape refetches the whole feed instead of getting a 304
+                self.logger.warning(f"Failed to parse BLM RSS XML: {e}")
+                return items
+
+            self._validators.update(url, resp.headers)
 
         except httpx.TimeoutException:
             self.logger.warning("BLM RSS request timed out")
@@ -179,170 +364,172 @@ class BLMScraper(BaseScraper):
         """
         try:
             # Extract fields — handle varying API structures
-            title = (
-                alert.get("title")
-                or alert.get("name")
-                or alert.get("attributes", {}).get("title", "")
+            attrs = alert.get("attributes") or _EMPTY
+            title = _first(alert, attrs, "title", "name", attr_key="title", default="")
+            description = _first(
+                alert, attrs, "description", "summary", attr_key="description", default=""
             )
-            description = (
-                alert.get("description")
-                or alert.get("summary")
-                or alert.get("attributes", {}).get("description", "")
-            )
-            affected_area = (
-                alert.get("area")
-                or alert.get("location")
-                or alert.get("attributes", {}).get("area_name", "")
+            affected_area = _first(
+                alert, attrs, "area", "location", attr_key="area_name", default=""
             )
 
-            # Try to extract river name from title or affected area
-            river_name = self._extract_river_name(title, affected_area, description)
-            if not river_name:
+            analysis = self._analyze(title, affected_area, description)
+            if analysis is None:
                 # Skip non-river advisories
                 return None
 
-            advisory_type = self._classify_advisory_type(title, description)
-            severity = self._classify_severity(title, description)
-
             # Parse dates
             start_date = self._parse_date(
-                alert.get("start_date")
-                or alert.get("startDate")
-                or alert.get("attributes", {}).get("start_date")
+                _first(alert, attrs, "start_date", "startDate", attr_key="start_date"), "json"
             )
             end_date = self._parse_date(
-                alert.get("end_date")
-                or alert.get("endDate")
-                or alert.get("attributes", {}).get("end_date")
+                _first(alert, attrs, "end_date", "endDate", attr_key="end_date"), "json"
             )
 
-            source_url = (
-                alert.get("url")
-                or alert.get("link")
-                or alert.get("attributes", {}).get("url")
-            )
+            source_url = _first(alert, attrs, "url", "link", attr_key="url")
 
-            return ScrapedItem(
-                source="blm",
-                source_url=source_url,
-                data={
-                    "river_name": river_name,
-                    "advisory_type": advisory_type,
-                    "severity": severity,
-                    "title": title,
-                    "description": description or None,
-                    "affected_area": affected_area or None,
-                    "start_date": start_date.isoformat() if start_date else None,
-                    "end_date": end_date.isoformat() if end_date else None,
-                },
+            return self._make_item(
+                analysis, title, description, affected_area, source_url, start_date, end_date
             )
         except (KeyError, TypeError, ValueError) as e:
             self.logger.debug(f"Skipping malformed BLM alert: {e}")
             return None
 
-    def _parse_rss(self, xml_text: str) -> list[ScrapedItem]:
+    def _parse_rss(self, xml: bytes | str) -> list[ScrapedItem]:
         """Parse BLM RSS feed XML into ScrapedItems.
 
+        Handles both RSS 2.0 ``<item>`` and Atom ``<entry>`` elements in a
+        single streaming pass; each element is released once parsed.
+
         Args:
-            xml_text: Raw XML string from the RSS feed.
+            xml: Raw feed body. Bytes are handed to lxml as-is so it decodes
+                them per the XML declaration; str is encoded as UTF-8.
 
         Returns:
-            List of ScrapedItems parsed from the feed.
+            List of ScrapedItems parsed from the feed; on a syntax error,
+            the items read before it.
         """
         items: list[ScrapedItem] = []
-
         try:
-            root = ElementTree.fromstring(xml_text)
-        except ElementTree.ParseError as e:
+            self._read_feed(xml, items)
+        except etree.XMLSyntaxError as e:
             self.logger.warning(f"Failed to parse BLM RSS XML: {e}")
-            return items
+        return items
 
-        # Handle both RSS 2.0 and Atom formats
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
+    def _read_feed(self, xml: bytes | str, items: list[ScrapedItem]) -> None:
+        """Stream feed entries from ``xml`` into ``items``.
 
-        # RSS 2.0: channel/item
-        for item_el in root.findall(".//item"):
-            title_el = item_el.find("title")
-            desc_el = item_el.find("description")
-            link_el = item_el.find("link")
-            date_el = item_el.find("pubDate")
+        Raises:
+            etree.XMLSyntaxError: If the feed is malformed. Entries parsed
+                before the error are already in ``items``.
+        """
+        context = etree.iterparse(
+            io.BytesIO(xml.encode() if isinstance(xml, str) else xml),
+            events=("end",),
+            tag=tuple(FEED_FIELDS),
+            resolve_entities=False,
+        )
 
-            if title_el is None:
-                continue
+        for _, el in context:
+            item = self._parse_feed_entry(el, FEED_FIELDS[el.tag])
+            if item:
+                items.append(item)
 
-            title = title_el.text or ""
-            description = desc_el.text if desc_el is not None else ""
-            link = link_el.text if link_el is not None else None
-            pub_date = date_el.text if date_el is not None else None
+            # Free the parsed element and any siblings already handled
+            el.clear(keep_tail=True)
+            while el.getprevious() is not None:
+                del el.getparent()[0]
 
-            river_name = self._extract_river_name(title, "", description)
-            if not river_name:
-                continue
+    def _parse_feed_entry(self, el, fields: tuple[str, str, str, str]) -> ScrapedItem | None:
+        """Parse one RSS ``<item>`` or Atom ``<entry>`` using its field tags.
 
-            advisory_type = self._classify_advisory_type(title, description)
-            severity = self._classify_severity(title, description)
-            start_date = self._parse_date(pub_date)
-
-            items.append(ScrapedItem(
-                source="blm",
-                source_url=link,
-                data={
-                    "river_name": river_name,
-                    "advisory_type": advisory_type,
-                    "severity": severity,
-                    "title": title,
-                    "description": description or None,
-                    "affected_area": None,
-                    "start_date": start_date.isoformat() if start_date else None,
-                    "end_date": None,
-                },
-            ))
-
-        # Atom format fallback
-        for entry in root.findall("atom:entry", ns):
-            title_el = entry.find("atom:title", ns)
-            summary_el = entry.find("atom:summary", ns)
-            link_el = entry.find("atom:link", ns)
-            updated_el = entry.find("atom:updated", ns)
-
-            if title_el is None:
-                continue
+        Args:
+            el: The item/entry element.
+            fields: ``(title, description, link, date)`` child tags from
+                ``FEED_FIELDS``.
 
-            title = title_el.text or ""
-            description = summary_el.text if summary_el is not None else ""
-            link = link_el.get("href") if link_el is not None else None
-            updated = updated_el.text if updated_el is not None else None
+        Returns:
+            ScrapedItem if the entry is river-related, None otherwise.
+        """
+        title_tag, desc_tag, link_tag, date_tag = fields
+        title = el.findtext(title_tag)
+        if title is None:
+            return None
 
-            river_name = self._extract_river_name(title, "", description)
-            if not river_name:
-                continue
+        description = el.findtext(desc_tag, "")
+        analysis = self._analyze(title, "", description)
+        if analysis is None:
+            return None
 
-            advisory_type = self._classify_advisory_type(title, description)
-            severity = self._classify_severity(title, description)
-            start_date = self._parse_date(updated)
-
-            items.append(ScrapedItem(
-                source="blm",
-                source_url=link,
-                data={
-                    "river_name": river_name,
-                    "advisory_type": advisory_type,
-                    "severity": severity,
-                    "title": title,
-                    "description": description or None,
-                    "affected_area": None,
-                    "start_date": start_date.isoformat() if start_date else None,
-                    "end_date": None,
-                },
-            ))
+        # Atom links carry the URL in href; RSS links in their text
+        link_el = el.find(link_tag)
+        link = None if link_el is None else link_el.get("href") or link_el.text
+        start_date = self._parse_date(el.findtext(date_tag), "rss")
 
-        return items
+        return self._make_item(analysis, title, description, None, link, start_date)
+
+    @staticmethod
+    def _make_item(
+        analysis: tuple[str, str, str],
+        title: str,
+        description: str | None,
+        affected_area: str | None,
+        source_url: str | None,
+        start_date: datetime | None,
+        end_date: datetime | None = None,
+    ) -> ScrapedItem:
+        """Build the ScrapedItem shared by API alerts and feed entries."""
+        river_name, advisory_type, severity = analysis
+        return ScrapedItem(
+            source="blm",
+            source_url=source_url,
+            data={
+                "river_name": river_name,
+                "advisory_type": advisory_type,
+                "severity": severity,
+                "title": title,
+                "description": description or None,
+                "affected_area": affected_area or None,
+                "start_date": _fast_iso(start_date),
+                "end_date": _fast_iso(end_date),
+            },
+        )
+
+    def _analyze(
+        self, title: str, area: str, description: str
+    ) -> tuple[str, str, str] | None:
+        """Extract the river name, advisory type and severity in one pass.
+
+        Skips classification for advisories without a river, and builds
+        the lowercased text once for both keyword classifiers.
+
+        Args:
+            title: Advisory title text.
+            area: Affected area text.
+            description: Full description text.
+
+        Returns:
+            ``(river_name, advisory_type, severity)``, or None if the
+            advisory does not mention a river.
+        """
+        description = description or ""
+        river_name = self._extract_river_name(title, area, description)
+        if not river_name:
+            return None
+
+        text_lower = f"{title} {description}".lower()
+        return (
+            river_name,
+            self._classify_advisory_type(text_lower),
+            self._classify_severity(text_lower),
+        )
 
     def _extract_river_name(self, title: str, area: str, description: str) -> str | None:
         """Try to extract a river name from advisory text.
 
-        Looks for common patterns like "X River", "X Creek", "X Canyon"
-        in the title, affected area, and description.
+        Prefers tracked river names from the database, then looks for
+        common patterns like "X River", "X Creek", "X Canyon" in the title,
+        affected area, and description.
 
         Args:
             title: Advisory title text.
@@ -352,74 +539,58 @@ class BLMScraper(BaseScraper):
         Returns:
             Extracted river name or None if no river reference found.
         """
-        import re
-
-        # Combine all text fields
         combined = f"{title} {area} {description}".strip()
         if not combined:
             return None
 
-        # River name patterns — look for "[Name] River" or "[Name] Creek" etc.
-        patterns = [
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+River\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Creek\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Canyon\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Fork\b)",
-        ]
+        if self._known_rivers_re is not None:
+            match = self._known_rivers_re.search(combined)
+            if match:
+                return self._known_rivers[match.group(1).lower()]
 
-        for pattern in patterns:
-            match = re.search(pattern, combined)
+        # A plain substring check rules most patterns out before any regex runs
+        for suffix, pattern in zip(RIVER_SUFFIXES, RIVER_NAME_PATTERNS):
+            if suffix not in combined:
+                continue
+            match = pattern.search(combined)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _classify_advisory_type(self, title: str, description: str) -> str:
+    def _classify_advisory_type(self, text_lower: str) -> str:
         """Classify an advisory into a type based on its text content.
 
         Args:
-            title: Advisory title.
-            description: Advisory description.
+            text_lower: Lowercased advisory title and description.
 
         Returns:
             Advisory type string.
         """
-        text = f"{title} {description}".lower()
-
-        for keyword, advisory_type in ADVISORY_TYPE_MAP.items():
-            if keyword in text:
-                return advisory_type
+        return best_keyword_match(_ADVISORY_AUTOMATON, text_lower, "general")
 
-        return "general"
-
-    def _classify_severity(self, title: str, description: str) -> str:
+    def _classify_severity(self, text_lower: str) -> str:
         """Classify the severity of an advisory based on keywords.
 
         Args:
-            title: Advisory title.
-            description: Advisory description.
+            text_lower: Lowercased advisory title and description.
 
         Returns:
             Severity string: "danger", "warning", or "info".
         """
-        text = f"{title} {description}".lower()
-
-        # Check danger first (highest priority)
-        for keyword in SEVERITY_KEYWORDS["danger"]:
-            if keyword in text:
-                return "danger"
-
-        for keyword in SEVERITY_KEYWORDS["warning"]:
-            if keyword in text:
-                return "warning"
+        return best_keyword_match(_SEVERITY_AUTOMATON, text_lower, "info")
 
-        return "info"
-
-    def _parse_date(self, date_str: str | None) -> datetime | None:
+    def _parse_date(self, date_str: str | None, source_hint: str | None = None) -> datetime | None:
         """Try to parse a date string in various formats.
 
+        ISO-8601 strings go through ``datetime.fromisoformat``. Everything
+        else tries the strptime formats, starting with whichever one last
+        succeeded for the same ``source_hint`` — feeds almost always use a
+        single format throughout.
+
         Args:
             date_str: Date string to parse, or None.
+            source_hint: Feed the date came from ("json" or "rss").
 
         Returns:
             Parsed datetime in UTC, or None.
@@ -427,27 +598,36 @@ class BLMScraper(BaseScraper):
         if not date_str:
             return None
 
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%a, %d %b %Y %H:%M:%S %z",  # RFC 822 (RSS)
-            "%a, %d %b %Y %H:%M:%S GMT",
-            "%m/%d/%Y",
-        ]
-
-        for fmt in formats:
+        date_str = date_str.strip()
+        dt = None
+
+        if date_str[4:5] == "-":
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
+                dt = datetime.fromisoformat(date_str)
             except ValueError:
-                continue
+                pass
+
+        if dt is None:
+            last_fmt = self._last_date_fmt.get(source_hint)
+            formats = DATE_FORMATS
+            if last_fmt:
+                formats = (last_fmt, *(f for f in DATE_FORMATS if f != last_fmt))
+
+            for fmt in formats:
+                try:
+                    dt = datetime.strptime(date_str, fmt)
+                except ValueError:
+                    continue
+                self._last_date_fmt[source_hint] = fmt
+                break
+
+        if dt is None:
+            self.logger.debug(f"Could not parse date: {date_str}")
+            return None
 
-        self.logger.debug(f"Could not parse date: {date_str}")
-        return None
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
 
     @staticmethod
     def _parse_float(value: str) -> float | None:
@@ -15,17 +15,27 @@ Data extracted per listing:
 - Category (auto-classified from keywords)
 """
 
+import asyncio
+import io
 import random
 import re
-import time
-import xml.etree.ElementTree as ET
+import threading
+from collections import Counter
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import product
 from urllib.parse import quote_plus, urljoin
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
+from sqlalchemy import select
 
 from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.keywords import best_keyword_match, keyword_automaton
+from scrapers.markup import element_text
 from config.settings import settings
 from models import SessionLocal, GearDeal
 
@@ -75,12 +85,73 @@ CATEGORY_MAP = {
     "wet suit": "drysuit",
 }
 
+# One automaton over every relevance keyword. Category keywords carry their
+# CATEGORY_MAP position as priority (first listed wins); the rest only mark
+# the listing relevant and rank last as "other". Every CATEGORY_MAP keyword
+# is also in RAFT_KEYWORDS.
+_OTHER = (len(CATEGORY_MAP), "other")
+_CATEGORY_PRIORITY = {
+    keyword: (priority, category)
+    for priority, (keyword, category) in enumerate(CATEGORY_MAP.items())
+}
+_LISTING_AUTOMATON = keyword_automaton(
+    (keyword, _CATEGORY_PRIORITY.get(keyword, _OTHER)) for keyword in RAFT_KEYWORDS
+)
+
 # Craigslist search categories
 CL_CATEGORIES = [
     "sga",  # sporting goods
     "boa",  # boats
 ]
 
+# Search terms grouped into compound queries to reduce request count
+SEARCH_GROUPS = [
+    "raft OR kayak OR canoe OR whitewater",
+    "paddle OR oar OR PFD OR life jacket",
+    "drysuit OR wetsuit OR NRS OR throw bag",
+    "AIRE OR Hyside OR Maravia OR SOTAR",
+]
+
+# URL-encoded form of each group, computed once rather than per request
+_ENCODED_GROUPS = {group: quote_plus(group) for group in SEARCH_GROUPS}
+
+# Candidate URLs per known-deal lookup; keeps the IN list under bind limits
+_URL_BATCH_SIZE = 500
+
+# Price ("$1,200", "$ 75.50") and first image in a description's HTML
+_PRICE_RE = re.compile(r"\$\s*([\d,]+(?:\.\d{2})?)")
+_IMG_RE = re.compile(r'<img[^>]+src="([^"]+)"')
+
+# Fully-qualified tags for RDF (RSS 1.0) feeds, which older Craigslist
+# feeds use; RSS 2.0 children are un-namespaced
+RSS1_NS = "http://purl.org/rss/1.0/"
+RSS1_ITEM = f"{{{RSS1_NS}}}item"
+RSS1_TITLE = f"{{{RSS1_NS}}}title"
+RSS1_LINK = f"{{{RSS1_NS}}}link"
+RSS1_DESCRIPTION = f"{{{RSS1_NS}}}description"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+
+# Child tag -> listing field for both RSS 2.0 and RDF items, so each item's
+# children are walked once instead of probed with a find() per variant.
+_RSS_ITEM_FIELDS = {
+    "title": "title",
+    RSS1_TITLE: "title",
+    "link": "link",
+    RSS1_LINK: "link",
+    "description": "description",
+    RSS1_DESCRIPTION: "description",
+    DC_DATE: "date",
+    "pubDate": "date",
+}
+
+# Search result rows (modern layout first) and their price spans, compiled
+# to XPath once instead of on every cssselect() call
+_RESULT_ROW_SELECTORS = (
+    CSSSelector("li.cl-static-search-result"),
+    CSSSelector("li.result-row"),
+)
+_PRICE_SELECTORS = (CSSSelector("span.priceinfo"), CSSSelector("span.result-price"))
+
 # User-Agent rotation to avoid basic bot detection
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -91,6 +162,35 @@ USER_AGENTS = [
 ]
 
 
+def _search_url(region: str, category: str, query: str, rss: bool = False) -> str:
+    """Build a Craigslist search URL, reusing the pre-encoded query groups."""
+    encoded = _ENCODED_GROUPS.get(query) or quote_plus(query)
+    fmt = "format=rss&" if rss else ""
+    return f"https://{region}.craigslist.org/search/{category}?{fmt}query={encoded}"
+
+
+def _parse_date(date_str: str) -> datetime | None:
+    """Parse an RDF ``dc:date`` (ISO 8601) or RSS ``pubDate`` (RFC 822) string."""
+    date_str = date_str.strip()
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
+
+
+def _first_match(el, selectors: tuple[CSSSelector, ...]) -> list:
+    """Return the matches for the first CSS selector that finds anything."""
+    for selector in selectors:
+        found = selector(el)
+        if found:
+            return found
+    return []
+
+
 class CraigslistScraper(BaseScraper):
     """Monitors Craigslist for rafting gear deals.
 
@@ -102,23 +202,54 @@ class CraigslistScraper(BaseScraper):
     def __init__(self):
         super().__init__()
         self._seen_urls: set[str] = set()
+        self._seen_lock = threading.Lock()
+        self._max_concurrency = 4  # in-flight requests across all regions
+        self._semaphore: asyncio.Semaphore | None = None
 
     @property
     def name(self) -> str:
         return "craigslist"
 
-    def _get_client(self) -> httpx.Client:
-        """Create a new HTTP client with a random User-Agent."""
-        return httpx.Client(
+    def _get_client(self) -> httpx.AsyncClient:
+        """Create the async HTTP client shared by every search in a run.
+
+        One client keeps connections pooled across regions; it is created
+        per run because its pool is tied to the event loop that opened it.
+        The User-Agent rotates per request via ``_request_headers()``.
+        """
+        return httpx.AsyncClient(
             timeout=settings.request_timeout,
             headers={
-                "User-Agent": random.choice(USER_AGENTS),
                 "Accept": "application/rss+xml, application/xml, text/xml, text/html",
                 "Accept-Language": "en-US,en;q=0.9",
             },
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrency * 2,
+                max_keepalive_connections=self._max_concurrency,
+            ),
         )
 
+    @staticmethod
+    def _request_headers() -> dict[str, str]:
+        """Per-request headers carrying a freshly rotated User-Agent."""
+        return {"User-Agent": random.choice(USER_AGENTS)}
+
+    def _classify(self, title: str, description: str = "") -> str | None:
+        """Filter and categorize a listing in one keyword scan.
+
+        Args:
+            title: Listing title.
+            description: Listing description body.
+
+        Returns:
+            Gear category ('raft', 'kayak', 'paddle', 'pfd', 'drysuit' or
+            'other'), or None if the listing matches no rafting keyword.
+        """
+        text = f"{title} {description}".lower()
+        return best_keyword_match(_LISTING_AUTOMATON, text, None)
+
     def _categorize(self, title: str, description: str = "") -> str:
         """Categorize a listing based on title and description text.
 
@@ -132,11 +263,7 @@ class CraigslistScraper(BaseScraper):
         Returns:
             Category string: 'raft', 'kayak', 'paddle', 'pfd', 'drysuit', or 'other'.
         """
-        text = f"{title} {description}".lower()
-        for keyword, category in CATEGORY_MAP.items():
-            if keyword in text:
-                return category
-        return "other"
+        return self._classify(title, description) or "other"
 
     def _is_relevant(self, title: str, description: str = "") -> bool:
         """Check if a listing is relevant to whitewater/rafting.
@@ -148,8 +275,7 @@ class CraigslistScraper(BaseScraper):
         Returns:
             True if the listing matches any rafting keyword.
         """
-        text = f"{title} {description}".lower()
-        return any(kw in text for kw in RAFT_KEYWORDS)
+        return self._classify(title, description) is not None
 
     def _extract_price(self, text: str) -> float | None:
         """Extract price from text, handling various formats.
@@ -162,7 +288,7 @@ class CraigslistScraper(BaseScraper):
         """
         if not text:
             return None
-        match = re.search(r"\$\s*([\d,]+(?:\.\d{2})?)", text)
+        match = _PRICE_RE.search(text)
         if match:
             try:
                 return float(match.group(1).replace(",", ""))
@@ -170,18 +296,54 @@ class CraigslistScraper(BaseScraper):
                 pass
         return None
 
-    def _load_seen_urls(self) -> set[str]:
-        """Load URLs of already-scraped deals from the database to avoid duplicates."""
-        session = SessionLocal()
-        try:
-            existing = session.query(GearDeal.url).all()
-            return {row[0] for row in existing}
-        finally:
-            session.close()
+    def _drop_known(self, items: list[ScrapedItem]) -> list[ScrapedItem]:
+        """Remove items whose URL is already stored as a gear deal.
+
+        Runs after scraping, so the database only checks this run's
+        candidate URLs (an index lookup each on the unique url column)
+        rather than the whole deal history being loaded up front.
+
+        Args:
+            items: Items scraped this run, already unique by URL.
 
-    def _scrape_rss(self, region: str, category: str, query: str, client: httpx.Client) -> list[dict]:
+        Returns:
+            Items whose URLs are not yet in the database.
+        """
+        if not items:
+            return items
+        urls = [item.source_url for item in items]
+        known: set[str] = set()
+        with SessionLocal() as session:
+            for start in range(0, len(urls), _URL_BATCH_SIZE):
+                batch = urls[start:start + _URL_BATCH_SIZE]
+                stmt = select(GearDeal.url).where(GearDeal.url.in_(batch))
+                known.update(session.execute(stmt).scalars())
+        return [item for item in items if item.source_url not in known]
+
+    async def _get(self, client: httpx.AsyncClient, url: str) -> httpx.Response:
+        """GET a Craigslist URL through its subdomain's token bucket and the concurrency limit.
+
+        Each region is its own host, so regions are throttled independently
+        rather than every request waiting on one global delay.
+        """
+        bucket = self._rate_limiter(url)
+        await bucket.acquire_async()
+        if self._semaphore is None:
+            resp = await client.get(url, headers=self._request_headers())
+        else:
+            async with self._semaphore:
+                resp = await client.get(url, headers=self._request_headers())
+        bucket.update_from_headers(resp.headers)
+        return resp
+
+    async def _scrape_rss(
+        self, region: str, category: str, query: str, client: httpx.AsyncClient
+    ) -> list[ScrapedItem] | None:
         """Scrape listings from a Craigslist RSS feed.
 
+        Each new listing is filtered and converted to a ScrapedItem as soon
+        as it is parsed.
+
         Args:
             region: Craigslist region subdomain (e.g., 'seattle').
             category: CL category code (e.g., 'sga').
@@ -189,97 +351,129 @@ class CraigslistScraper(BaseScraper):
             client: HTTP client to use.
 
         Returns:
-            List of listing dicts extracted from the RSS feed.
+            Relevant items from the feed, or None if the feed failed or held
+            no new listings (the caller then falls back to HTML).
         """
-        url = f"https://{region}.craigslist.org/search/{category}?format=rss&query={quote_plus(query)}"
-        listings = []
+        url = _search_url(region, category, query, rss=True)
 
         try:
-            resp = client.get(url)
+            resp = await self._get(client, url)
             resp.raise_for_status()
-
-            # Parse RSS XML
-            root = ET.fromstring(resp.text)
-
-            # RSS 2.0 namespace handling
-            ns = {"rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#"}
-
-            # Try standard RSS items
-            items = root.findall(".//item")
-            if not items:
-                # Try RDF format (older Craigslist feeds)
-                items = root.findall(".//{http://purl.org/rss/1.0/}item")
-
-            for item in items:
-                title_el = item.find("title")
-                if title_el is None:
-                    title_el = item.find("{http://purl.org/rss/1.0/}title")
-                link_el = item.find("link")
-                if link_el is None:
-                    link_el = item.find("{http://purl.org/rss/1.0/}link")
-                desc_el = item.find("description")
-                if desc_el is None:
-                    desc_el = item.find("{http://purl.org/rss/1.0/}description")
-                date_el = item.find("dc:date", {"dc": "http://purl.org/dc/elements/1.1/"})
-                if date_el is None:
-                    date_el = item.find("pubDate")
-
-                title = title_el.text if title_el is not None and title_el.text else ""
-                link = link_el.text if link_el is not None and link_el.text else ""
-                description = desc_el.text if desc_el is not None and desc_el.text else ""
-                date_str = date_el.text if date_el is not None and date_el.text else None
-
-                if not link or link in self._seen_urls:
-                    continue
-
-                self._seen_urls.add(link)
-
-                # Clean HTML from description
-                if description:
-                    description = BeautifulSoup(description, "lxml").get_text(" ", strip=True)
-
-                # Extract price from title
-                price = self._extract_price(title) or self._extract_price(description)
-
-                # Parse date
-                posted_at = None
-                if date_str:
-                    try:
-                        from dateutil.parser import parse as parse_date
-                        posted_at = parse_date(date_str)
-                    except (ValueError, TypeError):
-                        pass
-
-                # Extract image URL from description HTML (some feeds include it)
-                image_url = None
-                if desc_el is not None and desc_el.text:
-                    img_match = re.search(r'<img[^>]+src="([^"]+)"', desc_el.text)
-                    if img_match:
-                        image_url = img_match.group(1)
-
-                listings.append({
-                    "title": title.strip(),
-                    "price": price,
-                    "url": link.strip(),
-                    "image_url": image_url,
-                    "description": description[:2000] if description else None,  # cap length
-                    "region": region,
-                    "posted_at": posted_at,
-                })
-
-        except ET.ParseError as e:
-            self.logger.warning(f"RSS parse error for {region}/{category}: {e}")
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 403:
                 self.logger.warning(f"Blocked by Craigslist for {region}/{category} — backing off")
             else:
                 self.logger.warning(f"HTTP error for {region}/{category}: {e}")
+            return None
         except httpx.HTTPError as e:
             self.logger.warning(f"Request failed for {region}/{category}: {e}")
+            return None
 
-        return listings
+        # Parse in a worker thread so other searches keep fetching meanwhile
+        return await asyncio.to_thread(self._parse_rss_feed, resp.content, region, category)
 
-    def _scrape_html_fallback(self, region: str, category: str, query: str, client: httpx.Client) -> list[dict]:
+    def _parse_rss_feed(self, content: bytes, region: str, category: str) -> list[ScrapedItem] | None:
+        """Stream-parse an RSS 2.0 or RDF feed body into ScrapedItems.
+
+        Args:
+            content: Raw feed bytes.
+            region: Craigslist region subdomain.
+            category: CL category code (for log messages).
+
+        Returns:
+            Relevant items, or None if the feed held no new listings.
+        """
+        items: list[ScrapedItem] = []
+        found = False
+        now = datetime.now(timezone.utc)  # one timestamp for the whole feed
+
+        try:
+            context = etree.iterparse(
+                io.BytesIO(content),
+                events=("end",),
+                tag=("item", RSS1_ITEM),
+                resolve_entities=False,
+                # Salvage items around malformed markup; comments and
+                # processing instructions are never needed
+                recover=True,
+                remove_comments=True,
+                remove_pis=True,
+            )
+            for _, item in context:
+                listing = self._parse_rss_item(item, region)
+                if listing:
+                    found = True
+                    scraped = self._to_item(listing, now)
+                    if scraped is not None:
+                        items.append(scraped)
+
+                # Free the parsed item and any siblings already handled
+                item.clear(keep_tail=True)
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+
+            if context.error_log:
+                self.logger.warning(
+                    f"Recovered malformed RSS for {region}/{category} "
+                    f"({len(context.error_log)} errors): {context.error_log.last_error}"
+                )
+
+        except etree.XMLSyntaxError as e:
+            # Items parsed before the error are kept
+            self.logger.warning(f"RSS parse error for {region}/{category}: {e}")
+
+        return items if found else None
+
+    def _parse_rss_item(self, item, region: str) -> dict | None:
+        """Extract one listing from an RSS 2.0 or RDF ``<item>`` element.
+
+        Returns:
+            Listing dict, or None if the item has no link or was already seen.
+        """
+        fields = {}
+        for child in item:
+            name = _RSS_ITEM_FIELDS.get(child.tag)
+            if name is not None and name not in fields:
+                fields[name] = child.text or ""
+
+        title = fields.get("title", "")
+        link = fields.get("link", "")
+        description = fields.get("description", "")
+        date_str = fields.get("date")
+
+        if not link or not self._claim_url(link):
+            return None
+
+        # Extract image URL from description HTML (some feeds include it)
+        image_url = None
+        if description:
+            img_match = _IMG_RE.search(description)
+            if img_match:
+                image_url = img_match.group(1)
+
+            # Clean HTML from description
+            description = element_text(
+                lxml.html.fragment_fromstring(description, create_parent=True), " "
+            )
+
+        # Extract price from title
+        price = self._extract_price(title) or self._extract_price(description)
+
+        posted_at = _parse_date(date_str) if date_str else None
+
+        return {
+            "title": title.strip(),
+            "price": price,
+            "url": link.strip(),
+            "image_url": image_url,
+            "description": description[:2000] if description else None,  # cap length
+            "region": region,
+            "posted_at": posted_at,
+        }
+
+    async def _scrape_html_fallback(
+        self, region: str, category: str, query: str, client: httpx.AsyncClient
+    ) -> list[ScrapedItem]:
         """HTML fallback when RSS is unavailable.
 
         Scrapes the Craigslist search results HTML page directly.
@@ -292,23 +486,43 @@ class CraigslistScraper(BaseScraper):
             client: HTTP client to use.
 
         Returns:
-            List of listing dicts.
+            List of relevant ScrapedItem objects.
         """
-        url = f"https://{region}.craigslist.org/search/{category}?query={quote_plus(query)}"
-        listings = []
+        url = _search_url(region, category, query)
 
         try:
-            resp = client.get(url)
+            resp = await self._get(client, url)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "lxml")
+        except httpx.HTTPError as e:
+            self.logger.warning(f"HTML scrape failed for {region}/{category}: {e}")
+            return []
+
+        return await asyncio.to_thread(self._parse_html_page, resp.text, region, category)
+
+    def _parse_html_page(self, html: str, region: str, category: str) -> list[ScrapedItem]:
+        """Parse a Craigslist search results page into ScrapedItems.
+
+        Args:
+            html: Decoded page body.
+            region: Craigslist region subdomain.
+            category: CL category code (for log messages).
+
+        Returns:
+            List of relevant ScrapedItem objects.
+        """
+        items: list[ScrapedItem] = []
+        now = datetime.now(timezone.utc)  # one timestamp for the whole page
+
+        try:
+            doc = lxml.html.fromstring(html)
 
             # Craigslist result rows
-            result_rows = soup.select("li.cl-static-search-result") or soup.select("li.result-row")
+            result_rows = _first_match(doc, _RESULT_ROW_SELECTORS)
 
             for row in result_rows:
                 # Modern CL layout
-                link_el = row.find("a")
-                if not link_el:
+                link_el = next(row.iter("a"), None)
+                if link_el is None:
                     continue
 
                 href = link_el.get("href", "")
@@ -319,15 +533,14 @@ class CraigslistScraper(BaseScraper):
                 if href.startswith("/"):
                     href = f"https://{region}.craigslist.org{href}"
 
-                if href in self._seen_urls:
+                if not self._claim_url(href):
                     continue
-                self._seen_urls.add(href)
 
-                title = link_el.get_text(strip=True)
-                price_el = row.find("span", class_="priceinfo") or row.find("span", class_="result-price")
-                price = self._extract_price(price_el.get_text(strip=True)) if price_el else None
+                title = element_text(link_el)
+                price_els = _first_match(row, _PRICE_SELECTORS)
+                price = self._extract_price(element_text(price_els[0])) if price_els else None
 
-                listings.append({
+                scraped = self._to_item({
                     "title": title,
                     "price": price,
                     "url": href,
@@ -335,20 +548,83 @@ class CraigslistScraper(BaseScraper):
                     "description": None,
                     "region": region,
                     "posted_at": None,
-                })
+                }, now)
+                if scraped is not None:
+                    items.append(scraped)
 
-        except httpx.HTTPError as e:
-            self.logger.warning(f"HTML scrape failed for {region}/{category}: {e}")
+        except ParserError as e:
+            self.logger.warning(f"HTML parse error for {region}/{category}: {e}")
+
+        return items
 
-        return listings
+    def _claim_url(self, url: str) -> bool:
+        """Record ``url`` as seen this run; False if it already was.
+
+        Locked because feeds are parsed on worker threads concurrently.
+        """
+        with self._seen_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+
+    def _to_item(self, listing: dict, scraped_at: datetime) -> ScrapedItem | None:
+        """Classify a parsed listing and wrap it as a ScrapedItem.
+
+        The listing dict itself becomes the item's data, gaining a
+        ``category`` key, so no per-listing copy is made.
+
+        Args:
+            listing: Listing dict from the RSS or HTML parser.
+            scraped_at: Timestamp shared by every item from one response.
+
+        Returns:
+            ScrapedItem, or None if the listing is not rafting-related.
+        """
+        category_name = self._classify(listing["title"], listing["description"] or "")
+        if category_name is None:
+            return None
+        listing["category"] = category_name
+        return ScrapedItem(
+            source="craigslist",
+            source_url=listing["url"],
+            data=listing,
+            scraped_at=scraped_at,
+        )
+
+    async def _scrape_search(
+        self, region: str, category: str, query: str, client: httpx.AsyncClient
+    ) -> list[ScrapedItem]:
+        """Run one region/category/query search and return relevant items.
+
+        Tries RSS first and falls back to HTML if the feed gave nothing.
+        """
+        items = await self._scrape_rss(region, category, query, client)
+
+        # Fall back to HTML if RSS returned nothing
+        if items is None:
+            items = await self._scrape_html_fallback(region, category, query, client)
+
+        return items
 
     def scrape(self) -> list[ScrapedItem]:
         """Run the Craigslist gear deal scraper.
 
-        Iterates over configured regions and search categories, fetching
-        listings via RSS feeds (with HTML fallback). Deduplicates against
-        previously scraped URLs, filters for relevance, and classifies
-        each listing by gear category.
+        Synchronous entry point; see :meth:`scrape_async`.
+
+        Returns:
+            List of ScrapedItem objects representing gear deals.
+        """
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self) -> list[ScrapedItem]:
+        """Search every region, category and query group concurrently.
+
+        Fetches listings via RSS feeds (with HTML fallback), at most
+        ``_max_concurrency`` requests in flight over one shared client, each
+        region throttled by its own token bucket.
+        Filters for relevance, classifies each listing by gear category,
+        then drops listings whose URLs are already stored.
 
         Returns:
             List of ScrapedItem objects representing gear deals.
@@ -356,73 +632,34 @@ class CraigslistScraper(BaseScraper):
         self.log_start()
         items: list[ScrapedItem] = []
 
-        # Pre-load known URLs to skip duplicates
-        self._seen_urls = self._load_seen_urls()
-        self.logger.info(f"Loaded {len(self._seen_urls)} existing deal URLs for dedup")
+        regions = settings.craigslist_regions
+        # URLs seen this run; known deals are dropped after scraping
+        self._seen_urls = set()
 
-        # Group search terms into compound queries to reduce request count
-        search_groups = [
-            "raft OR kayak OR canoe OR whitewater",
-            "paddle OR oar OR PFD OR life jacket",
-            "drysuit OR wetsuit OR NRS OR throw bag",
-            "AIRE OR Hyside OR Maravia OR SOTAR",
-        ]
+        searches = list(product(regions, CL_CATEGORIES, SEARCH_GROUPS))
+        # Created per run: asyncio primitives bind to the running event loop.
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
-        for region in settings.craigslist_regions:
-            client = self._get_client()
-            region_count = 0
+        async with self._get_client() as client:
+            results = await asyncio.gather(
+                *(self._scrape_search(region, cat, query, client) for region, cat, query in searches),
+                return_exceptions=True,
+            )
 
-            try:
-                self.logger.info(f"Scanning Craigslist {region}...")
-
-                for cl_category in CL_CATEGORIES:
-                    for query in search_groups:
-                        # Try RSS first
-                        raw_listings = self._scrape_rss(region, cl_category, query, client)
-
-                        # Fall back to HTML if RSS returned nothing
-                        if not raw_listings:
-                            raw_listings = self._scrape_html_fallback(region, cl_category, query, client)
-
-                        # Filter and convert to ScrapedItems
-                        for listing in raw_listings:
-                            title = listing.get("title", "")
-                            desc = listing.get("description", "") or ""
-
-                            if not self._is_relevant(title, desc):
-                                continue
-
-                            category = self._categorize(title, desc)
-
-                            items.append(
-                                ScrapedItem(
-                                    source="craigslist",
-                                    source_url=listing["url"],
-                                    data={
-                                        "title": title,
-                                        "price": listing.get("price"),
-                                        "url": listing["url"],
-                                        "image_url": listing.get("image_url"),
-                                        "description": desc or None,
-                                        "category": category,
-                                        "region": region,
-                                        "posted_at": listing.get("posted_at"),
-                                    },
-                                    scraped_at=datetime.now(timezone.utc),
-                                )
-                            )
-                            region_count += 1
-
-                        # Rate limiting: random delay between requests
-                        delay = settings.rate_limit_delay + random.uniform(0.5, 2.0)
-                        time.sleep(delay)
-
-                self.logger.info(f"Craigslist {region}: {region_count} relevant listings")
-
-            except Exception as e:
-                self.log_error(e)
-            finally:
-                client.close()
+        for result in results:
+            if isinstance(result, BaseException):
+                self.log_error(result)
+                continue
+            items.extend(result)
+
+        scraped = len(items)
+        items = self._drop_known(items)
+        self.logger.info(f"Skipped {scraped - len(items)} already-known deal URLs")
+
+        region_counts = Counter(item.data["region"] for item in items)
+
+        for region in regions:
+            self.logger.info(f"Craigslist {region}: {region_counts[region]} relevant listings")
 
         self.log_complete(len(items))
         return items
@@ -14,17 +14,24 @@ Data extracted:
 Source priority: 30 (per BD-002 — lowest priority)
 """
 
+import asyncio
 import logging
 import re
 import time
 import uuid
 from datetime import datetime, timezone, timedelta
+from itertools import islice
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
 
 from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.keywords import best_keyword_match, keyword_automaton, whole_word_matches
+from scrapers.markup import element_text
 from config.settings import settings
 from models import SessionLocal, River
 
@@ -32,23 +39,64 @@ logger = logging.getLogger("pipeline.scrapers.facebook")
 
 # ─── Constants ──────────────────────────────────────────
 
-# Regex patterns for extracting flow information from post text
+# Regex patterns for extracting flow information from post text. All metric
+# and relative-time patterns are matched against lowercased text, so they use
+# lowercase literals and skip the engine's case folding.
 FLOW_RATE_PATTERNS = [
-    re.compile(r"(\d[\d,]*)\s*(?:cfs|cubic\s+feet)", re.IGNORECASE),
-    re.compile(r"flow[:\s]+(\d[\d,]*)", re.IGNORECASE),
-    re.compile(r"(\d[\d,]*)\s*(?:ft³/s)", re.IGNORECASE),
+    re.compile(r"(\d[\d,]*)\s*(?:cfs|cubic\s+feet)"),
+    re.compile(r"flow[:\s]+(\d[\d,]*)"),
+    re.compile(r"(\d[\d,]*)\s*(?:ft³/s)"),
 ]
 
 GAUGE_HEIGHT_PATTERNS = [
-    re.compile(r"(\d+\.?\d*)\s*(?:feet|ft|foot)\s*(?:gauge|gage|stage)", re.IGNORECASE),
-    re.compile(r"(?:gauge|gage|stage)[:\s]+(\d+\.?\d*)\s*(?:feet|ft|foot)?", re.IGNORECASE),
+    re.compile(r"(\d+\.?\d*)\s*(?:feet|ft|foot)\s*(?:gauge|gage|stage)"),
+    re.compile(r"(?:gauge|gage|stage)[:\s]+(\d+\.?\d*)\s*(?:feet|ft|foot)?"),
 ]
 
 WATER_TEMP_PATTERNS = [
-    re.compile(r"water\s*temp[:\s]+(\d+\.?\d*)\s*[°]?[fF]", re.IGNORECASE),
-    re.compile(r"(\d+\.?\d*)\s*[°]?[fF]\s*water", re.IGNORECASE),
+    re.compile(r"water\s*temp[:\s]+(\d+\.?\d*)\s*[°]?f"),
+    re.compile(r"(\d+\.?\d*)\s*[°]?f\s*water"),
 ]
 
+# Every metric pattern above contains one of these (lowercase) literals, so
+# a post without any of them cannot match and skips the metric scan.
+_METRIC_HINT_TOKENS = ("cfs", "flow", "gauge", "gage", "stage", "temp", "water", "cubic", "ft³")
+
+# Every metric pattern fused into one alternation so a post is scanned once.
+# Each pattern's capture group becomes a named group "<field>_<priority>";
+# within a field, earlier patterns still win, as with the lists above.
+_METRIC_PATTERNS = {
+    "flow_rate": FLOW_RATE_PATTERNS,
+    "gauge_height": GAUGE_HEIGHT_PATTERNS,
+    "water_temp": WATER_TEMP_PATTERNS,
+}
+_METRICS_RE = re.compile(
+    "|".join(
+        re.sub(r"\((?!\?)", f"(?P<{field}_{priority}>", pattern.pattern, count=1)
+        for field, patterns in _METRIC_PATTERNS.items()
+        for priority, pattern in enumerate(patterns)
+    )
+)
+
+# Mobile page post layout. Articles are the fallback layout, used only when
+# no data-ft post divs are present.
+_POST_SELECTOR = CSSSelector("div[data-ft]")
+_ARTICLE_SELECTOR = CSSSelector("article")
+_POST_TEXT_SELECTOR = CSSSelector('div[class*="story"], div[class*="userContent"]')
+_PARAGRAPH_SELECTOR = CSSSelector("p")
+_IMG_SELECTOR = CSSSelector("img[src]")
+_LINK_SELECTOR = CSSSelector("a[href]")
+_AUTHOR_SELECTORS = (CSSSelector("strong"), CSSSelector("h3"))
+_PERMALINK_SELECTOR = CSSSelector('a[href*="/story.php"], a[href*="/permalink"]')
+# Emoji/static-asset images and links back into Facebook are not kept
+_IMG_REJECT = re.compile(r"emoji|static")
+_LINK_REJECT = re.compile(r"facebook\.com")
+# Images and links stored per item
+_MAX_MEDIA = 5
+# Characters of a post scanned for rivers and conditions; the stored text is
+# capped at 1000, so this leaves headroom while bounding pasted reports
+_SCAN_LIMIT = 2000
+
 # Condition quality keywords
 CONDITION_KEYWORDS = {
     "excellent": ["excellent", "perfect", "prime", "ideal", "outstanding", "amazing"],
@@ -58,14 +106,35 @@ CONDITION_KEYWORDS = {
     "dangerous": ["dangerous", "flood", "deadly", "extreme", "closed", "hazardous", "unsafe"],
 }
 
+# All quality keywords in one automaton; earlier CONDITION_KEYWORDS
+# categories take precedence when several match
+_QUALITY_AUTOMATON = keyword_automaton(
+    (keyword, (priority, quality))
+    for priority, (quality, keywords) in enumerate(CONDITION_KEYWORDS.items())
+    for keyword in keywords
+)
+
 # Relative time patterns for date parsing
 RELATIVE_TIME_PATTERNS = [
-    (re.compile(r"(\d+)\s*min(?:ute)?s?\s*ago", re.IGNORECASE), "minutes"),
-    (re.compile(r"(\d+)\s*hours?\s*ago", re.IGNORECASE), "hours"),
-    (re.compile(r"(\d+)\s*days?\s*ago", re.IGNORECASE), "days"),
-    (re.compile(r"yesterday", re.IGNORECASE), "yesterday"),
+    (re.compile(r"(\d+)\s*min(?:ute)?s?\s*ago"), "minutes"),
+    (re.compile(r"(\d+)\s*hours?\s*ago"), "hours"),
+    (re.compile(r"(\d+)\s*days?\s*ago"), "days"),
+    (re.compile(r"yesterday"), "yesterday"),
 ]
 
+# The patterns above fused into one search. Each is wrapped in a group named
+# after its unit; the count, when there is one, is the group right after it.
+_REL_RE = re.compile(
+    "|".join(f"(?P<{unit}>{pattern.pattern})" for pattern, unit in RELATIVE_TIME_PATTERNS)
+)
+
+# UTC offsets Graph API timestamps may carry. With one of these after the
+# seconds, "YYYY-MM-DDTHH:MM:SS" prefixes order the same as the instants.
+_UTC_SUFFIXES = frozenset(("+0000", "+00:00", "Z"))
+
+# CamelCase hashtag split point: "#ColoradoRiver" -> "Colorado River"
+_HASHTAG_SPLIT_RE = re.compile(r"#([A-Z][a-z]+)([A-Z])")
+
 # Default Facebook pages/groups for whitewater communities
 DEFAULT_PAGES = [
     "americanwhitewater",
@@ -73,6 +142,12 @@ DEFAULT_PAGES = [
 ]
 
 
+def _first(el, selector: CSSSelector):
+    """Return the first element ``selector`` matches under ``el``, or None."""
+    found = selector(el)
+    return found[0] if found else None
+
+
 class FacebookScraper(BaseScraper):
     """Scrapes public Facebook pages/groups for river condition reports.
 
@@ -81,10 +156,29 @@ class FacebookScraper(BaseScraper):
     Falls back gracefully when auth token is not available.
     """
 
+    # Shared across instances: the scheduler builds a fresh scraper per
+    # cycle, but the rivers table changes on the order of hours to days.
+    _river_cache_entry: tuple[float, list[dict]] | None = None
+    _river_automaton = None
+    _river_automaton_source: list[dict] | None = None
+
     def __init__(self):
         super().__init__()
         self._access_token = settings.facebook_access_token
-        self._client = httpx.Client(
+        self._client = self._make_client()
+        self._rate_limit_delay = settings.rate_limit_delay
+        self._max_concurrency = 4  # pages fetched at once
+        self._semaphore: asyncio.Semaphore | None = None
+        self._river_cache_ttl = settings.river_cache_ttl_seconds
+        self._scrape_window_hours = 48  # Only process posts from last 48 hours
+
+    @property
+    def name(self) -> str:
+        return "facebook"
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP/2 client shared by every page fetch in a cycle."""
+        return httpx.AsyncClient(
             timeout=settings.request_timeout,
             headers={
                 "User-Agent": "Mozilla/5.0 (Linux; Android 13) AppleWebKit/537.36 "
@@ -93,19 +187,41 @@ class FacebookScraper(BaseScraper):
                 "Accept-Language": "en-US,en;q=0.5",
             },
             follow_redirects=True,
+            # http2/limits must go on the transport when one is passed explicitly
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+                retries=2,
+            ),
         )
-        self._rate_limit_delay = settings.rate_limit_delay
-        self._river_cache: list[dict] | None = None
-        self._scrape_window_hours = 48  # Only process posts from last 48 hours
+
+    async def aclose(self) -> None:
+        """Release pooled connections; the next scrape() opens a fresh client."""
+        await self._client.aclose()
 
     @property
-    def name(self) -> str:
-        return "facebook"
+    def _river_cache(self) -> list[dict] | None:
+        """Tracked rivers loaded within the last TTL, or None once stale."""
+        entry = FacebookScraper._river_cache_entry
+        if entry is None or time.monotonic() - entry[0] >= self._river_cache_ttl:
+            return None
+        return entry[1]
+
+    @_river_cache.setter
+    def _river_cache(self, rivers: list[dict] | None) -> None:
+        FacebookScraper._river_cache_entry = (
+            None if rivers is None else (time.monotonic(), rivers)
+        )
 
     def _get_tracked_rivers(self) -> list[dict]:
-        """Get tracked rivers from the database, cached per scrape cycle."""
-        if self._river_cache is not None:
-            return self._river_cache
+        """Get tracked rivers from the database, cached across cycles for the TTL."""
+        cached = self._river_cache
+        if cached is not None:
+            return cached
 
         session = SessionLocal()
         try:
@@ -123,51 +239,97 @@ class FacebookScraper(BaseScraper):
         finally:
             session.close()
 
+    def _get_river_automaton(self, rivers: list[dict]):
+        """Return an automaton over the lowercase names of ``rivers``.
+
+        Rebuilt only when the river list itself changes, so every post
+        across cycles is matched against all rivers in one linear pass. Values
+        are ``(name_lower, [rivers with that name])``; names are not unique
+        across states.
+        """
+        if self._river_automaton_source is not rivers:
+            by_name: dict[str, list[dict]] = {}
+            for river in rivers:
+                name_lower = river["name"].lower()
+                if name_lower:
+                    by_name.setdefault(name_lower, []).append(river)
+            FacebookScraper._river_automaton = keyword_automaton(
+                (name, (name, matches)) for name, matches in by_name.items()
+            ) if by_name else None
+            FacebookScraper._river_automaton_source = rivers
+        return self._river_automaton
+
     def scrape(self) -> list[ScrapedItem]:
         """Run the Facebook scraper and return condition items.
 
+        Synchronous entry point; see :meth:`scrape_async`.
+        """
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self) -> list[ScrapedItem]:
+        """Fetch every configured page concurrently and return condition items.
+
         Attempts Graph API if token is available, falls back to
         public page scraping. Returns empty list on total failure.
         """
         self.log_start()
         items: list[ScrapedItem] = []
+        if self._client.is_closed:
+            self._client = self._make_client()
+        # Created per run: asyncio primitives bind to the running event loop.
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
         try:
             if self._access_token:
-                items = self._scrape_graph_api()
+                items = await self._scrape_graph_api()
             else:
                 logger.warning(
                     "No Facebook access token configured. "
                     "Attempting public page scraping (limited data)."
                 )
-                items = self._scrape_public_pages()
+                items = await self._scrape_public_pages()
         except Exception as e:
             self.log_error(e)
             return []
-
-        # Reset river cache for next cycle
-        self._river_cache = None
+        finally:
+            await self.aclose()
 
         self.log_complete(len(items))
         return items
 
-    def _scrape_graph_api(self) -> list[ScrapedItem]:
-        """Scrape Facebook pages/groups via the Graph API."""
-        items: list[ScrapedItem] = []
-        pages = settings.facebook_pages if hasattr(settings, "facebook_pages") else DEFAULT_PAGES
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET through the host's token bucket and the page concurrency limit."""
+        bucket = self._rate_limiter(url)
+        await bucket.acquire_async()
+        if self._semaphore is None:
+            resp = await self._client.get(url, **kwargs)
+        else:
+            async with self._semaphore:
+                resp = await self._client.get(url, **kwargs)
+        bucket.update_from_headers(resp.headers)
+        return resp
 
-        for page_id in pages:
-            try:
-                page_items = self._fetch_page_posts_api(page_id)
-                items.extend(page_items)
-                time.sleep(self._rate_limit_delay)
-            except Exception as e:
-                logger.error(f"Failed to scrape Facebook page {page_id}: {e}")
-                continue
+    async def _gather_pages(self, fetch, pages: list[str], label: str) -> list[ScrapedItem]:
+        """Run ``fetch(page_id)`` for every page concurrently and merge the items.
 
+        A page that raises is logged and skipped; the other pages' items
+        are kept.
+        """
+        items: list[ScrapedItem] = []
+        results = await asyncio.gather(*(fetch(page_id) for page_id in pages), return_exceptions=True)
+        for page_id, result in zip(pages, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to scrape {label} {page_id}: {result}")
+                continue
+            items.extend(result)
         return items
 
-    def _fetch_page_posts_api(self, page_id: str) -> list[ScrapedItem]:
+    async def _scrape_graph_api(self) -> list[ScrapedItem]:
+        """Scrape Facebook pages/groups via the Graph API."""
+        pages = settings.facebook_pages if hasattr(settings, "facebook_pages") else DEFAULT_PAGES
+        return await self._gather_pages(self._fetch_page_posts_api, pages, "Facebook page")
+
+    async def _fetch_page_posts_api(self, page_id: str) -> list[ScrapedItem]:
         """Fetch posts from a Facebook page via Graph API."""
         url = f"https://graph.facebook.com/v19.0/{page_id}/posts"
         params = {
@@ -177,7 +339,7 @@ class FacebookScraper(BaseScraper):
         }
 
         try:
-            response = self._client.get(url, params=params)
+            response = await self._get(url, params=params)
 
             if response.status_code == 401:
                 logger.error(f"Facebook API: expired token for page {page_id}")
@@ -187,15 +349,15 @@ class FacebookScraper(BaseScraper):
                 return []
             if response.status_code == 429:
                 logger.warning(f"Facebook API: rate limited on page {page_id}")
-                self._handle_rate_limit(response)
+                await self._handle_rate_limit(response)
                 return []
 
             response.raise_for_status()
 
             # Check for rate limit headers
-            self._check_usage_headers(response)
+            await self._check_usage_headers(response)
 
-            data = response.json()
+            data = orjson.loads(response.content)
             posts = data.get("data", [])
             return self._parse_posts(posts, page_id)
 
@@ -209,36 +371,26 @@ class FacebookScraper(BaseScraper):
             logger.error(f"Facebook API unexpected error for page {page_id}: {e}")
             return []
 
-    def _scrape_public_pages(self) -> list[ScrapedItem]:
+    async def _scrape_public_pages(self) -> list[ScrapedItem]:
         """Scrape public Facebook pages via mobile site (no auth required)."""
-        items: list[ScrapedItem] = []
-        pages = DEFAULT_PAGES
-
-        for page_id in pages:
-            try:
-                page_items = self._fetch_page_public(page_id)
-                items.extend(page_items)
-                time.sleep(self._rate_limit_delay)
-            except Exception as e:
-                logger.error(f"Failed to scrape public Facebook page {page_id}: {e}")
-                continue
+        return await self._gather_pages(self._fetch_page_public, DEFAULT_PAGES, "public Facebook page")
 
-        return items
-
-    def _fetch_page_public(self, page_id: str) -> list[ScrapedItem]:
+    async def _fetch_page_public(self, page_id: str) -> list[ScrapedItem]:
         """Fetch posts from a public Facebook page via mobile site."""
         url = f"https://m.facebook.com/{page_id}"
 
         try:
-            response = self._client.get(url)
+            response = await self._get(url)
             if response.status_code == 404:
                 logger.warning(f"Facebook page not found: {page_id}")
                 return []
 
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            posts = self._extract_posts_from_html(soup, page_id)
+            doc = self._parse_post_html(response.text)
+            if doc is None:
+                return []
+            posts = self._extract_posts_from_html(doc, page_id)
             return posts
 
         except httpx.TimeoutException:
@@ -251,52 +403,70 @@ class FacebookScraper(BaseScraper):
             logger.error(f"Error parsing Facebook page {page_id}: {e}")
             return []
 
-    def _extract_posts_from_html(self, soup: BeautifulSoup, page_id: str) -> list[ScrapedItem]:
-        """Extract posts from parsed HTML of a Facebook page."""
+    @staticmethod
+    def _parse_post_html(html: str):
+        """Parse a mobile page with lxml; None if the body is empty.
+
+        Takes the decoded ``response.text`` so the charset from the
+        Content-Type header is honoured; raw bytes without a ``<meta
+        charset>`` would be read as latin-1 by lxml.
+        """
+        try:
+            return lxml.html.fromstring(html)
+        except ParserError:
+            return None
+
+    def _extract_posts_from_html(self, doc, page_id: str) -> list[ScrapedItem]:
+        """Extract posts from the parsed lxml tree of a Facebook page."""
         items: list[ScrapedItem] = []
 
         # Facebook mobile site uses various div structures for posts
-        post_divs = soup.find_all("div", {"data-ft": True}) or soup.find_all(
-            "article"
-        )
+        post_divs = _POST_SELECTOR(doc) or _ARTICLE_SELECTOR(doc)
 
         for post_div in post_divs:
             try:
                 # Extract text content
-                text_elem = post_div.find("div", class_=re.compile(r".*story.*|.*userContent.*"))
+                text_elem = _first(post_div, _POST_TEXT_SELECTOR)
                 if text_elem is None:
                     # Try broader text extraction
-                    text_elem = post_div.find("p")
+                    text_elem = _first(post_div, _PARAGRAPH_SELECTOR)
 
                 text = ""
-                if text_elem:
-                    text = text_elem.get_text(strip=True)
+                if text_elem is not None:
+                    text = element_text(text_elem)
 
                 if not text:
                     continue
 
-                # Extract images
-                images = []
-                for img in post_div.find_all("img"):
-                    src = img.get("src", "")
-                    if src and "emoji" not in src and "static" not in src:
-                        images.append(src)
-
-                # Extract links
-                links = []
-                for a in post_div.find_all("a", href=True):
-                    href = a["href"]
-                    if href.startswith("http") and "facebook.com" not in href:
-                        links.append(href)
+                # Extract images and links; only the first few are kept
+                images = list(islice(
+                    (
+                        src for img in _IMG_SELECTOR(post_div)
+                        if (src := img.get("src")) and not _IMG_REJECT.search(src)
+                    ),
+                    _MAX_MEDIA,
+                ))
+                links = list(islice(
+                    (
+                        href for a in _LINK_SELECTOR(post_div)
+                        if (href := a.get("href")).startswith("http")
+                        and not _LINK_REJECT.search(href)
+                    ),
+                    _MAX_MEDIA,
+                ))
 
                 # Extract author
-                author_elem = post_div.find("strong") or post_div.find("h3")
-                author = author_elem.get_text(strip=True) if author_elem else page_id
+                author_elem = None
+                for selector in _AUTHOR_SELECTORS:
+                    author_elem = _first(post_div, selector)
+                    if author_elem is not None:
+                        break
+                author = element_text(author_elem) if author_elem is not None else page_id
 
                 # Build source URL
-                post_link = post_div.find("a", href=re.compile(r"/story\.php|/permalink"))
+                post_link = _first(post_div, _PERMALINK_SELECTOR)
                 source_url = f"https://www.facebook.com/{page_id}"
-                if post_link:
+                if post_link is not None:
                     href = post_link.get("href", "")
                     if href.startswith("/"):
                         source_url = f"https://m.facebook.com{href}"
@@ -323,15 +493,26 @@ class FacebookScraper(BaseScraper):
         items: list[ScrapedItem] = []
         now = datetime.now(timezone.utc)
         threshold = now - timedelta(hours=self._scrape_window_hours)
+        threshold_key = threshold.strftime("%Y-%m-%dT%H:%M:%S")
 
         for post in posts:
             try:
+                # Cheap string check for out-of-window UTC posts; anything
+                # else falls through to the full timestamp parse below
+                created = post.get("created_time")
+                if (
+                    isinstance(created, str)
+                    and created[19:] in _UTC_SUFFIXES
+                    and created[:19] < threshold_key
+                ):
+                    continue
+
                 message = post.get("message", "")
                 if not message:
                     continue
 
                 # Parse timestamp
-                timestamp = self._parse_timestamp(post.get("created_time"))
+                timestamp = self._parse_timestamp(created)
                 if timestamp and timestamp < threshold:
                     continue
 
@@ -378,48 +559,50 @@ class FacebookScraper(BaseScraper):
         rivers = self._get_tracked_rivers()
         if not rivers:
             return []
+        automaton = self._get_river_automaton(rivers)
+        if automaton is None:
+            return []
 
         items: list[ScrapedItem] = []
-        text_lower = text.lower()
+        # Matching and classification only look at the head of long posts
+        scan_text = text[:_SCAN_LIMIT]
+        text_lower = scan_text.lower()
 
         # Also handle hashtag mentions like #ColoradoRiver
         # Convert hashtags to spaces for matching: "#ColoradoRiver" -> "Colorado River"
-        text_for_matching = re.sub(
-            r"#([A-Z][a-z]+)([A-Z])",
-            lambda m: m.group(1) + " " + m.group(2),
-            text,
-        )
-        text_for_matching_lower = text_for_matching.lower()
+        if "#" in scan_text:
+            text_for_matching_lower = _HASHTAG_SPLIT_RE.sub(r"\1 \2", scan_text).lower()
+        else:
+            text_for_matching_lower = text_lower
 
         matched_river_ids: set[str] = set()
-
-        for river in rivers:
-            river_name = river["name"]
-            river_name_lower = river_name.lower()
-
-            # Exact river name match (case-insensitive, word boundary)
-            pattern = re.compile(
-                r"\b" + re.escape(river_name_lower) + r"\b",
-                re.IGNORECASE,
-            )
-
-            if pattern.search(text_lower) or pattern.search(text_for_matching_lower):
-                if river["id"] not in matched_river_ids:
+        # Per-post work, done once on the first match rather than per river
+        condition_data: dict[str, Any] | None = None
+        scraped_at = timestamp
+
+        # The hashtag pass only differs when the post has CamelCase hashtags
+        for text_variant in dict.fromkeys((text_lower, text_for_matching_lower)):
+            # Whole-word matches only, like r"\bname\b"
+            for matches in whole_word_matches(automaton, text_variant):
+                for river in matches:
+                    if river["id"] in matched_river_ids:
+                        continue
                     matched_river_ids.add(river["id"])
 
-                    condition_data = self._classify_condition(text)
-                    scraped_at = timestamp or datetime.now(timezone.utc)
+                    if condition_data is None:
+                        condition_data = self._classify_condition(scan_text, text_lower)
+                        scraped_at = timestamp or datetime.now(timezone.utc)
 
                     item = ScrapedItem(
                         source="facebook",
                         source_url=source_url,
                         data={
                             "river_id": river["id"],
-                            "river_name": river_name,
+                            "river_name": river["name"],
                             "post_text": text[:1000],  # Truncate very long posts
                             "author": author,
-                            "images": images[:5],  # Limit images
-                            "links": links[:5],
+                            "images": images[:_MAX_MEDIA],
+                            "links": links[:_MAX_MEDIA],
                             **condition_data,
                         },
                         scraped_at=scraped_at,
@@ -428,55 +611,43 @@ class FacebookScraper(BaseScraper):
 
         return items
 
-    def _classify_condition(self, text: str) -> dict[str, Any]:
+    def _classify_condition(self, text: str, text_lower: str | None = None) -> dict[str, Any]:
         """Extract condition data from post text.
 
         Parses flow rates, gauge heights, water temps, and quality
         assessments from natural language post text using regex.
 
+        Args:
+            text: The post text.
+            text_lower: ``text.lower()``, if the caller already has it.
+
         Returns dict with available condition fields.
         """
         result: dict[str, Any] = {}
-        text_lower = text.lower()
-
-        # Extract flow rate
-        for pattern in FLOW_RATE_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                try:
-                    result["flow_rate"] = float(match.group(1).replace(",", ""))
-                except (ValueError, IndexError):
-                    pass
-                break
-
-        # Extract gauge height
-        for pattern in GAUGE_HEIGHT_PATTERNS:
-            match = pattern.search(text)
-            if match:
+        if text_lower is None:
+            text_lower = text.lower()
+
+        # Extract flow rate, gauge height and water temperature in one scan,
+        # keeping each field's highest-priority match
+        best: dict[str, tuple[int, str]] = {}
+        has_hint = any(token in text_lower for token in _METRIC_HINT_TOKENS)
+        for match in _METRICS_RE.finditer(text_lower) if has_hint else ():
+            field, priority = match.lastgroup.rsplit("_", 1)
+            priority = int(priority)
+            if field not in best or priority < best[field][0]:
+                best[field] = (priority, match.group(match.lastgroup))
+
+        for field in _METRIC_PATTERNS:
+            if field in best:
                 try:
-                    result["gauge_height"] = float(match.group(1))
-                except (ValueError, IndexError):
+                    result[field] = float(best[field][1].replace(",", ""))
+                except ValueError:
                     pass
-                break
-
-        # Extract water temperature
-        for pattern in WATER_TEMP_PATTERNS:
-            match = pattern.search(text)
-            if match:
-                try:
-                    result["water_temp"] = float(match.group(1))
-                except (ValueError, IndexError):
-                    pass
-                break
 
         # Classify quality from keywords
-        for quality, keywords in CONDITION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    result["quality"] = quality
-                    break
-            if "quality" in result:
-                break
+        quality = best_keyword_match(_QUALITY_AUTOMATON, text_lower, None)
+        if quality is not None:
+            result["quality"] = quality
 
         return result
 
@@ -498,36 +669,31 @@ class FacebookScraper(BaseScraper):
             pass
 
         # Try relative time patterns
-        for pattern, unit in RELATIVE_TIME_PATTERNS:
-            match = pattern.search(timestamp_str)
-            if match:
-                now = datetime.now(timezone.utc)
-                if unit == "yesterday":
-                    return now - timedelta(days=1)
-                value = int(match.group(1))
-                if unit == "minutes":
-                    return now - timedelta(minutes=value)
-                elif unit == "hours":
-                    return now - timedelta(hours=value)
-                elif unit == "days":
-                    return now - timedelta(days=value)
+        match = _REL_RE.search(timestamp_str.lower())
+        if match:
+            now = datetime.now(timezone.utc)
+            unit = match.lastgroup
+            if unit == "yesterday":
+                return now - timedelta(days=1)
+            value = int(match.group(match.lastindex + 1))
+            return now - timedelta(**{unit: value})
 
         return None
 
-    def _handle_rate_limit(self, response: httpx.Response) -> None:
+    async def _handle_rate_limit(self, response: httpx.Response) -> None:
         """Handle rate limit response by backing off."""
         retry_after = response.headers.get("Retry-After")
         if retry_after:
             try:
                 wait_time = min(int(retry_after), 300)  # Max 5 min wait
                 logger.info(f"Facebook API rate limited. Waiting {wait_time}s")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             except ValueError:
-                time.sleep(60)
+                await asyncio.sleep(60)
         else:
-            time.sleep(60)
+            await asyncio.sleep(60)
 
-    def _check_usage_headers(self, response: httpx.Response) -> None:
+    async def _check_usage_headers(self, response: httpx.Response) -> None:
         """Check Facebook API usage headers and slow down if approaching limits."""
         usage = response.headers.get("X-App-Usage") or response.headers.get(
             "X-Business-Use-Case-Usage"
@@ -536,17 +702,15 @@ class FacebookScraper(BaseScraper):
             return
 
         try:
-            import json
-
-            usage_data = json.loads(usage)
+            usage_data = orjson.loads(usage)
             # X-App-Usage has call_count, total_cputime, total_time as percentages
             call_count = usage_data.get("call_count", 0)
             if call_count > 75:
                 logger.warning(
                     f"Facebook API usage at {call_count}%. Slowing down."
                 )
-                time.sleep(self._rate_limit_delay * 3)
+                await asyncio.sleep(self._rate_limit_delay * 3)
             elif call_count > 50:
-                time.sleep(self._rate_limit_delay * 2)
+                await asyncio.sleep(self._rate_limit_delay * 2)
         except Exception:
             pass
@@ -0,0 +1,66 @@
+"""Aho-Corasick keyword matching shared by the scrapers' text classifiers.
+
+Each classifier compiles its keyword table into one automaton at import
+time, then scans listing/advisory text in a single C-level pass instead
+of testing every keyword with ``in``.
+"""
+
+import ahocorasick
+
+
+def keyword_automaton(entries) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton from (keyword, value) pairs.
+
+    The first value given for a keyword wins. Values are usually
+    ``(priority, label)`` tuples for use with :func:`best_keyword_match`.
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword, value in entries:
+        if keyword not in automaton:
+            automaton.add_word(keyword, value)
+    automaton.make_automaton()
+    return automaton
+
+
+def has_keyword(automaton: ahocorasick.Automaton, text: str) -> bool:
+    """Return True if any keyword occurs in ``text``, stopping at the first hit."""
+    return next(automaton.iter(text), None) is not None
+
+
+def best_keyword_match(
+    automaton: ahocorasick.Automaton, text: str, default: str | None
+) -> str | None:
+    """Scan text once and return the label of the highest-priority keyword hit.
+
+    Stops at the first priority-0 hit, since nothing later can beat it.
+    """
+    best = None
+    for _, match in automaton.iter(text):
+        if best is None or match < best:
+            best = match
+            if match[0] == 0:
+                break
+    return best[1] if best else default
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Return True where regex ``\\b`` would match between text[index-1] and text[index]."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def whole_word_matches(automaton: ahocorasick.Automaton, text: str):
+    """Yield the payload of every keyword hit bounded like ``\\bkeyword\\b``.
+
+    Automaton values must be ``(keyword, payload)`` pairs so the start of
+    each hit can be recovered from its end index.
+    """
+    for end, (keyword, payload) in automaton.iter(text):
+        start = end - len(keyword) + 1
+        if _at_word_boundary(text, start) and _at_word_boundary(text, end + 1):
+            yield payload
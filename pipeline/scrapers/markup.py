@@ -0,0 +1,10 @@
+"""lxml helpers shared by the scrapers that parse HTML pages."""
+
+
+def element_text(el, separator: str = "") -> str:
+    """Join an lxml element's stripped text nodes, like BS4's ``get_text(sep, strip=True)``.
+
+    Whitespace-only nodes are dropped, so ``separator`` only appears
+    between pieces of visible text.
+    """
+    return separator.join(t for t in (s.strip() for s in el.itertext()) if t)
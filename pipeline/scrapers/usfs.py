@@ -16,18 +16,27 @@ Data extracted:
 Source priority: 70 (per BD-002)
 """
 
-import time
+import asyncio
+import functools
+import os
+import re
 from datetime import datetime, timezone
 
 import httpx
+import orjson
 
-from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.base import BaseScraper, CatalogCache, ScrapedItem
+from scrapers.keywords import best_keyword_match, keyword_automaton
 from config.settings import settings
 from models import SessionLocal, River
 
 
 # RIDB API base
 RIDB_BASE_URL = "https://ridb.recreation.gov/api/v1"
+FACILITIES_URL = f"{RIDB_BASE_URL}/facilities"
+REC_AREAS_URL = f"{RIDB_BASE_URL}/recareas"
+FACILITY_ALERTS_URL = FACILITIES_URL + "/%s/alerts"
+REC_AREA_ALERTS_URL = REC_AREAS_URL + "/%s/alerts"
 
 # Alert type classification
 ALERT_TYPE_MAP = {
@@ -47,13 +56,43 @@ ALERT_TYPE_MAP = {
     "restriction": "seasonal_restriction",
 }
 
+# Severity keywords; danger beats warning, and info is the default
+SEVERITY_KEYWORDS = {
+    "danger": ("closed", "closure", "flood", "emergency", "evacuate", "dangerous"),
+    "warning": ("warning", "caution", "advisory", "fire", "high water", "restricted"),
+}
+SEVERITY_LEVELS = ("danger", "warning")
+
+# Classification automata. Alert type priority follows ALERT_TYPE_MAP's
+# declaration order; severity priority follows SEVERITY_LEVELS.
+_ALERT_TYPE_AUTOMATON = keyword_automaton(
+    (keyword, (priority, alert_type))
+    for priority, (keyword, alert_type) in enumerate(ALERT_TYPE_MAP.items())
+)
+_SEVERITY_AUTOMATON = keyword_automaton(
+    (keyword, (priority, level))
+    for priority, level in enumerate(SEVERITY_LEVELS)
+    for keyword in SEVERITY_KEYWORDS[level]
+)
+
 # Water/river related keywords for filtering facility alerts
-RIVER_KEYWORDS = [
+RIVER_KEYWORDS = (
     "river", "creek", "stream", "waterway", "whitewater",
     "rafting", "kayak", "canoe", "boat ramp", "boat launch",
     "put-in", "take-out", "rapids", "gorge", "canyon",
     "fork", "falls", "dam",
-]
+)
+
+# River name patterns — "[Name] River", "[Name] Creek", etc. Checked in
+# order, so a River match anywhere in the text wins over a Creek match.
+RIVER_SUFFIXES = ("River", "Creek", "Canyon", "Fork")
+RIVER_NAME_PATTERNS = tuple(
+    re.compile(rf"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+{suffix}\b)")
+    for suffix in RIVER_SUFFIXES
+)
+
+# Non-ISO date formats seen in RIDB; ISO-8601 goes through datetime.fromisoformat
+DATE_FORMATS = ("%m/%d/%Y",)
 
 
 class USFSScraper(BaseScraper):
@@ -64,27 +103,82 @@ class USFSScraper(BaseScraper):
     river-related facilities and extracts advisory information.
     """
 
+    # Overlapping runs (scheduled plus manual) spend one RIDB key budget
+    # between them; 429s are retried with backoff.
+    share_rate_limits = True
+
     def __init__(self):
         super().__init__()
         self._api_key = settings.ridb_api_key
-        self._client = httpx.Client(
+        self._client = self._make_client()
+        self._rate_limit_delay = 1.0  # base backoff after a 429, doubled per retry
+        self._max_retries = 3
+        self._max_concurrency = 16  # in-flight alert requests per run
+        self._semaphore: asyncio.Semaphore | None = None
+        # Facility and rec-area listings, reused across scrape cycles
+        self._catalog = CatalogCache(
+            os.path.join(settings.cache_dir, "ridb_catalog.json")
+            if settings.cache_dir
+            else None,
+            settings.ridb_catalog_ttl_seconds,
+        )
+
+    @property
+    def name(self) -> str:
+        return "usfs"
+
+    def refresh_catalog(self) -> None:
+        """Force the next scrape to refetch the facility and rec-area listings."""
+        self._catalog.clear()
+
+    async def _fetch_catalog(self, key: str, url: str, params: dict) -> list[dict]:
+        """Return a RIDB listing, from the catalog cache when it is fresh.
+
+        Raises:
+            httpx.HTTPError: If the listing has to be fetched and the request fails.
+            ValueError: If the response is not valid JSON.
+        """
+        records = self._catalog.get(key)
+        if records is not None:
+            return records
+
+        resp = await self._get(url, params=params)
+        resp.raise_for_status()
+        records = orjson.loads(resp.content).get("RECDATA", [])
+        if not isinstance(records, list):
+            return []
+        # An empty listing is more likely a hiccup than a real answer; retry next run
+        if records:
+            self._catalog.set(key, records)
+        return records
+
+    def _make_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP/2 client shared by every RIDB request in a run."""
+        return httpx.AsyncClient(
             timeout=settings.request_timeout,
             headers={
                 "User-Agent": "WaterWatcher/1.0 (river condition tracker)",
                 "Accept": "application/json",
                 "apikey": self._api_key,
             },
-            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
         )
-        self._rate_limit_delay = 1.0  # 1 second delay between requests
 
-    @property
-    def name(self) -> str:
-        return "usfs"
+    async def aclose(self) -> None:
+        """Release pooled connections; the next scrape() opens a fresh client."""
+        await self._client.aclose()
 
     def scrape(self) -> list[ScrapedItem]:
         """Run the USFS scraper and return alert items.
 
+        Synchronous entry point; see :meth:`scrape_async`.
+        """
+        return asyncio.run(self.scrape_async())
+
+    async def scrape_async(self) -> list[ScrapedItem]:
+        """Fetch facility and rec area alerts concurrently and return alert items.
+
         Fetches facility alerts from RIDB, filters for river-related
         facilities, and returns ScrapedItems with alert data including
         river_name for name-based matching.
@@ -96,27 +190,64 @@ class USFSScraper(BaseScraper):
             self.logger.warning("RIDB_API_KEY not configured, skipping USFS scraper")
             return items
 
-        try:
-            # Fetch facility alerts
-            alert_items = self._fetch_facility_alerts()
-            items.extend(alert_items)
+        if self._client.is_closed:
+            self._client = self._make_client()
+        # Created per run: asyncio primitives bind to the running event loop.
+        self._semaphore = asyncio.Semaphore(self._max_concurrency)
 
-            # Fetch recreation area alerts
-            time.sleep(self._rate_limit_delay)
-            rec_items = self._fetch_rec_area_alerts()
-            items.extend(rec_items)
+        try:
+            results = await asyncio.gather(
+                self._fetch_facility_alerts(),
+                self._fetch_rec_area_alerts(),
+                return_exceptions=True,
+            )
+        finally:
+            await self.aclose()
 
-        except Exception as e:
-            self.log_error(e)
+        for result in results:
+            if isinstance(result, BaseException):
+                self.log_error(result)
+            else:
+                items.extend(result)
 
         self.log_complete(len(items))
         return items
 
-    def _fetch_facility_alerts(self) -> list[ScrapedItem]:
+    async def _get(self, url: str, **kwargs) -> httpx.Response:
+        """GET a RIDB URL through the host's token bucket and concurrency limit.
+
+        A ``429 Too Many Requests`` is retried up to ``_max_retries`` times.
+        If it carries ``Retry-After`` the bucket pauses for that long;
+        otherwise the retry backs off exponentially from ``_rate_limit_delay``.
+        """
+        bucket = self._rate_limiter(url)
+        for attempt in range(self._max_retries + 1):
+            await bucket.acquire_async()
+            if self._semaphore is None:
+                resp = await self._client.get(url, **kwargs)
+            else:
+                async with self._semaphore:
+                    resp = await self._client.get(url, **kwargs)
+            bucket.update_from_headers(resp.headers)
+            if resp.status_code != 429 or attempt == self._max_retries:
+                return resp
+            if "Retry-After" not in resp.headers:
+                await asyncio.sleep(self._rate_limit_delay * 2 ** attempt)
+        return resp
+
+    async def _gather_alerts(self, fetches) -> list[ScrapedItem]:
+        """Run per-facility/area alert fetches concurrently, in input order."""
+        items: list[ScrapedItem] = []
+        for result in await asyncio.gather(*fetches):
+            items.extend(result)
+        return items
+
+    async def _fetch_facility_alerts(self) -> list[ScrapedItem]:
         """Fetch alerts for recreation facilities from RIDB.
 
-        Queries the RIDB facilities endpoint with water-activity filters,
-        then fetches alerts for matching facilities.
+        Queries the RIDB facilities endpoint with water-activity filters
+        (or reuses the cached listing), then fetches alerts for matching
+        facilities concurrently.
         """
         items: list[ScrapedItem] = []
 
@@ -129,26 +260,13 @@ class USFSScraper(BaseScraper):
                 "offset": 0,
             }
 
-            resp = self._client.get(f"{RIDB_BASE_URL}/facilities", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-
-            facilities = data.get("RECDATA", [])
-            if not isinstance(facilities, list):
-                facilities = []
+            facilities = await self._fetch_catalog("facilities", FACILITIES_URL, params)
 
-            for facility in facilities:
-                facility_id = facility.get("FacilityID")
-                if not facility_id:
-                    continue
-
-                # Rate limit between facility alert requests
-                time.sleep(self._rate_limit_delay)
-
-                facility_alerts = self._fetch_alerts_for_facility(
-                    facility_id, facility
-                )
-                items.extend(facility_alerts)
+            items = await self._gather_alerts(
+                self._fetch_alerts_for_facility(facility["FacilityID"], facility)
+                for facility in facilities
+                if facility.get("FacilityID")
+            )
 
         except httpx.TimeoutException:
             self.logger.warning("RIDB facilities request timed out")
@@ -159,7 +277,7 @@ class USFSScraper(BaseScraper):
 
         return items
 
-    def _fetch_alerts_for_facility(
+    async def _fetch_alerts_for_facility(
         self, facility_id: str, facility: dict
     ) -> list[ScrapedItem]:
         """Fetch alerts for a specific facility.
@@ -174,11 +292,9 @@ class USFSScraper(BaseScraper):
         items: list[ScrapedItem] = []
 
         try:
-            resp = self._client.get(
-                f"{RIDB_BASE_URL}/facilities/{facility_id}/alerts"
-            )
+            resp = await self._get(FACILITY_ALERTS_URL % facility_id)
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
 
             alerts = data.get("RECDATA", [])
             if not isinstance(alerts, list):
@@ -203,7 +319,7 @@ class USFSScraper(BaseScraper):
 
         return items
 
-    def _fetch_rec_area_alerts(self) -> list[ScrapedItem]:
+    async def _fetch_rec_area_alerts(self) -> list[ScrapedItem]:
         """Fetch alerts for recreation areas from RIDB."""
         items: list[ScrapedItem] = []
 
@@ -214,43 +330,13 @@ class USFSScraper(BaseScraper):
                 "offset": 0,
             }
 
-            resp = self._client.get(f"{RIDB_BASE_URL}/recareas", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-
-            rec_areas = data.get("RECDATA", [])
-            if not isinstance(rec_areas, list):
-                rec_areas = []
-
-            for area in rec_areas:
-                area_id = area.get("RecAreaID")
-                if not area_id:
-                    continue
-
-                time.sleep(self._rate_limit_delay)
+            rec_areas = await self._fetch_catalog("rec_areas", REC_AREAS_URL, params)
 
-                try:
-                    resp = self._client.get(
-                        f"{RIDB_BASE_URL}/recareas/{area_id}/alerts"
-                    )
-                    resp.raise_for_status()
-                    alert_data = resp.json()
-
-                    alerts = alert_data.get("RECDATA", [])
-                    if not isinstance(alerts, list):
-                        continue
-
-                    area_name = area.get("RecAreaName", "")
-                    river_name = self._extract_river_name_from_text(area_name)
-
-                    for alert in alerts:
-                        item = self._parse_rec_area_alert(alert, area_name, river_name)
-                        if item:
-                            items.append(item)
-
-                except (httpx.HTTPError, ValueError) as e:
-                    self.logger.debug(f"Failed to fetch alerts for rec area {area_id}: {e}")
-                    continue
+            items = await self._gather_alerts(
+                self._fetch_alerts_for_rec_area(area["RecAreaID"], area)
+                for area in rec_areas
+                if area.get("RecAreaID")
+            )
 
         except httpx.TimeoutException:
             self.logger.warning("RIDB rec areas request timed out")
@@ -261,6 +347,40 @@ class USFSScraper(BaseScraper):
 
         return items
 
+    async def _fetch_alerts_for_rec_area(self, area_id: str, area: dict) -> list[ScrapedItem]:
+        """Fetch alerts for a specific recreation area.
+
+        Args:
+            area_id: RIDB rec area ID.
+            area: Rec area dict from the rec areas response.
+
+        Returns:
+            List of ScrapedItems for alerts on this rec area.
+        """
+        items: list[ScrapedItem] = []
+
+        try:
+            resp = await self._get(REC_AREA_ALERTS_URL % area_id)
+            resp.raise_for_status()
+            alert_data = orjson.loads(resp.content)
+
+            alerts = alert_data.get("RECDATA", [])
+            if not isinstance(alerts, list):
+                return items
+
+            area_name = area.get("RecAreaName", "")
+            river_name = self._extract_river_name_from_text(area_name)
+
+            for alert in alerts:
+                item = self._parse_rec_area_alert(alert, area_name, river_name)
+                if item:
+                    items.append(item)
+
+        except (httpx.HTTPError, ValueError) as e:
+            self.logger.debug(f"Failed to fetch alerts for rec area {area_id}: {e}")
+
+        return items
+
     def _parse_facility_alert(
         self, alert: dict, facility_name: str, river_name: str | None
     ) -> ScrapedItem | None:
@@ -287,8 +407,9 @@ class USFSScraper(BaseScraper):
             if not river_name:
                 return None
 
-            alert_type = self._classify_alert_type(title, description)
-            severity = self._classify_severity(title, description)
+            text_lower = f"{title} {description}".lower()
+            alert_type = self._classify_alert_type(title, description, text_lower)
+            severity = self._classify_severity(title, description, text_lower)
 
             start_date = self._parse_date(
                 alert.get("StartDate", alert.get("AlertStartDate"))
@@ -342,8 +463,9 @@ class USFSScraper(BaseScraper):
             if not river_name:
                 return None
 
-            alert_type = self._classify_alert_type(title, description)
-            severity = self._classify_severity(title, description)
+            text_lower = f"{title} {description}".lower()
+            alert_type = self._classify_alert_type(title, description, text_lower)
+            severity = self._classify_severity(title, description, text_lower)
 
             start_date = self._parse_date(
                 alert.get("StartDate", alert.get("AlertStartDate"))
@@ -396,80 +518,71 @@ class USFSScraper(BaseScraper):
 
         return None
 
-    def _extract_river_name_from_text(self, text: str) -> str | None:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_river_name_from_text(text: str) -> str | None:
         """Extract a river name from free text using pattern matching.
 
+        Facility names and descriptions repeat across alerts and runs, so
+        results are memoized on the text.
+
         Args:
             text: Text that may contain a river name reference.
 
         Returns:
             Extracted river name or None.
         """
-        import re
-
         if not text:
             return None
 
-        patterns = [
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+River\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Creek\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Canyon\b)",
-            r"(\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+Fork\b)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in RIVER_NAME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
         return None
 
-    def _classify_alert_type(self, title: str, description: str) -> str:
+    def _classify_alert_type(
+        self, title: str, description: str, text_lower: str | None = None
+    ) -> str:
         """Classify an alert into a type based on text content.
 
         Args:
             title: Alert title.
             description: Alert description.
+            text_lower: Pre-lowercased "title description", if the caller
+                already has it.
 
         Returns:
             Alert type string.
         """
-        text = f"{title} {description}".lower()
-
-        for keyword, alert_type in ALERT_TYPE_MAP.items():
-            if keyword in text:
-                return alert_type
+        text = text_lower if text_lower is not None else f"{title} {description}".lower()
+        return best_keyword_match(_ALERT_TYPE_AUTOMATON, text, "general")
 
-        return "general"
-
-    def _classify_severity(self, title: str, description: str) -> str:
+    def _classify_severity(
+        self, title: str, description: str, text_lower: str | None = None
+    ) -> str:
         """Classify alert severity based on keywords.
 
         Args:
             title: Alert title.
             description: Alert description.
+            text_lower: Pre-lowercased "title description", if the caller
+                already has it.
 
         Returns:
             Severity string: "danger", "warning", or "info".
         """
-        text = f"{title} {description}".lower()
-
-        danger_keywords = ["closed", "closure", "flood", "emergency", "evacuate", "dangerous"]
-        warning_keywords = ["warning", "caution", "advisory", "fire", "high water", "restricted"]
-
-        for keyword in danger_keywords:
-            if keyword in text:
-                return "danger"
-
-        for keyword in warning_keywords:
-            if keyword in text:
-                return "warning"
-
-        return "info"
+        text = text_lower if text_lower is not None else f"{title} {description}".lower()
+        return best_keyword_match(_SEVERITY_AUTOMATON, text, "info")
 
     def _parse_date(self, date_str: str | None) -> datetime | None:
         """Try to parse a date string in common RIDB formats.
 
+        Most RIDB timestamps are ISO-8601 and go through
+        ``datetime.fromisoformat`` in one call; anything else tries
+        ``DATE_FORMATS``.
+
         Args:
             date_str: Date string or None.
 
@@ -479,23 +592,27 @@ class USFSScraper(BaseScraper):
         if not date_str:
             return None
 
-        formats = [
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-        ]
+        date_str = date_str.strip()
+        dt = None
 
-        for fmt in formats:
+        if date_str[4:5] == "-":
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
+                dt = datetime.fromisoformat(date_str)
             except ValueError:
-                continue
+                pass
+
+        if dt is None:
+            for fmt in DATE_FORMATS:
+                try:
+                    dt = datetime.strptime(date_str, fmt)
+                    break
+                except ValueError:
+                    continue
+
+        if dt is not None:
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt
 
         self.logger.debug(f"Could not parse RIDB date: {date_str}")
         return None
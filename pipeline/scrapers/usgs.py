@@ -10,85 +10,166 @@ Parameters scraped:
 - 00010: Water temperature (°C, converted to °F)
 """
 
+import atexit
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
-import json
+import orjson
 from datetime import datetime, timezone
 
 from scrapers.base import BaseScraper, ScrapedItem
 from config.settings import settings
 from models import SessionLocal, River
 
+# USGS accepts comma-separated site IDs, up to ~100 per request; larger
+# gauge sets are split into shards fetched side by side.
+SHARD_SIZE = 80
+MAX_PARALLEL_SHARDS = 4
+
 
 class USGSScraper(BaseScraper):
+    """Fetches the latest readings for every tracked river's USGS gauge.
+
+    The tracked gauge IDs are cached on the class for
+    ``settings.river_cache_ttl_seconds``, so scheduled runs within the TTL
+    skip the database query.
+    """
+
+    _gauge_ids_entry: tuple[float, list[str]] | None = None
+    # One pooled client for the whole process: the scheduler builds a new
+    # scraper every cycle, and reusing the keep-alive connection spares each
+    # run a fresh TCP+TLS handshake.
+    _client: httpx.Client | None = None
+
     @property
     def name(self) -> str:
         return "usgs"
 
+    @classmethod
+    def _get_client(cls) -> httpx.Client:
+        """Return the shared HTTP/2 client, creating it on first use."""
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.Client(
+                timeout=30,
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                headers={"User-Agent": "WaterWatcher/1.0 (river condition tracker)"},
+            )
+        return cls._client
+
+    @classmethod
+    def close(cls) -> None:
+        """Release the shared connection pool."""
+        if cls._client is not None:
+            cls._client.close()
+            cls._client = None
+
     def _get_tracked_gauge_ids(self) -> list[str]:
-        """Get USGS gauge IDs for all tracked rivers."""
+        """Get USGS gauge IDs for all tracked rivers, cached for the TTL."""
+        entry = USGSScraper._gauge_ids_entry
+        if entry is not None and time.monotonic() - entry[0] < settings.river_cache_ttl_seconds:
+            return entry[1]
+
         session = SessionLocal()
         try:
-            rivers = (
-                session.query(River)
+            # Only the gauge ID column; no River entities are hydrated
+            rows = (
+                session.query(River.usgs_gauge_id)
                 .filter(River.usgs_gauge_id.isnot(None))
                 .all()
             )
-            return [r.usgs_gauge_id for r in rivers]
+            gauge_ids = [r.usgs_gauge_id for r in rows]
         finally:
             session.close()
 
-    def scrape(self) -> list[ScrapedItem]:
-        self.log_start()
-        gauge_ids = self._get_tracked_gauge_ids()
+        USGSScraper._gauge_ids_entry = (time.monotonic(), gauge_ids)
+        return gauge_ids
 
-        if not gauge_ids:
-            self.logger.info("No USGS gauge IDs configured, skipping")
-            return []
+    @classmethod
+    def clear_gauge_cache(cls) -> None:
+        """Forget the cached gauge IDs so the next scrape re-queries."""
+        cls._gauge_ids_entry = None
 
-        items: list[ScrapedItem] = []
+    def _fetch_timeseries(self, gauge_ids: list[str]) -> list[dict]:
+        """Fetch the IV time series for one shard of gauge IDs.
+
+        Args:
+            gauge_ids: Up to ``SHARD_SIZE`` USGS site IDs.
 
-        # USGS supports comma-separated site IDs (max ~100 per request)
-        sites = ",".join(gauge_ids)
+        Returns:
+            The response's ``timeSeries`` list, or an empty list on failure.
+        """
         url = (
             f"{settings.usgs_base_url}/iv/"
             f"?format=json"
-            f"&sites={sites}"
+            f"&sites={','.join(gauge_ids)}"
             f"&parameterCd=00060,00065,00010"
             f"&siteStatus=active"
         )
 
         try:
-            response = httpx.get(url, timeout=30)
+            response = self._get_client().get(url)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
+            return data.get("value", {}).get("timeSeries", [])
+        except httpx.HTTPError as e:
+            self.log_error(e)
+        except orjson.JSONDecodeError as e:
+            self.logger.error(f"Failed to parse USGS response: {e}")
+        return []
+
+    def scrape(self) -> list[ScrapedItem]:
+        self.log_start()
+        gauge_ids = self._get_tracked_gauge_ids()
+
+        if not gauge_ids:
+            self.logger.info("No USGS gauge IDs configured, skipping")
+            return []
 
-            timeseries = data.get("value", {}).get("timeSeries", [])
+        items: list[ScrapedItem] = []
+
+        shards = [gauge_ids[i:i + SHARD_SIZE] for i in range(0, len(gauge_ids), SHARD_SIZE)]
+        # The shared client's pool is thread-safe, so shards reuse its connections
+        with ThreadPoolExecutor(max_workers=min(len(shards), MAX_PARALLEL_SHARDS)) as pool:
+            results = list(pool.map(self._fetch_timeseries, shards))
+        timeseries = [ts for result in results for ts in result]
+
+        try:
             # Group by site
             site_data: dict[str, dict] = {}
             for ts in timeseries:
                 site_code = ts["sourceInfo"]["siteCode"][0]["value"]
                 param_code = ts["variable"]["variableCode"][0]["value"]
-                values = ts.get("values", [{}])[0].get("value", [])
-                if values:
-                    latest = values[-1]
-                    if site_code not in site_data:
-                        site_data[site_code] = {"site_code": site_code}
-                    try:
-                        site_data[site_code][param_code] = float(latest["value"])
-                    except (ValueError, TypeError):
-                        self.logger.warning(
-                            f"Non-numeric value '{latest.get('value')}' for "
-                            f"param {param_code} at site {site_code}, skipping"
-                        )
-                        continue
-                    site_data[site_code]["datetime"] = latest["dateTime"]
+                values_container = ts.get("values")
+                if not values_container:
+                    continue
+                values = values_container[0].get("value")
+                if not values:
+                    continue
+
+                latest = values[-1]
+                readings = site_data.get(site_code)
+                if readings is None:
+                    readings = site_data[site_code] = {"site_code": site_code}
+                try:
+                    readings[param_code] = float(latest["value"])
+                except (ValueError, TypeError):
+                    self.logger.warning(
+                        f"Non-numeric value '{latest.get('value')}' for "
+                        f"param {param_code} at site {site_code}, skipping"
+                    )
+                    continue
+                readings["datetime"] = latest["dateTime"]
 
+            # One timestamp for the whole batch: every reading came from this fetch
+            scraped_at = datetime.now(timezone.utc)
             for site_code, readings in site_data.items():
                 flow_rate = readings.get("00060")  # CFS
                 gauge_height = readings.get("00065")  # feet
                 water_temp_c = readings.get("00010")  # °C
                 water_temp_f = (
-                    (water_temp_c * 9 / 5 + 32) if water_temp_c is not None else None
+                    (water_temp_c * 1.8 + 32) if water_temp_c is not None else None
                 )
 
                 items.append(
@@ -102,14 +183,15 @@ class USGSScraper(BaseScraper):
                             "water_temp": water_temp_f,
                             "raw": readings,
                         },
-                        scraped_at=datetime.now(timezone.utc),
+                        scraped_at=scraped_at,
                     )
                 )
 
-        except httpx.HTTPError as e:
-            self.log_error(e)
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (KeyError, TypeError) as e:
             self.logger.error(f"Failed to parse USGS response: {e}")
 
         self.log_complete(len(items))
         return items
+
+
+atexit.register(USGSScraper.close)
@@ -3,13 +3,15 @@ Shared test fixtures for the Water-Watcher pipeline test suite.
 
 Provides:
 - SQLAlchemy in-memory session fixtures (mocked)
-- Mock HTTP responses for external APIs
+- Mock HTTP responses for external APIs (pre-encoded where reused)
 - Realistic test data factories
+- Session-scoped scraper instances that are costly to build
 """
 
 import pytest
+import orjson
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
 
 from scrapers.base import ScrapedItem
 
@@ -93,13 +95,49 @@ USGS_RESPONSE_JSON = {
     }
 }
 
+# Pre-encoded once so HTTP mocks don't re-serialize the payload per test
+USGS_RESPONSE_BYTES = orjson.dumps(USGS_RESPONSE_JSON)
+
 USGS_EMPTY_RESPONSE = {"value": {"timeSeries": []}}
 
 USGS_MALFORMED_RESPONSE = {"value": {}}
 
 
+@pytest.fixture(scope="session")
+def usgs_response_bytes():
+    """Realistic USGS payload as raw response bytes."""
+    return USGS_RESPONSE_BYTES
+
+
+# ─── Shared scraper instances ──────────────────────────────
+
+@pytest.fixture(scope="session")
+def aw_scraper():
+    """One AmericanWhitewaterScraper for the session.
+
+    Building one opens an httpx.Client (and its SSL context), which costs
+    far more than any single AW test.
+    """
+    from scrapers.american_whitewater import AmericanWhitewaterScraper
+
+    scraper = AmericanWhitewaterScraper()
+    yield scraper
+    scraper._client.close()
+
+
 # ─── Mock River objects ─────────────────────────────────────
 
+@dataclass(frozen=True, slots=True)
+class FakeRiver:
+    """Read-only stand-in for a River row; far cheaper to build than a MagicMock."""
+    id: str
+    name: str
+    state: str
+    usgs_gauge_id: str | None
+    aw_id: str | None
+    difficulty: str | None
+
+
 def make_mock_river(
     id="river-1",
     name="Colorado River — Grand Canyon",
@@ -108,15 +146,15 @@ def make_mock_river(
     aw_id="aw-123",
     difficulty="Class III-IV",
 ):
-    """Create a mock River object for testing."""
-    river = MagicMock()
-    river.id = id
-    river.name = name
-    river.state = state
-    river.usgs_gauge_id = usgs_gauge_id
-    river.aw_id = aw_id
-    river.difficulty = difficulty
-    return river
+    """Create a stand-in River object for testing."""
+    return FakeRiver(
+        id=id,
+        name=name,
+        state=state,
+        usgs_gauge_id=usgs_gauge_id,
+        aw_id=aw_id,
+        difficulty=difficulty,
+    )
 
 
 # ─── ScrapedItem factories ──────────────────────────────────
@@ -173,6 +211,19 @@ def make_deal_scraped_item(
 _SENTINEL = object()
 
 
+@dataclass(frozen=True, slots=True)
+class FakeFilter:
+    """Read-only stand-in for a DealFilter row."""
+    id: str
+    user_id: str
+    name: str
+    keywords: list[str] | None
+    categories: list[str] | None
+    max_price: float | None
+    regions: list[str] | None
+    is_active: bool
+
+
 def make_mock_filter(
     id="filter-1",
     user_id="user-1",
@@ -183,25 +234,37 @@ def make_mock_filter(
     regions=_SENTINEL,
     is_active=True,
 ):
-    """Create a mock DealFilter for testing.
+    """Create a stand-in DealFilter for testing.
 
     Uses a sentinel default so callers can explicitly pass [] or None
     and have it respected, rather than falling back to defaults.
     """
-    f = MagicMock()
-    f.id = id
-    f.user_id = user_id
-    f.name = name
-    f.keywords = ["raft", "inflatable"] if keywords is _SENTINEL else keywords
-    f.categories = ["raft"] if categories is _SENTINEL else categories
-    f.max_price = max_price
-    f.regions = ["seattle", "portland"] if regions is _SENTINEL else regions
-    f.is_active = is_active
-    return f
+    return FakeFilter(
+        id=id,
+        user_id=user_id,
+        name=name,
+        keywords=["raft", "inflatable"] if keywords is _SENTINEL else keywords,
+        categories=["raft"] if categories is _SENTINEL else categories,
+        max_price=max_price,
+        regions=["seattle", "portland"] if regions is _SENTINEL else regions,
+        is_active=is_active,
+    )
 
 
 # ─── Mock GearDeal objects ─────────────────────────────────
 
+@dataclass(frozen=True, slots=True)
+class FakeDeal:
+    """Read-only stand-in for a GearDeal row."""
+    id: str
+    title: str
+    price: float | None
+    url: str
+    category: str | None
+    region: str | None
+    description: str | None
+
+
 def make_mock_deal(
     id="deal-1",
     title="NRS Otter 140 Raft — great condition",
@@ -211,13 +274,13 @@ def make_mock_deal(
     region="seattle",
     description="14-foot self-bailing raft. Includes frame.",
 ):
-    """Create a mock GearDeal for testing."""
-    deal = MagicMock()
-    deal.id = id
-    deal.title = title
-    deal.price = price
-    deal.url = url
-    deal.category = category
-    deal.region = region
-    deal.description = description
-    return deal
+    """Create a stand-in GearDeal for testing."""
+    return FakeDeal(
+        id=id,
+        title=title,
+        price=price,
+        url=url,
+        category=category,
+        region=region,
+        description=description,
+    )
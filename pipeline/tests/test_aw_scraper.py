@@ -4,6 +4,7 @@ Tests for the American Whitewater scraper.
 Mocks HTTP responses with sample JSON and HTML, verifying:
 - _fetch_reach_detail() — JSON API parsing
 - _fetch_gauge_data() — gauge reading extraction from HTML
+- _fetch_rapids() / _fetch_hazards() — rapid and alert extraction from HTML
 - _extract_reach_data() — normalization of nested AW JSON
 - Difficulty mapping/normalization
 - _classify_hazard() — hazard type classification
@@ -16,6 +17,7 @@ Mocks HTTP responses with sample JSON and HTML, verifying:
 import httpx
 import pytest
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 
 from scrapers.american_whitewater import (
@@ -24,9 +26,33 @@ from scrapers.american_whitewater import (
     DIFFICULTY_MAP,
 )
 from scrapers.base import ScrapedItem
+from config.settings import settings
+from models import River
 from tests.conftest import make_mock_river
 
 
+@pytest.fixture(autouse=True)
+def _clear_aw_id_cache():
+    """Reach IDs are cached on the class; keep tests from sharing them."""
+    AmericanWhitewaterScraper.clear_aw_id_cache()
+    yield
+    AmericanWhitewaterScraper.clear_aw_id_cache()
+
+
+@pytest.fixture(autouse=True)
+def _shared_scraper(request, aw_scraper):
+    """Give each test class the session's scraper, restoring its HTTP client after.
+
+    Tests swap ``_client`` for a MagicMock; nothing else on the scraper is
+    mutated, so sharing one instance is safe.
+    """
+    client = aw_scraper._client
+    if request.instance is not None:
+        request.instance.scraper = aw_scraper
+    yield
+    aw_scraper._client = client
+
+
 # ─── Sample AW JSON response ───────────────────────────────
 
 SAMPLE_REACH_JSON = {
@@ -139,9 +165,6 @@ SAMPLE_HAZARDS_HTML = """\
 class TestFetchReachDetail:
     """Tests for AmericanWhitewaterScraper._fetch_reach_detail()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_parses_json_response(self):
         """Should parse a valid JSON response from AW API."""
         mock_resp = MagicMock()
@@ -201,9 +224,6 @@ class TestFetchReachDetail:
 class TestFetchGaugeData:
     """Tests for AmericanWhitewaterScraper._fetch_gauge_data()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_parses_gauge_table(self):
         """Should parse gauge data from HTML table."""
         mock_resp = MagicMock()
@@ -253,12 +273,90 @@ class TestFetchGaugeData:
         assert gauges == []
 
 
+class TestFetchRapids:
+    """Tests for AmericanWhitewaterScraper._fetch_rapids()."""
+
+    def test_parses_rapid_divs(self):
+        """Should extract name, difficulty, and description per rapid."""
+        mock_resp = MagicMock()
+        mock_resp.text = SAMPLE_RAPIDS_HTML
+        mock_resp.raise_for_status = MagicMock()
+        self.scraper._client = MagicMock()
+        self.scraper._client.get.return_value = mock_resp
+
+        rapids = self.scraper._fetch_rapids("12345")
+        assert len(rapids) == 2
+        assert rapids[0] == {
+            "name": "Crunch",
+            "difficulty": "IV",
+            "description": "Big hole at center. Run left.",
+        }
+        # Falls back to a plain heading when no name-classed element exists
+        assert rapids[1]["name"] == "Juicer"
+        assert rapids[1]["difficulty"] is None
+
+    def test_class_matching_ignores_case(self):
+        """Name and difficulty classes match regardless of letter case."""
+        mock_resp = MagicMock()
+        mock_resp.text = (
+            '<div class="rapid-detail"><span class="RapidName">Lava</span>'
+            '<span class="Class-V">V</span></div>'
+        )
+        mock_resp.raise_for_status = MagicMock()
+        self.scraper._client = MagicMock()
+        self.scraper._client.get.return_value = mock_resp
+
+        rapids = self.scraper._fetch_rapids("12345")
+        assert rapids == [{"name": "Lava", "difficulty": "V", "description": None}]
+
+    def test_empty_page_returns_empty_list(self):
+        mock_resp = MagicMock()
+        mock_resp.text = ""
+        mock_resp.raise_for_status = MagicMock()
+        self.scraper._client = MagicMock()
+        self.scraper._client.get.return_value = mock_resp
+
+        assert self.scraper._fetch_rapids("12345") == []
+
+
+class TestFetchHazards:
+    """Tests for AmericanWhitewaterScraper._fetch_hazards()."""
+
+    def test_parses_alert_divs(self):
+        """Should extract title, description, and severity per alert."""
+        mock_resp = MagicMock()
+        mock_resp.text = SAMPLE_HAZARDS_HTML
+        mock_resp.raise_for_status = MagicMock()
+        self.scraper._client = MagicMock()
+        self.scraper._client.get.return_value = mock_resp
+
+        hazards = self.scraper._fetch_hazards("12345")
+        assert len(hazards) == 2
+        assert hazards[0]["title"] == "Strainer at Mile 14"
+        assert hazards[0]["severity"] == "danger"
+        assert hazards[0]["type"] == "strainer"
+        assert hazards[1]["title"] == "Low bridge advisory"
+        assert hazards[1]["description"] == "New bridge construction at takeout."
+        assert hazards[1]["severity"] == "warning"
+
+    def test_severity_from_prefixed_class_names(self):
+        """Classes like "alert-danger" should still set the severity."""
+        mock_resp = MagicMock()
+        mock_resp.text = (
+            '<html><body><div class="alert alert-danger"><h3>Undercut rock</h3></div>'
+            '<div class="alert alert-warning"><h3>Low bridge</h3></div></body></html>'
+        )
+        mock_resp.raise_for_status = MagicMock()
+        self.scraper._client = MagicMock()
+        self.scraper._client.get.return_value = mock_resp
+
+        hazards = self.scraper._fetch_hazards("12345")
+        assert [h["severity"] for h in hazards] == ["danger", "warning"]
+
+
 class TestExtractReachData:
     """Tests for AmericanWhitewaterScraper._extract_reach_data()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_standard_format(self):
         """Should extract data from standard AW JSON format."""
         result = self.scraper._extract_reach_data(SAMPLE_REACH_JSON)
@@ -293,9 +391,6 @@ class TestExtractReachData:
 class TestDifficultyMapping:
     """Tests for difficulty normalization."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_all_mapped_values(self):
         """All difficulty shorthand values should have a mapping."""
         for short, full in DIFFICULTY_MAP.items():
@@ -322,9 +417,6 @@ class TestDifficultyMapping:
 class TestClassifyHazard:
     """Tests for AmericanWhitewaterScraper._classify_hazard()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_strainer_keywords(self):
         assert self.scraper._classify_hazard("Strainer at mile 5", "") == "strainer"
         assert self.scraper._classify_hazard("Fallen tree", "blocking channel") == "strainer"
@@ -349,10 +441,23 @@ class TestClassifyHazard:
     def test_rapid_change_keywords(self):
         assert self.scraper._classify_hazard("New hole formed", "big hydraulic") == "rapid_change"
 
+    def test_category_order_beats_text_order(self):
+        # "tree" appears before "log jam" in the text, but logjam is checked first
+        assert self.scraper._classify_hazard("Tree caught in log jam", "") == "logjam"
+
     def test_default_is_rapid_change(self):
         """Unknown hazards default to rapid_change."""
         assert self.scraper._classify_hazard("Unknown hazard", "be careful") == "rapid_change"
 
+    def test_repeated_text_is_memoized(self):
+        """Identical hazard text should be served from the cache."""
+        AmericanWhitewaterScraper._classify_hazard.cache_clear()
+        self.scraper._classify_hazard("Trees down", "after storm")
+        self.scraper._classify_hazard("Trees down", "after storm")
+        info = AmericanWhitewaterScraper._classify_hazard.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
 
 class TestParseFloat:
     """Tests for AmericanWhitewaterScraper._parse_float()."""
@@ -384,13 +489,16 @@ class TestParseFloat:
     def test_whitespace_string(self):
         assert AmericanWhitewaterScraper._parse_float("  ") is None
 
+    def test_padded_string_with_comma(self):
+        assert AmericanWhitewaterScraper._parse_float(" 12,400\n") == 12400.0
+
+    def test_comma_only_returns_none(self):
+        assert AmericanWhitewaterScraper._parse_float(",") is None
+
 
 class TestCleanHtml:
     """Tests for _clean_html()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     def test_strips_tags(self):
         assert self.scraper._clean_html("<p>Hello <b>world</b></p>") == "Hello world"
 
@@ -400,13 +508,16 @@ class TestCleanHtml:
     def test_no_html(self):
         assert self.scraper._clean_html("Plain text") == "Plain text"
 
+    def test_adjacent_blocks_stay_separated(self):
+        assert self.scraper._clean_html("<p>Put-in</p><p>Take-out</p>") == "Put-in Take-out"
+
+    def test_decodes_entities(self):
+        assert self.scraper._clean_html("<p>Class&nbsp;IV &amp; up</p>") == "Class IV & up"
+
 
 class TestTrackedRiverLookup:
     """Tests for _get_tracked_aw_ids()."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     @patch("scrapers.american_whitewater.SessionLocal")
     def test_returns_aw_ids(self, mock_session_cls):
         """Should return AW IDs from tracked rivers."""
@@ -429,13 +540,43 @@ class TestTrackedRiverLookup:
         ids = self.scraper._get_tracked_aw_ids()
         assert ids == []
 
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_ids_cached_within_ttl(self, mock_session_cls):
+        """A second lookup inside the TTL should not touch the database."""
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(aw_id="111")
+        ]
+
+        assert self.scraper._get_tracked_aw_ids() == ["111"]
+        assert AmericanWhitewaterScraper()._get_tracked_aw_ids() == ["111"]
+        assert mock_session_cls.call_count == 1
+
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_ids_requeried_after_ttl(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = []
+
+        with patch.object(settings, "river_cache_ttl_seconds", 0):
+            self.scraper._get_tracked_aw_ids()
+            self.scraper._get_tracked_aw_ids()
+        assert mock_session_cls.call_count == 2
+
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_queries_only_aw_id_column(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = []
+
+        self.scraper._get_tracked_aw_ids()
+        mock_session.query.assert_called_once_with(River.aw_id)
+
 
 class TestScrapeIntegration:
     """Integration tests for the full scrape() method."""
 
-    def setup_method(self):
-        self.scraper = AmericanWhitewaterScraper()
-
     @patch("time.sleep")
     @patch("scrapers.american_whitewater.SessionLocal")
     def test_scrape_no_aw_ids_returns_empty(self, mock_session_cls, mock_sleep):
@@ -491,6 +632,66 @@ class TestScrapeIntegration:
         assert items[0].source == "aw"
         assert items[0].data["aw_id"] == "12345"
         assert items[0].data["name"] == "North Fork Payette"
+        # Raw reach JSON is dropped unless include_raw is set
+        assert "raw" not in items[0].data
+
+    def _mock_single_reach(self, mock_session_cls, scraper):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(aw_id="12345")
+        ]
+        mock_session.query.return_value.filter.return_value.first.return_value = None
+
+        json_resp = MagicMock()
+        json_resp.json.return_value = SAMPLE_REACH_JSON
+        html_resp = MagicMock()
+        html_resp.text = "<html><body></body></html>"
+        scraper._client = MagicMock()
+        scraper._client.get.side_effect = [json_resp] + [html_resp] * 4
+
+    @patch("time.sleep")
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_scrape_iter_is_lazy(self, mock_session_cls, mock_sleep):
+        """scrape_iter() should not hit the DB or network until iterated."""
+        self._mock_single_reach(mock_session_cls, self.scraper)
+
+        stream = self.scraper.scrape_iter()
+        mock_session_cls.assert_not_called()
+        self.scraper._client.get.assert_not_called()
+
+        item = next(stream)
+        assert item.data["aw_id"] == "12345"
+        assert list(stream) == []
+
+    @patch("time.sleep")
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_include_raw_keeps_reach_json(self, mock_session_cls, mock_sleep):
+        """include_raw=True should attach the raw reach JSON to each item."""
+        scraper = AmericanWhitewaterScraper(include_raw=True)
+        self._mock_single_reach(mock_session_cls, scraper)
+
+        items = scraper.scrape()
+        assert items[0].data["raw"] == SAMPLE_REACH_JSON
+
+    @patch("scrapers.american_whitewater.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("scrapers.american_whitewater._scrape_aw_shard")
+    @patch("scrapers.american_whitewater.SessionLocal")
+    def test_scrape_sharded_partitions_reaches(self, mock_session_cls, mock_shard):
+        """Every tracked reach should be scraped in exactly one shard."""
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(aw_id=str(i)) for i in range(5)
+        ]
+        mock_shard.side_effect = lambda ids, include_raw: [
+            ScrapedItem(source="aw", data={"aw_id": i}) for i in ids
+        ]
+
+        items = self.scraper.scrape_sharded(n_workers=2)
+
+        assert mock_shard.call_count == 2
+        assert sorted(i.data["aw_id"] for i in items) == ["0", "1", "2", "3", "4"]
 
     @patch("time.sleep")
     @patch("scrapers.american_whitewater.SessionLocal")
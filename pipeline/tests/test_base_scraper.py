@@ -3,8 +3,18 @@ Tests for the base scraper class and ScrapedItem dataclass.
 """
 
 import logging
+import math
 from datetime import datetime
-from scrapers.base import BaseScraper, ScrapedItem
+from unittest.mock import patch
+
+from scrapers.base import (
+    BaseScraper,
+    CatalogCache,
+    ScrapedItem,
+    TokenBucket,
+    ValidatorCache,
+)
+from config.settings import settings
 
 
 # ─── ScrapedItem Tests ──────────────────────────────────────
@@ -56,6 +66,16 @@ class TestScrapedItem:
         item1.data["x"] = 1
         assert "x" not in item2.data
 
+    def test_is_slotted(self):
+        item = ScrapedItem(source="blm")
+        assert not hasattr(item, "__dict__")
+
+    def test_pickles(self):
+        """Items cross process boundaries when scraping is sharded."""
+        import pickle
+        item = ScrapedItem(source="aw", data={"name": "Gauley"})
+        assert pickle.loads(pickle.dumps(item)) == item
+
 
 # ─── BaseScraper Tests ──────────────────────────────────────
 
@@ -143,3 +163,141 @@ class TestBaseScraper:
             assert False, "Should have raised TypeError"
         except TypeError:
             pass
+
+    def test_rate_limiter_is_per_host(self):
+        scraper = ConcreteScraper()
+        a = scraper._rate_limiter("https://example.com/a")
+        assert scraper._rate_limiter("https://example.com/b?x=1") is a
+        assert scraper._rate_limiter("https://other.example.com/a") is not a
+
+    def test_rate_limiters_are_per_instance_by_default(self):
+        url = "https://example.com/a"
+        assert ConcreteScraper()._rate_limiter(url) is not ConcreteScraper()._rate_limiter(url)
+
+    def test_rate_limiter_follows_rate_limit_delay(self):
+        with patch.object(settings, "rate_limit_delay", 4.0):
+            bucket = ConcreteScraper()._rate_limiter("https://example.com/")
+        assert bucket.rate == 0.25
+        with patch.object(settings, "rate_limit_delay", 0.5):
+            bucket = ConcreteScraper()._rate_limiter("https://example.com/")
+        assert bucket.rate == 2.0
+
+
+class TestTokenBucket:
+    @patch("scrapers.base.time.sleep")
+    def test_burst_then_waits(self, mock_sleep):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.acquire()
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 2.0
+
+    @patch("scrapers.base.time.sleep")
+    def test_retry_after_seconds_pauses(self, mock_sleep):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.update_from_headers({"Retry-After": "10"})
+        bucket.acquire()
+        assert mock_sleep.call_args.args[0] > 9
+
+    @patch("scrapers.base.time.sleep")
+    def test_retry_after_http_date_pauses(self, mock_sleep):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.update_from_headers({"Retry-After": "Wed, 21 Oct 2099 07:28:00 GMT"})
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+
+    @patch("scrapers.base.time.sleep")
+    def test_invalid_retry_after_is_ignored(self, mock_sleep):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.update_from_headers({"Retry-After": "soon"})
+        bucket.acquire()
+        mock_sleep.assert_not_called()
+
+    @patch("scrapers.base.time.sleep")
+    def test_remaining_zero_drains_bucket(self, mock_sleep):
+        bucket = TokenBucket(rate=0.5, capacity=2)
+        bucket.update_from_headers({"X-RateLimit-Remaining": "0"})
+        bucket.acquire()
+        mock_sleep.assert_called_once()
+
+    @patch("scrapers.base.time.sleep")
+    def test_infinite_rate_never_waits(self, mock_sleep):
+        bucket = TokenBucket(rate=math.inf, capacity=2)
+        for _ in range(5):
+            bucket.acquire()
+        mock_sleep.assert_not_called()
+
+
+class TestValidatorCache:
+    def test_no_headers_for_unknown_url(self):
+        assert ValidatorCache(None).headers_for("https://example.com/feed") == {}
+
+    def test_round_trips_validators(self):
+        cache = ValidatorCache(None)
+        cache.update("https://example.com/feed", {
+            "ETag": '"abc"', "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT",
+        })
+        assert cache.headers_for("https://example.com/feed") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2026 07:28:00 GMT",
+        }
+
+    def test_response_without_validators_clears_entry(self):
+        cache = ValidatorCache(None)
+        cache.update("https://example.com/feed", {"ETag": '"abc"'})
+        cache.update("https://example.com/feed", {})
+        assert cache.headers_for("https://example.com/feed") == {}
+
+    def test_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "sub" / "validators.json")
+        ValidatorCache(path).update("https://example.com/feed", {"ETag": '"v2"'})
+        assert ValidatorCache(path).headers_for("https://example.com/feed") == {
+            "If-None-Match": '"v2"',
+        }
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "validators.json"
+        path.write_text("{not json")
+        assert ValidatorCache(str(path)).headers_for("https://example.com/feed") == {}
+
+    def test_non_object_file_is_ignored(self, tmp_path):
+        path = tmp_path / "validators.json"
+        path.write_text("[]")
+        cache = ValidatorCache(str(path))
+        cache.update("https://example.com/feed", {"ETag": '"abc"'})
+        assert cache.headers_for("https://example.com/feed") == {"If-None-Match": '"abc"'}
+
+
+class TestCatalogCache:
+    def test_missing_key_returns_none(self):
+        assert CatalogCache(None, ttl=60).get("facilities") is None
+
+    def test_round_trips_value(self):
+        cache = CatalogCache(None, ttl=60)
+        cache.set("facilities", [{"FacilityID": "F1"}])
+        assert cache.get("facilities") == [{"FacilityID": "F1"}]
+
+    def test_stale_entry_returns_none(self):
+        cache = CatalogCache(None, ttl=60)
+        with patch("scrapers.base.time.time", return_value=1000.0):
+            cache.set("facilities", [{"FacilityID": "F1"}])
+        with patch("scrapers.base.time.time", return_value=1061.0):
+            assert cache.get("facilities") is None
+
+    def test_clear_drops_entries(self):
+        cache = CatalogCache(None, ttl=60)
+        cache.set("facilities", [{"FacilityID": "F1"}])
+        cache.clear()
+        assert cache.get("facilities") is None
+
+    def test_persists_between_instances(self, tmp_path):
+        path = str(tmp_path / "sub" / "catalog.json")
+        CatalogCache(path, ttl=60).set("rec_areas", [{"RecAreaID": "R1"}])
+        assert CatalogCache(path, ttl=60).get("rec_areas") == [{"RecAreaID": "R1"}]
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text("{not json")
+        assert CatalogCache(str(path), ttl=60).get("facilities") is None
@@ -9,27 +9,39 @@ Mocks HTTP responses with respx and verifies:
 - Severity classification
 - River name extraction from text
 - Date parsing in various formats
-- Rate limiting (sleep delays between requests)
+- Rate limiting (per-host token bucket)
 - Error handling (timeouts, HTTP errors, non-JSON, missing fields)
 - scrape() integration: combines API + RSS items
 """
 
+import asyncio
+
 import httpx
 import respx
 import pytest
-import time
 from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from scrapers.blm import (
     BLMScraper,
+    _fast_iso,
     ADVISORY_TYPE_MAP,
     SEVERITY_KEYWORDS,
+    SEVERITY_LEVELS,
+    _SEVERITY_TABLE,
 )
-from scrapers.base import BaseScraper, ScrapedItem
+from scrapers.base import BaseScraper, ScrapedItem, ValidatorCache
 from config.settings import settings
 
 
+@pytest.fixture(autouse=True)
+def _tmp_cache_dir(tmp_path):
+    """Keep the BLM validator cache out of the real cache directory."""
+    with patch.object(settings, "cache_dir", str(tmp_path)):
+        yield
+
+
 # ─── Sample API responses ───────────────────────────────────
 
 SAMPLE_ALERTS_LIST = [
@@ -133,6 +145,14 @@ NO_RIVER_ALERTS = [
 ]
 
 
+def run_fetch(fetch):
+    """Run an async BLM fetch coroutine against a fresh client."""
+    async def go():
+        async with fetch.__self__._make_client() as client:
+            return await fetch(client)
+    return asyncio.run(go())
+
+
 # ─── Init & Properties ──────────────────────────────────────
 
 class TestBLMScraperInit:
@@ -145,21 +165,22 @@ class TestBLMScraperInit:
     def test_inherits_base_scraper(self):
         assert issubclass(BLMScraper, BaseScraper)
 
-    def test_has_http_client(self):
+    def test_makes_async_http_client(self):
         scraper = BLMScraper()
-        assert isinstance(scraper._client, httpx.Client)
+        assert isinstance(scraper._make_client(), httpx.AsyncClient)
 
-    def test_rate_limit_delay(self):
+    def test_rate_limit_budget(self):
         scraper = BLMScraper()
-        assert scraper._rate_limit_delay == 2.0
+        assert scraper.rate_limit_rate == 0.5
+        assert scraper.rate_limit_burst == 2
 
     def test_client_has_user_agent(self):
         scraper = BLMScraper()
-        assert "WaterWatcher" in scraper._client.headers.get("User-Agent", "")
+        assert "WaterWatcher" in scraper._make_client().headers.get("User-Agent", "")
 
     def test_client_accepts_json_and_xml(self):
         scraper = BLMScraper()
-        accept = scraper._client.headers.get("Accept", "")
+        accept = scraper._make_client().headers.get("Accept", "")
         assert "application/json" in accept
         assert "xml" in accept
 
@@ -173,46 +194,51 @@ class TestBLMAdvisoryClassification:
         self.scraper = BLMScraper()
 
     def test_closure_from_title(self):
-        result = self.scraper._classify_advisory_type("River Closure Notice", "")
+        result = self.scraper._classify_advisory_type("river closure notice")
         assert result == "closure"
 
     def test_closed_keyword(self):
-        result = self.scraper._classify_advisory_type("Area Closed", "")
+        result = self.scraper._classify_advisory_type("area closed")
         assert result == "closure"
 
     def test_fire_restriction(self):
-        result = self.scraper._classify_advisory_type("Fire Restriction in Effect", "")
+        result = self.scraper._classify_advisory_type("fire restriction in effect")
         assert result == "fire_restriction"
 
     def test_burn_ban(self):
-        result = self.scraper._classify_advisory_type("", "A burn ban has been issued.")
+        result = self.scraper._classify_advisory_type("a burn ban has been issued.")
         assert result == "fire_restriction"
 
     def test_water_advisory(self):
-        result = self.scraper._classify_advisory_type("High Water Advisory", "")
+        result = self.scraper._classify_advisory_type("high water advisory")
         assert result == "water_advisory"
 
     def test_flood_advisory(self):
-        result = self.scraper._classify_advisory_type("", "Flood conditions expected.")
+        result = self.scraper._classify_advisory_type("flood conditions expected.")
         assert result == "water_advisory"
 
     def test_seasonal_access(self):
-        result = self.scraper._classify_advisory_type("Seasonal Access Update", "")
+        result = self.scraper._classify_advisory_type("seasonal access update")
         assert result == "seasonal_access"
 
     def test_permit_required(self):
-        result = self.scraper._classify_advisory_type("Permit Required", "")
+        result = self.scraper._classify_advisory_type("permit required")
         assert result == "permit_required"
 
     def test_general_fallback(self):
-        result = self.scraper._classify_advisory_type("General Update", "Nothing special.")
+        result = self.scraper._classify_advisory_type("general update nothing special.")
         assert result == "general"
 
     def test_case_insensitive(self):
         # Note: "closure" keyword is checked before "winter closure" due to dict ordering
-        result = self.scraper._classify_advisory_type("WINTER CLOSURE", "")
+        _, result, _ = self.scraper._analyze("WINTER CLOSURE on the Green River", "", "")
         assert result == "closure"
 
+    def test_map_order_beats_text_order(self):
+        """Earlier ADVISORY_TYPE_MAP keywords win regardless of text position."""
+        result = self.scraper._classify_advisory_type("permit rules updated after the fire")
+        assert result == "fire_restriction"
+
 
 # ─── Severity Classification ────────────────────────────────
 
@@ -223,32 +249,32 @@ class TestBLMSeverityClassification:
         self.scraper = BLMScraper()
 
     def test_danger_from_closed(self):
-        assert self.scraper._classify_severity("Area Closed", "") == "danger"
+        assert self.scraper._classify_severity("area closed") == "danger"
 
     def test_danger_from_flood(self):
-        assert self.scraper._classify_severity("", "Flood warning issued") == "danger"
+        assert self.scraper._classify_severity("flood warning issued") == "danger"
 
     def test_danger_from_emergency(self):
-        assert self.scraper._classify_severity("Emergency Notice", "") == "danger"
+        assert self.scraper._classify_severity("emergency notice") == "danger"
 
     def test_danger_from_dangerous(self):
-        assert self.scraper._classify_severity("Dangerous conditions", "") == "danger"
+        assert self.scraper._classify_severity("dangerous conditions") == "danger"
 
     def test_warning_from_caution(self):
-        assert self.scraper._classify_severity("", "Use caution on the trail.") == "warning"
+        assert self.scraper._classify_severity("use caution on the trail.") == "warning"
 
     def test_warning_from_advisory(self):
-        assert self.scraper._classify_severity("Advisory Issued", "") == "warning"
+        assert self.scraper._classify_severity("advisory issued") == "warning"
 
     def test_warning_from_high_water(self):
-        assert self.scraper._classify_severity("High water levels", "") == "warning"
+        assert self.scraper._classify_severity("high water levels") == "warning"
 
     def test_info_fallback(self):
-        assert self.scraper._classify_severity("Seasonal update", "River is lovely") == "info"
+        assert self.scraper._classify_severity("seasonal update river is lovely") == "info"
 
     def test_danger_takes_priority_over_warning(self):
         """If both danger and warning keywords are present, danger wins."""
-        assert self.scraper._classify_severity("Closed area advisory", "") == "danger"
+        assert self.scraper._classify_severity("closed area advisory") == "danger"
 
 
 # ─── River Name Extraction ──────────────────────────────────
@@ -293,6 +319,19 @@ class TestBLMRiverNameExtraction:
         )
         assert name == "Snake River"
 
+    def test_skips_patterns_without_suffix(self):
+        with patch("scrapers.blm.RIVER_NAME_PATTERNS", (MagicMock(),) * 4) as patterns:
+            assert self.scraper._extract_river_name("Trail closed", "", "No access") is None
+        for pattern in patterns:
+            pattern.search.assert_not_called()
+
+    def test_river_suffix_takes_priority(self):
+        """A River match should win even when a Fork appears earlier."""
+        name = self.scraper._extract_river_name(
+            "North Fork of the Salmon River closed", "", ""
+        )
+        assert name == "Salmon River"
+
 
 # ─── Date Parsing ───────────────────────────────────────────
 
@@ -339,6 +378,136 @@ class TestBLMDateParsing:
         dt = self.scraper._parse_date("2026-01-15")
         assert dt.tzinfo is not None
 
+    def test_remembers_last_format_per_source(self):
+        """The last successful strptime format is tried first for that source."""
+        self.scraper._parse_date("Tue, 20 Feb 2026 12:00:00 GMT", "rss")
+        assert self.scraper._last_date_fmt["rss"] == "%a, %d %b %Y %H:%M:%S GMT"
+
+        dt = self.scraper._parse_date("Wed, 21 Feb 2026 08:30:00 GMT", "rss")
+        assert dt == datetime(2026, 2, 21, 8, 30, tzinfo=timezone.utc)
+        assert "json" not in self.scraper._last_date_fmt
+
+
+# ─── Known-River Matching ───────────────────────────────────
+
+class TestBLMKnownRivers:
+    """Tests for matching tracked river names from the database."""
+
+    def setup_method(self):
+        self.scraper = BLMScraper()
+        self.scraper._get_tracked_rivers = MagicMock(return_value=[
+            SimpleNamespace(name="Payette River"),
+            SimpleNamespace(name="North Fork Payette River"),
+            SimpleNamespace(name="Middle Fork of the Salmon"),
+        ])
+        self.scraper._load_known_rivers()
+
+    def test_returns_exact_db_name(self):
+        name = self.scraper._extract_river_name("middle fork of the salmon closed", "", "")
+        assert name == "Middle Fork of the Salmon"
+
+    def test_longest_name_wins(self):
+        name = self.scraper._extract_river_name("North Fork Payette River flooding", "", "")
+        assert name == "North Fork Payette River"
+
+    def test_falls_back_to_generic_patterns(self):
+        name = self.scraper._extract_river_name("Green River closure", "", "")
+        assert name == "Green River"
+
+    def test_requires_word_boundaries(self):
+        self.scraper._get_tracked_rivers.return_value = [SimpleNamespace(name="Eel")]
+        self.scraper._load_known_rivers()
+        assert self.scraper._extract_river_name("Steelhead run notice", "", "") is None
+
+    @patch("scrapers.blm.SessionLocal")
+    def test_queries_only_id_and_name(self, mock_session_cls):
+        session = MagicMock()
+        mock_session_cls.return_value = session
+        rows = [SimpleNamespace(id="r1", name="Gila River")]
+        session.query.return_value.yield_per.return_value = iter(rows)
+
+        result = BLMScraper()._get_tracked_rivers()
+        assert result == rows
+        args = session.query.call_args.args
+        assert [a.key for a in args] == ["id", "name"]
+        session.query.return_value.yield_per.assert_called_once_with(500)
+        session.close.assert_called_once()
+
+    def test_db_failure_keeps_generic_patterns(self):
+        scraper = BLMScraper()
+        scraper._get_tracked_rivers = MagicMock(side_effect=RuntimeError("db down"))
+        scraper._load_known_rivers()
+        assert scraper._known_rivers_re is None
+        assert scraper._extract_river_name("Green River closure", "", "") == "Green River"
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_scrape_loads_rivers_once(self, mock_sleep):
+        respx.get(f"{settings.blm_base_url}/api/alerts").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx.get(f"{settings.blm_base_url}/rss/alerts.xml").mock(
+            return_value=httpx.Response(200, text="<rss><channel></channel></rss>")
+        )
+        scraper = BLMScraper()
+        scraper._get_tracked_rivers = MagicMock(return_value=[SimpleNamespace(name="Gila River")])
+
+        scraper.scrape()
+        scraper.scrape()
+        scraper._get_tracked_rivers.assert_called_once()
+
+
+# ─── Combined Analysis ──────────────────────────────────────
+
+class TestBLMAnalyze:
+    """Tests for _analyze."""
+
+    def setup_method(self):
+        self.scraper = BLMScraper()
+
+    def test_returns_river_type_and_severity(self):
+        result = self.scraper._analyze("Gunnison River closed", "", "Flooding below the dam.")
+        assert result == ("Gunnison River", "closure", "danger")
+
+    def test_area_only_contributes_to_river_name(self):
+        result = self.scraper._analyze("notice", "Salmon Creek fire area", "")
+        assert result == ("Salmon Creek", "general", "info")
+
+    def test_no_river_returns_none(self):
+        assert self.scraper._analyze("Trail closed", "", "Closed for repairs.") is None
+
+    def test_none_description(self):
+        result = self.scraper._analyze("Green River advisory", "", None)
+        assert result == ("Green River", "general", "warning")
+
+    def test_matches_separate_classifiers(self):
+        title, description = "High water on the Rogue River", "Use caution."
+        river, advisory_type, severity = self.scraper._analyze(title, "", description)
+        assert river == self.scraper._extract_river_name(title, "", description)
+        text_lower = f"{title} {description}".lower()
+        assert advisory_type == self.scraper._classify_advisory_type(text_lower)
+        assert severity == self.scraper._classify_severity(text_lower)
+
+
+class TestFastIso:
+    """Tests for the _fast_iso timestamp formatter."""
+
+    def test_matches_isoformat_for_utc(self):
+        dt = datetime(2026, 3, 5, 7, 8, 9, tzinfo=timezone.utc)
+        assert _fast_iso(dt) == dt.isoformat() == "2026-03-05T07:08:09+00:00"
+
+    def test_keeps_non_utc_offset(self):
+        from datetime import timedelta
+        dt = datetime(2026, 3, 5, 7, 8, 9, tzinfo=timezone(timedelta(hours=-7)))
+        assert _fast_iso(dt) == "2026-03-05T07:08:09-07:00"
+
+    def test_keeps_microseconds(self):
+        dt = datetime(2026, 3, 5, 7, 8, 9, 123456, tzinfo=timezone.utc)
+        assert _fast_iso(dt) == dt.isoformat()
+
+    def test_none(self):
+        assert _fast_iso(None) is None
+
 
 # ─── Alert Parsing ──────────────────────────────────────────
 
@@ -450,10 +619,26 @@ class TestBLMRSSParsing:
         items = self.scraper._parse_rss("not xml at all <><>!!")
         assert items == []
 
+    def test_truncated_feed_keeps_parsed_items(self):
+        """Items before a syntax error should still be returned."""
+        truncated = SAMPLE_RSS_XML[: SAMPLE_RSS_XML.index("<item>", SAMPLE_RSS_XML.index("</item>"))]
+        items = self.scraper._parse_rss(truncated + "<item><title>Broken")
+        assert len(items) == 1
+        assert items[0].data["river_name"] == "Snake River"
+
     def test_empty_xml_returns_empty(self):
         items = self.scraper._parse_rss("<rss><channel></channel></rss>")
         assert items == []
 
+    def test_parses_bytes_in_declared_encoding(self):
+        xml = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            "<rss><channel><item><title>R\u00edo Grande River closed</title></item></channel></rss>"
+        ).encode("latin-1")
+        items = self.scraper._parse_rss(xml)
+        assert len(items) == 1
+        assert items[0].data["title"] == "R\u00edo Grande River closed"
+
     def test_skips_items_without_title(self):
         xml = """\
 <rss version="2.0"><channel>
@@ -480,91 +665,90 @@ class TestBLMFetchAdvisories:
         self.scraper = BLMScraper()
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_parses_list_response(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=SAMPLE_ALERTS_LIST))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert len(items) == 2
         assert items[0].data["river_name"] == "Colorado River"
-        mock_sleep.assert_called()
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_parses_dict_with_alerts_key(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=SAMPLE_ALERTS_DICT))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert len(items) == 1
         assert items[0].data["river_name"] == "Owyhee River"
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_parses_dict_with_results_key(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=SAMPLE_ALERTS_RESULTS_KEY))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert len(items) == 1
         assert items[0].data["river_name"] == "Deschutes River"
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_parses_dict_with_features_key(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=SAMPLE_ALERTS_FEATURES_KEY))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert len(items) == 1
         assert items[0].data["river_name"] == "Rogue River"
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_timeout(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(side_effect=httpx.TimeoutException("timed out"))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_http_500(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(500))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_http_403(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(403))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_non_json_response(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(
             return_value=httpx.Response(200, text="<html>Error Page</html>",
                                         headers={"content-type": "text/html"})
         )
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_empty_alerts_list(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=[]))
 
-        items = self.scraper._fetch_advisories()
+        items = run_fetch(self.scraper._fetch_advisories)
         assert items == []
 
 
@@ -577,32 +761,31 @@ class TestBLMFetchRSSAdvisories:
         self.scraper = BLMScraper()
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_fetches_and_parses_rss(self, mock_sleep):
         url = f"{settings.blm_base_url}/rss/alerts.xml"
         respx.get(url).mock(return_value=httpx.Response(200, text=SAMPLE_RSS_XML))
 
-        items = self.scraper._fetch_rss_advisories()
+        items = run_fetch(self.scraper._fetch_rss_advisories)
         assert len(items) == 1
         assert items[0].data["river_name"] == "Snake River"
-        mock_sleep.assert_called()
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_rss_timeout(self, mock_sleep):
         url = f"{settings.blm_base_url}/rss/alerts.xml"
         respx.get(url).mock(side_effect=httpx.TimeoutException("timeout"))
 
-        items = self.scraper._fetch_rss_advisories()
+        items = run_fetch(self.scraper._fetch_rss_advisories)
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_rss_http_error(self, mock_sleep):
         url = f"{settings.blm_base_url}/rss/alerts.xml"
         respx.get(url).mock(return_value=httpx.Response(404))
 
-        items = self.scraper._fetch_rss_advisories()
+        items = run_fetch(self.scraper._fetch_rss_advisories)
         assert items == []
 
 
@@ -615,22 +798,123 @@ class TestBLMRateLimiting:
         self.scraper = BLMScraper()
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
-    def test_api_sleeps_after_request(self, mock_sleep):
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_burst_does_not_sleep(self, mock_sleep):
+        """API + RSS fit in the bucket's burst, so neither request waits."""
+        respx.get(f"{settings.blm_base_url}/api/alerts").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        respx.get(f"{settings.blm_base_url}/rss/alerts.xml").mock(
+            return_value=httpx.Response(200, text="<rss><channel></channel></rss>")
+        )
+
+        run_fetch(self.scraper._fetch_advisories)
+        run_fetch(self.scraper._fetch_rss_advisories)
+        mock_sleep.assert_not_called()
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_sleeps_once_bucket_is_empty(self, mock_sleep):
         url = f"{settings.blm_base_url}/api/alerts"
         respx.get(url).mock(return_value=httpx.Response(200, json=[]))
 
-        self.scraper._fetch_advisories()
-        mock_sleep.assert_called_with(2.0)
+        for _ in range(3):
+            run_fetch(self.scraper._fetch_advisories)
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args.args[0] <= 2.0
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
-    def test_rss_sleeps_before_request(self, mock_sleep):
-        url = f"{settings.blm_base_url}/rss/alerts.xml"
-        respx.get(url).mock(return_value=httpx.Response(200, text="<rss><channel></channel></rss>"))
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_honours_retry_after(self, mock_sleep):
+        url = f"{settings.blm_base_url}/api/alerts"
+        respx.get(url).mock(
+            return_value=httpx.Response(200, json=[], headers={"Retry-After": "30"})
+        )
+
+        run_fetch(self.scraper._fetch_advisories)
+        run_fetch(self.scraper._fetch_advisories)
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] > 29
+
 
-        self.scraper._fetch_rss_advisories()
-        mock_sleep.assert_called_with(2.0)
+# ─── Conditional GET ────────────────────────────────────────
+
+class TestBLMConditionalGet:
+    """Tests for ETag / Last-Modified handling."""
+
+    def setup_method(self):
+        self.scraper = BLMScraper()
+        self.scraper._validators = ValidatorCache(None)
+        self.rss_url = f"{settings.blm_base_url}/rss/alerts.xml"
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_sends_validators_from_previous_response(self, mock_sleep):
+        route = respx.get(self.rss_url).mock(side_effect=[
+            httpx.Response(200, text=SAMPLE_RSS_XML, headers={
+                "ETag": '"rss-1"', "Last-Modified": "Tue, 20 Feb 2026 12:00:00 GMT",
+            }),
+            httpx.Response(304),
+        ])
+
+        first = run_fetch(self.scraper._fetch_rss_advisories)
+        second = run_fetch(self.scraper._fetch_rss_advisories)
+
+        assert len(first) == 1
+        assert second == []
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"rss-1"'
+        assert route.calls[1].request.headers["If-Modified-Since"] == "Tue, 20 Feb 2026 12:00:00 GMT"
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_api_not_modified_returns_empty(self, mock_sleep, caplog):
+        url = f"{settings.blm_base_url}/api/alerts"
+        respx.get(url).mock(return_value=httpx.Response(304))
+
+        with caplog.at_level("WARNING"):
+            items = run_fetch(self.scraper._fetch_advisories)
+        assert items == []
+        assert "HTTP" not in caplog.text
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_unparseable_rss_does_not_store_validators(self, mock_sleep):
+        route = respx.get(self.rss_url).mock(side_effect=[
+            httpx.Response(200, text="<rss><channel><item>", headers={"ETag": '"rss-1"'}),
+            httpx.Response(200, text=SAMPLE_RSS_XML, headers={"ETag": '"rss-2"'}),
+        ])
+
+        run_fetch(self.scraper._fetch_rss_advisories)
+        second = run_fetch(self.scraper._fetch_rss_advisories)
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert len(second) == 1
+        assert self.scraper._validators.headers_for(self.rss_url) == {"If-None-Match": '"rss-2"'}
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_unparseable_api_does_not_store_validators(self, mock_sleep):
+        url = f"{settings.blm_base_url}/api/alerts"
+        route = respx.get(url).mock(side_effect=[
+            httpx.Response(200, text="{not json", headers={"ETag": '"api-1"'}),
+            httpx.Response(200, json=SAMPLE_ALERTS_LIST),
+        ])
+
+        run_fetch(self.scraper._fetch_advisories)
+        second = run_fetch(self.scraper._fetch_advisories)
+
+        assert "If-None-Match" not in route.calls[1].request.headers
+        assert len(second) > 0
+
+    @respx.mock
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
+    def test_error_response_keeps_validators(self, mock_sleep):
+        self.scraper._validators.update(self.rss_url, {"ETag": '"rss-1"'})
+        respx.get(self.rss_url).mock(return_value=httpx.Response(500, headers={"ETag": '"oops"'}))
+
+        run_fetch(self.scraper._fetch_rss_advisories)
+        assert self.scraper._validators.headers_for(self.rss_url) == {"If-None-Match": '"rss-1"'}
 
 
 # ─── Full Scrape Integration ────────────────────────────────
@@ -640,9 +924,10 @@ class TestBLMScrapeIntegration:
 
     def setup_method(self):
         self.scraper = BLMScraper()
+        self.scraper._get_tracked_rivers = MagicMock(return_value=[])
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_combines_api_and_rss(self, mock_sleep):
         api_url = f"{settings.blm_base_url}/api/alerts"
         rss_url = f"{settings.blm_base_url}/rss/alerts.xml"
@@ -656,7 +941,7 @@ class TestBLMScrapeIntegration:
         assert all(s == "blm" for s in sources)
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_returns_empty_on_total_failure(self, mock_sleep):
         api_url = f"{settings.blm_base_url}/api/alerts"
         rss_url = f"{settings.blm_base_url}/rss/alerts.xml"
@@ -668,7 +953,7 @@ class TestBLMScrapeIntegration:
         assert items == []
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_partial_success(self, mock_sleep):
         """API fails but RSS succeeds — should return RSS items."""
         api_url = f"{settings.blm_base_url}/api/alerts"
@@ -681,7 +966,7 @@ class TestBLMScrapeIntegration:
         assert len(items) == 1
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_all_items_have_river_name(self, mock_sleep):
         api_url = f"{settings.blm_base_url}/api/alerts"
         rss_url = f"{settings.blm_base_url}/rss/alerts.xml"
@@ -694,7 +979,7 @@ class TestBLMScrapeIntegration:
             assert item.data.get("river_name") is not None
 
     @respx.mock
-    @patch("scrapers.blm.time.sleep")
+    @patch("scrapers.blm.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_data_includes_required_fields(self, mock_sleep):
         api_url = f"{settings.blm_base_url}/api/alerts"
         rss_url = f"{settings.blm_base_url}/rss/alerts.xml"
@@ -731,6 +1016,27 @@ class TestBLMEdgeCases:
             for kw in keywords:
                 assert kw == kw.lower()
 
+    def test_severity_table_priorities(self):
+        """Every severity keyword maps to its level's index."""
+        for keyword in SEVERITY_KEYWORDS["danger"]:
+            assert _SEVERITY_TABLE[keyword] == 0
+        for keyword, priority in _SEVERITY_TABLE.items():
+            assert keyword in SEVERITY_KEYWORDS[SEVERITY_LEVELS[priority]]
+
+    def test_non_river_alert_skips_date_parsing(self):
+        alert = {"title": "Trail closed", "start_date": "2026-01-01"}
+        with patch.object(self.scraper, "_parse_date") as parse_date:
+            assert self.scraper._parse_alert(alert) is None
+        parse_date.assert_not_called()
+
+    def test_parse_alert_with_null_attributes(self):
+        """A null 'attributes' value is treated like a missing one."""
+        alert = {"title": "Green River closed", "attributes": None}
+        item = self.scraper._parse_alert(alert)
+        assert item is not None
+        assert item.data["river_name"] == "Green River"
+        assert item.data["start_date"] is None
+
     def test_parse_alert_with_only_attributes(self):
         """Alert with data only in 'attributes' sub-dict."""
         alert = {
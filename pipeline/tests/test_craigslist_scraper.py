@@ -9,24 +9,56 @@ Mocks HTTP responses with sample RSS/HTML and verifies:
 - HTML fallback parsing (_scrape_html_fallback)
 - Deduplication of same URL across feeds
 - Rate limiting delays between requests
+- Concurrent scrape over one shared async client
 - Error handling: HTTP 403, network errors, malformed XML
 """
 
+import asyncio
+
 import httpx
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock, call
+from unittest.mock import AsyncMock, patch, MagicMock, call
+
+from scrapers.base import ScrapedItem
+from scrapers.craigslist import (
+    CraigslistScraper, CATEGORY_MAP, RAFT_KEYWORDS, SEARCH_GROUPS, _parse_date, _search_url,
+)
+
+
+def run(coro):
+    """Run a scraper coroutine to completion."""
+    return asyncio.run(coro)
+
+
+def make_item(url, title="Raft $500", category="raft", region="seattle"):
+    """Build a ScrapedItem as the RSS/HTML parsers return it."""
+    return ScrapedItem(
+        source="craigslist",
+        source_url=url,
+        data={
+            "title": title,
+            "price": None,
+            "url": url,
+            "image_url": None,
+            "description": None,
+            "region": region,
+            "posted_at": None,
+            "category": category,
+        },
+    )
 
-from scrapers.craigslist import CraigslistScraper, CATEGORY_MAP, RAFT_KEYWORDS
+
+def mock_seen_urls(mock_session_cls, urls=()):
+    """Make a patched SessionLocal return ``urls`` as the known deal URLs."""
+    session = mock_session_cls.return_value.__enter__.return_value
+    session.execute.return_value.scalars.return_value = list(urls)
+    return session
 
 
 # ─── Sample RSS XML ────────────────────────────────────────
 
-# NOTE: CraigslistScraper._scrape_rss uses `el.find("tag") or el.find("{ns}tag")`
-# In Python 3.12, ElementTree elements with text but no children evaluate to False,
-# so the `or` falls through.  Standard RSS 2.0 <title>text</title> returns False,
-# causing the or to evaluate the namespaced fallback, which is None for RSS 2.0.
-# Production Craigslist feeds use RDF format, so we test with RDF.
+# Production Craigslist feeds use RDF format, so most tests use RDF.
 
 SAMPLE_RSS_XML = """\
 <?xml version="1.0" encoding="UTF-8"?>
@@ -215,6 +247,25 @@ class TestIsRelevant:
         assert self.scraper._is_relevant("Inflatable boat for river") is True
 
 
+class TestClassify:
+    """Tests for CraigslistScraper._classify()."""
+
+    def setup_method(self):
+        self.scraper = CraigslistScraper()
+
+    def test_irrelevant_returns_none(self):
+        assert self.scraper._classify("Mountain bike for sale", "21 speed") is None
+
+    def test_category_from_description(self):
+        assert self.scraper._classify("Gear lot", "includes a drysuit") == "drysuit"
+
+    def test_relevant_without_category_is_other(self):
+        assert self.scraper._classify("Whitewater gear lot") == "other"
+
+    def test_category_keywords_are_relevance_keywords(self):
+        assert set(CATEGORY_MAP) <= set(RAFT_KEYWORDS)
+
+
 class TestExtractPrice:
     """Tests for CraigslistScraper._extract_price()."""
 
@@ -258,6 +309,75 @@ class TestExtractPrice:
         assert self.scraper._extract_price("$0") == 0.0
 
 
+class TestSearchUrl:
+    """Tests for the _search_url() helper."""
+
+    def test_rss_url_uses_encoded_group(self):
+        url = _search_url("boise", "boa", SEARCH_GROUPS[1], rss=True)
+        assert url == (
+            "https://boise.craigslist.org/search/boa?format=rss"
+            "&query=paddle+OR+oar+OR+PFD+OR+life+jacket"
+        )
+
+    def test_html_url_encodes_ad_hoc_query(self):
+        assert _search_url("seattle", "sga", "throw bag") == (
+            "https://seattle.craigslist.org/search/sga?query=throw+bag"
+        )
+
+
+class TestParseDate:
+    """Tests for the module-level _parse_date helper."""
+
+    def test_rdf_dc_date(self):
+        dt = _parse_date("2026-02-23T14:30:00-07:00")
+        assert dt.isoformat() == "2026-02-23T14:30:00-07:00"
+
+    def test_zulu_suffix(self):
+        assert _parse_date("2026-02-23T21:30:00Z") == datetime(2026, 2, 23, 21, 30, tzinfo=timezone.utc)
+
+    def test_rfc822_pubdate(self):
+        dt = _parse_date("Mon, 23 Feb 2026 14:30:00 -0700")
+        assert dt.isoformat() == "2026-02-23T14:30:00-07:00"
+
+    def test_garbage_returns_none(self):
+        assert _parse_date("last tuesday") is None
+
+
+class TestDropKnown:
+    """Tests for CraigslistScraper._drop_known()."""
+
+    @patch("scrapers.craigslist.SessionLocal")
+    def test_removes_known_urls(self, mock_session_cls):
+        mock_seen_urls(mock_session_cls, ["https://a.example/1"])
+        items = [make_item("https://a.example/1"), make_item("https://a.example/2")]
+        kept = CraigslistScraper()._drop_known(items)
+        assert [i.source_url for i in kept] == ["https://a.example/2"]
+
+    @patch("scrapers.craigslist.SessionLocal")
+    def test_queries_only_candidate_urls(self, mock_session_cls):
+        session = mock_seen_urls(mock_session_cls)
+        CraigslistScraper()._drop_known([make_item("https://a.example/1")])
+
+        stmt = session.execute.call_args.args[0]
+        assert [c.name for c in stmt.selected_columns] == ["url"]
+        assert stmt.whereclause.left.name == "url"
+        assert stmt.whereclause.right.value == ["https://a.example/1"]
+        mock_session_cls.return_value.__exit__.assert_called_once()
+
+    @patch("scrapers.craigslist._URL_BATCH_SIZE", 2)
+    @patch("scrapers.craigslist.SessionLocal")
+    def test_batches_large_candidate_lists(self, mock_session_cls):
+        session = mock_seen_urls(mock_session_cls)
+        items = [make_item(f"https://a.example/{n}") for n in range(5)]
+        assert len(CraigslistScraper()._drop_known(items)) == 5
+        assert session.execute.call_count == 3
+
+    @patch("scrapers.craigslist.SessionLocal")
+    def test_no_items_skips_database(self, mock_session_cls):
+        assert CraigslistScraper()._drop_known([]) == []
+        mock_session_cls.assert_not_called()
+
+
 class TestScrapeRSS:
     """Tests for CraigslistScraper._scrape_rss() with mocked HTTP."""
 
@@ -268,62 +388,70 @@ class TestScrapeRSS:
     def test_parses_standard_rss(self, mock_get_client):
         """Should parse items from a standard RSS 2.0 feed."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
+        mock_resp.headers = {}
         mock_resp.status_code = 200
-        mock_resp.text = SAMPLE_RSS_XML
+        mock_resp.content = SAMPLE_RSS_XML.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
         mock_get_client.return_value = mock_client
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
         assert len(listings) == 2
-        assert listings[0]["title"] == "NRS Otter 140 Raft — $1,200"
-        assert listings[0]["price"] == 1200.0
-        assert "12345" in listings[0]["url"]
-        assert listings[0]["region"] == "seattle"
+        assert listings[0].data["title"] == "NRS Otter 140 Raft — $1,200"
+        assert listings[0].data["price"] == 1200.0
+        assert "12345" in listings[0].data["url"]
+        assert listings[0].data["region"] == "seattle"
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_parses_rdf_format(self, mock_get_client):
         """Should parse items from RDF-format RSS."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS_RDF
+        mock_resp.headers = {}
+        mock_resp.content = SAMPLE_RSS_RDF.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_rss("portland", "boa", "raft", mock_client)
+        listings = run(self.scraper._scrape_rss("portland", "boa", "raft", mock_client))
         assert len(listings) == 1
-        assert listings[0]["title"] == "Inflatable river raft $500"
-        assert listings[0]["price"] == 500.0
+        assert listings[0].data["title"] == "Inflatable river raft $500"
+        assert listings[0].data["price"] == 500.0
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_empty_rss_feed(self, mock_get_client):
-        """Should return empty list if RSS has no items."""
+        """Should return None (triggering the HTML fallback) if RSS has no items."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS_EMPTY
+        mock_resp.headers = {}
+        mock_resp.content = SAMPLE_RSS_EMPTY.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
-        assert listings == []
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert listings is None
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_deduplication_in_rss(self, mock_get_client):
         """Same URL should not appear twice in results."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS_XML
+        mock_resp.headers = {}
+        mock_resp.content = SAMPLE_RSS_XML.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
         # First call populates _seen_urls
-        first = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
+        first = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
         assert len(first) == 2
 
         # Second call with same RSS — should be all duplicates
-        second = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
-        assert len(second) == 0
+        second = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert second is None
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_pre_seen_url_skipped(self, mock_get_client):
@@ -331,48 +459,54 @@ class TestScrapeRSS:
         self.scraper._seen_urls = {"https://seattle.craigslist.org/sga/d/nrs-otter-raft/12345"}
 
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = SAMPLE_RSS_XML
+        mock_resp.headers = {}
+        mock_resp.content = SAMPLE_RSS_XML.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
         # Only the second item should come through
         assert len(listings) == 1
-        assert "12346" in listings[0]["url"]
+        assert "12346" in listings[0].data["url"]
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_handles_http_403_blocked(self, mock_get_client):
         """Should handle 403 Forbidden gracefully (Craigslist blocking)."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         response = httpx.Response(403, text="Forbidden", request=httpx.Request("GET", "https://example.com"))
         mock_client.get.side_effect = httpx.HTTPStatusError(
             "403 Forbidden", request=response.request, response=response
         )
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
-        assert listings == []
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert listings is None
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_handles_network_error(self, mock_get_client):
         """Should handle network errors gracefully."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_client.get.side_effect = httpx.ConnectError("Connection refused")
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
-        assert listings == []
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert listings is None
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_handles_malformed_xml(self, mock_get_client):
         """Should handle malformed XML without crashing."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = MALFORMED_XML
+        mock_resp.headers = {}
+        mock_resp.content = MALFORMED_XML.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
-        assert listings == []
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert listings is None
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_description_truncated_to_2000(self, mock_get_client):
@@ -391,14 +525,148 @@ class TestScrapeRSS:
 </rdf:RDF>
 """
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.headers = {}
+        mock_resp.content = long_rss.encode()
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get.return_value = mock_resp
+
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", mock_client))
+        assert len(listings) == 1
+        assert len(listings[0].data["description"]) == 2000
+
+
+    def test_extracts_image_url_from_description(self):
+        """The first <img src> in the description HTML becomes image_url."""
+        rss = SAMPLE_RSS_RDF.replace(
+            "Good for whitewater trips",
+            '&lt;img class="thumb" src="https://images.craigslist.org/raft.jpg"&gt; Good for whitewater trips',
+        )
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
-        mock_resp.text = long_rss
+        mock_resp.headers = {}
+        mock_resp.content = rss.encode()
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_rss("seattle", "sga", "raft", mock_client)
+        listings = run(self.scraper._scrape_rss("portland", "boa", "raft", mock_client))
+        assert listings[0].data["image_url"] == "https://images.craigslist.org/raft.jpg"
+        assert listings[0].data["description"] == "Good for whitewater trips"
+
+
+    def _rss_client(self, body: str):
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.headers = {}
+        mock_resp.content = body.encode()
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get.return_value = mock_resp
+        return mock_client
+
+    def test_parses_rss2_feed(self):
+        rss = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item>
+    <title>Hyside raft $2,000</title>
+    <link>https://boise.craigslist.org/boa/d/hyside/1</link>
+    <description>Self-bailer</description>
+    <pubDate>Mon, 23 Feb 2026 14:30:00 -0700</pubDate>
+  </item>
+</channel></rss>"""
+        listings = run(self.scraper._scrape_rss("boise", "boa", "raft", self._rss_client(rss)))
+        assert len(listings) == 1
+        assert listings[0].data["price"] == 2000.0
+        assert listings[0].data["posted_at"].year == 2026
+
+    def test_item_children_with_comments_and_unknown_tags(self):
+        rss = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item>
+    <!-- sponsored -->
+    <guid>abc123</guid>
+    <title>NRS paddle $80</title>
+    <link>https://boise.craigslist.org/spo/d/paddle/2</link>
+  </item>
+</channel></rss>"""
+        listings = run(self.scraper._scrape_rss("boise", "spo", "paddle", self._rss_client(rss)))
         assert len(listings) == 1
-        assert len(listings[0]["description"]) == 2000
+        assert listings[0].data["title"] == "NRS paddle $80"
+        assert listings[0].data["description"] is None
+        assert listings[0].data["posted_at"] is None
+
+    def test_request_sends_rotated_user_agent(self):
+        from scrapers.craigslist import USER_AGENTS
+        client = self._rss_client(SAMPLE_RSS_XML)
+        run(self.scraper._scrape_rss("seattle", "sga", "raft", client))
+        headers = client.get.call_args.kwargs["headers"]
+        assert headers["User-Agent"] in USER_AGENTS
+
+    def test_filters_irrelevant_listings(self):
+        """Irrelevant listings are dropped; the rest are categorized items."""
+        rss = SAMPLE_RSS_RDF.replace(
+            "</rdf:RDF>",
+            """  <item>
+    <title>Mountain bike $500</title>
+    <link>https://portland.craigslist.org/boa/d/bike/333</link>
+    <description>Great mountain bike</description>
+  </item>
+</rdf:RDF>""",
+        )
+        items = run(self.scraper._scrape_rss("portland", "boa", "raft", self._rss_client(rss)))
+        assert len(items) == 1
+        assert items[0].source == "craigslist"
+        assert items[0].source_url == "https://portland.craigslist.org/boa/d/inflatable-boat/99999"
+        assert items[0].data["category"] == "raft"
+        assert "https://portland.craigslist.org/boa/d/bike/333" in self.scraper._seen_urls
+
+    def test_items_share_one_scrape_timestamp(self):
+        items = run(self.scraper._scrape_rss("seattle", "sga", "raft", self._rss_client(SAMPLE_RSS_XML)))
+        assert len(items) == 2
+        assert items[0].scraped_at is items[1].scraped_at
+        assert items[0].scraped_at.tzinfo is timezone.utc
+
+    def test_only_irrelevant_listings_returns_empty_not_none(self):
+        """A feed whose listings are all irrelevant must not trigger the HTML fallback."""
+        rss = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <item>
+    <title>Mountain bike $500</title>
+    <link>https://boise.craigslist.org/bik/d/bike/1</link>
+  </item>
+</channel></rss>"""
+        items = run(self.scraper._scrape_rss("boise", "sga", "raft", self._rss_client(rss)))
+        assert items == []
+
+    def test_feed_parsed_off_the_event_loop(self):
+        """The feed body is handed to _parse_rss_feed via asyncio.to_thread."""
+        client = self._rss_client(SAMPLE_RSS_XML)
+        with patch("scrapers.craigslist.asyncio.to_thread", new_callable=AsyncMock) as to_thread:
+            to_thread.return_value = []
+            run(self.scraper._scrape_rss("seattle", "sga", "raft", client))
+        to_thread.assert_awaited_once_with(
+            self.scraper._parse_rss_feed, SAMPLE_RSS_XML.encode(), "seattle", "sga"
+        )
+
+    def test_claim_url_only_once(self):
+        assert self.scraper._claim_url("https://a.example/1") is True
+        assert self.scraper._claim_url("https://a.example/1") is False
+
+    def test_recovers_items_past_malformed_markup(self, caplog):
+        # &nbsp; is undefined in XML, so strict parsing would stop here
+        rss = SAMPLE_RSS_XML.replace(
+            "Kayak paddle set — $75</title>", "Kayak paddle set — $75 &nbsp;</title>"
+        )
+        items = run(self.scraper._scrape_rss("seattle", "sga", "raft", self._rss_client(rss)))
+        assert len(items) == 2
+        assert "Recovered malformed RSS" in caplog.text
+
+    def test_truncated_feed_keeps_parsed_items(self):
+        truncated = SAMPLE_RSS_XML.split("</rdf:RDF>")[0] + "<item><title>Broken"
+        listings = run(self.scraper._scrape_rss("seattle", "sga", "raft", self._rss_client(truncated)))
+        assert len(listings) == 2
 
 
 class TestScrapeHTMLFallback:
@@ -411,42 +679,48 @@ class TestScrapeHTMLFallback:
     def test_parses_modern_html(self, mock_get_client):
         """Should parse cl-static-search-result items."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
+        mock_resp.headers = {}
         mock_resp.text = SAMPLE_HTML
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client)
+        listings = run(self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client))
         # The item with no href should be skipped
         assert len(listings) == 2
-        assert listings[0]["title"] == "Kokatat Drysuit — $450"
-        assert listings[0]["price"] == 450.0
-        assert listings[0]["region"] == "seattle"
+        assert listings[0].data["title"] == "Kokatat Drysuit — $450"
+        assert listings[0].data["price"] == 450.0
+        assert listings[0].data["region"] == "seattle"
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_parses_legacy_result_row_html(self, mock_get_client):
         """Should parse legacy result-row format."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
+        mock_resp.headers = {}
         mock_resp.text = SAMPLE_HTML_LEGACY
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_html_fallback("denver", "boa", "paddle", mock_client)
+        listings = run(self.scraper._scrape_html_fallback("denver", "boa", "paddle", mock_client))
         assert len(listings) == 1
-        assert listings[0]["price"] == 300.0
+        assert listings[0].data["price"] == 300.0
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_relative_url_made_absolute(self, mock_get_client):
         """Relative hrefs should be expanded to absolute URLs."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
+        mock_resp.headers = {}
         mock_resp.text = SAMPLE_HTML
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client)
-        assert listings[0]["url"].startswith("https://seattle.craigslist.org/")
+        listings = run(self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client))
+        assert listings[0].data["url"].startswith("https://seattle.craigslist.org/")
 
     @patch.object(CraigslistScraper, "_get_client")
     def test_deduplication_in_html(self, mock_get_client):
@@ -454,22 +728,54 @@ class TestScrapeHTMLFallback:
         self.scraper._seen_urls = {"https://seattle.craigslist.org/sga/d/drysuit-kokatat/55555"}
 
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_resp = MagicMock()
+        mock_resp.headers = {}
         mock_resp.text = SAMPLE_HTML
         mock_resp.raise_for_status = MagicMock()
         mock_client.get.return_value = mock_resp
 
-        listings = self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client)
-        urls = [l["url"] for l in listings]
+        listings = run(self.scraper._scrape_html_fallback("seattle", "sga", "drysuit", mock_client))
+        urls = [l.data["url"] for l in listings]
         assert "https://seattle.craigslist.org/sga/d/drysuit-kokatat/55555" not in urls
 
+    def test_empty_page_returns_empty(self):
+        """An empty HTML body is logged and skipped rather than raising."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.headers = {}
+        mock_resp.text = ""
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get.return_value = mock_resp
+
+        listings = run(self.scraper._scrape_html_fallback("seattle", "sga", "raft", mock_client))
+        assert listings == []
+
+    def test_price_prefers_priceinfo_span(self):
+        html = SAMPLE_HTML_LEGACY.replace(
+            '<span class="result-price">$300</span>',
+            '<span class="result-price">$300</span><span class="priceinfo">$250</span>',
+        )
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+        mock_resp = MagicMock()
+        mock_resp.headers = {}
+        mock_resp.text = html
+        mock_resp.raise_for_status = MagicMock()
+        mock_client.get.return_value = mock_resp
+
+        listings = run(self.scraper._scrape_html_fallback("denver", "boa", "paddle", mock_client))
+        assert listings[0].data["price"] == 250.0
+
     @patch.object(CraigslistScraper, "_get_client")
     def test_handles_http_error(self, mock_get_client):
         """Should handle HTTP errors in HTML fallback."""
         mock_client = MagicMock()
+        mock_client.get = AsyncMock()
         mock_client.get.side_effect = httpx.ConnectError("Connection refused")
 
-        listings = self.scraper._scrape_html_fallback("seattle", "sga", "raft", mock_client)
+        listings = run(self.scraper._scrape_html_fallback("seattle", "sga", "raft", mock_client))
         assert listings == []
 
 
@@ -479,97 +785,88 @@ class TestScrapeIntegration:
     def setup_method(self):
         self.scraper = CraigslistScraper()
 
-    @patch("time.sleep")
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
+    def test_rate_limits_each_region_host_separately(self, mock_sleep):
+        """Each Craigslist subdomain has its own token bucket."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=MagicMock(headers={}))
+        seattle = "https://seattle.craigslist.org/search/sga"
+        portland = "https://portland.craigslist.org/search/sga"
+
+        async def fetch_all():
+            for url in (seattle, seattle, portland, seattle):
+                await self.scraper._get(mock_client, url)
+
+        run(fetch_all())
+
+        assert set(self.scraper._rate_limiters) == {
+            "seattle.craigslist.org", "portland.craigslist.org",
+        }
+        # Only the third Seattle request exceeds that host's burst
+        assert mock_sleep.await_count == 1
+
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
+    def test_server_rate_limit_headers_slow_the_host(self, mock_sleep):
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=MagicMock(headers={"Retry-After": "30"}))
+        url = "https://seattle.craigslist.org/search/sga"
+
+        run(self.scraper._get(mock_client, url))
+        run(self.scraper._get(mock_client, url))
+
+        assert mock_sleep.await_args.args[0] > 25
+
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.craigslist.SessionLocal")
     @patch.object(CraigslistScraper, "_scrape_rss")
     @patch.object(CraigslistScraper, "_scrape_html_fallback")
-    def test_rate_limiting_sleeps_called(self, mock_html, mock_rss, mock_session_cls, mock_sleep):
-        """Should call time.sleep between requests for rate limiting."""
-        mock_session = MagicMock()
-        mock_session_cls.return_value = mock_session
-        mock_session.query.return_value.all.return_value = []
-
-        # RSS returns results, so HTML fallback shouldn't be called
-        mock_rss.return_value = [{
-            "title": "Raft $500",
-            "price": 500.0,
-            "url": "https://seattle.craigslist.org/sga/d/raft/111",
-            "image_url": None,
-            "description": "Whitewater raft",
-            "region": "seattle",
-            "posted_at": None,
-        }]
-        mock_html.return_value = []
+    def test_falls_back_to_html_when_rss_empty(self, mock_html, mock_rss, mock_session_cls, mock_sleep):
+        """Should try HTML fallback when RSS returns no listings."""
+        mock_seen_urls(mock_session_cls)
+
+        mock_rss.return_value = None
+        mock_html.return_value = [
+            make_item("https://seattle.craigslist.org/sga/d/kayak/222", "Kayak $400", "kayak")
+        ]
 
         with patch.object(self.scraper, "_get_client") as mock_gc:
             mock_client = MagicMock()
             mock_gc.return_value = mock_client
             with patch("scrapers.craigslist.settings") as mock_settings:
                 mock_settings.craigslist_regions = ["seattle"]
-                mock_settings.rate_limit_delay = 0.01
-                self.scraper.scrape()
+                mock_settings.rate_limit_delay = 0.0
+                items = self.scraper.scrape()
 
-        assert mock_sleep.call_count > 0
+        assert mock_html.call_count > 0
+        assert items[0].data["category"] == "kayak"
 
-    @patch("time.sleep")
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.craigslist.SessionLocal")
     @patch.object(CraigslistScraper, "_scrape_rss")
     @patch.object(CraigslistScraper, "_scrape_html_fallback")
-    def test_falls_back_to_html_when_rss_empty(self, mock_html, mock_rss, mock_session_cls, mock_sleep):
-        """Should try HTML fallback when RSS returns no listings."""
-        mock_session = MagicMock()
-        mock_session_cls.return_value = mock_session
-        mock_session.query.return_value.all.return_value = []
-
+    def test_no_html_fallback_when_rss_items_filtered(self, mock_html, mock_rss, mock_session_cls, mock_sleep):
+        """A feed that parsed but held nothing relevant does not refetch as HTML."""
+        mock_seen_urls(mock_session_cls)
         mock_rss.return_value = []
-        mock_html.return_value = [{
-            "title": "Kayak $400",
-            "price": 400.0,
-            "url": "https://seattle.craigslist.org/sga/d/kayak/222",
-            "image_url": None,
-            "description": "Whitewater kayak",
-            "region": "seattle",
-            "posted_at": None,
-        }]
 
         with patch.object(self.scraper, "_get_client") as mock_gc:
-            mock_client = MagicMock()
-            mock_gc.return_value = mock_client
+            mock_gc.return_value = MagicMock()
             with patch("scrapers.craigslist.settings") as mock_settings:
                 mock_settings.craigslist_regions = ["seattle"]
                 mock_settings.rate_limit_delay = 0.0
-                items = self.scraper.scrape()
+                assert self.scraper.scrape() == []
 
-        assert mock_html.call_count > 0
+        mock_html.assert_not_called()
 
-    @patch("time.sleep")
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.craigslist.SessionLocal")
     @patch.object(CraigslistScraper, "_scrape_rss")
-    def test_filters_irrelevant_listings(self, mock_rss, mock_session_cls, mock_sleep):
-        """Irrelevant listings should be dropped."""
-        mock_session = MagicMock()
-        mock_session_cls.return_value = mock_session
-        mock_session.query.return_value.all.return_value = []
+    def test_scrape_items_have_correct_source(self, mock_rss, mock_session_cls, mock_sleep):
+        """ScrapedItems should have source='craigslist'."""
+        mock_seen_urls(mock_session_cls)
 
         mock_rss.return_value = [
-            {
-                "title": "Mountain bike",
-                "price": 500.0,
-                "url": "https://seattle.craigslist.org/sga/d/bike/333",
-                "image_url": None,
-                "description": "Great mountain bike",
-                "region": "seattle",
-                "posted_at": None,
-            },
-            {
-                "title": "NRS Raft $1200",
-                "price": 1200.0,
-                "url": "https://seattle.craigslist.org/sga/d/raft/334",
-                "image_url": None,
-                "description": "Whitewater raft",
-                "region": "seattle",
-                "posted_at": None,
-            },
+            make_item("https://seattle.craigslist.org/sga/d/paddle/444", "Kayak paddle $75", "paddle")
         ]
 
         with patch.object(self.scraper, "_get_client") as mock_gc:
@@ -580,36 +877,66 @@ class TestScrapeIntegration:
                 mock_settings.rate_limit_delay = 0.0
                 items = self.scraper.scrape()
 
-        # Only the raft listing should pass relevance filter
-        raft_items = [i for i in items if "raft" in i.data["title"].lower()]
-        assert len(raft_items) >= 1
+        for item in items:
+            assert item.source == "craigslist"
 
-    @patch("time.sleep")
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.craigslist.SessionLocal")
     @patch.object(CraigslistScraper, "_scrape_rss")
-    def test_scrape_items_have_correct_source(self, mock_rss, mock_session_cls, mock_sleep):
-        """ScrapedItems should have source='craigslist'."""
-        mock_session = MagicMock()
-        mock_session_cls.return_value = mock_session
-        mock_session.query.return_value.all.return_value = []
-
-        mock_rss.return_value = [{
-            "title": "Kayak paddle $75",
-            "price": 75.0,
-            "url": "https://seattle.craigslist.org/sga/d/paddle/444",
-            "image_url": None,
-            "description": "Carbon kayak paddle",
-            "region": "seattle",
-            "posted_at": None,
-        }]
+    def test_known_deal_urls_dropped_after_scrape(self, mock_rss, mock_session_cls, mock_sleep):
+        """Listings already stored as deals are removed from the results."""
+        known = "https://seattle.craigslist.org/sga/d/raft/111"
+        mock_seen_urls(mock_session_cls, [known])
+        mock_rss.side_effect = lambda region, cat, query, client: [
+            make_item(known), make_item(f"https://seattle.craigslist.org/{cat}/{query[:4]}")
+        ]
 
         with patch.object(self.scraper, "_get_client") as mock_gc:
-            mock_client = MagicMock()
-            mock_gc.return_value = mock_client
+            mock_gc.return_value = MagicMock()
             with patch("scrapers.craigslist.settings") as mock_settings:
                 mock_settings.craigslist_regions = ["seattle"]
                 mock_settings.rate_limit_delay = 0.0
                 items = self.scraper.scrape()
 
-        for item in items:
-            assert item.source == "craigslist"
+        assert known not in {i.source_url for i in items}
+        assert len(items) == 2 * 4
+
+    @patch("scrapers.craigslist.asyncio.sleep", new_callable=AsyncMock)
+    @patch("scrapers.craigslist.SessionLocal")
+    def test_searches_run_concurrently_within_cap(self, mock_session_cls, mock_sleep):
+        """All region/category/query searches share one client and the semaphore cap."""
+        mock_seen_urls(mock_session_cls)
+
+        in_flight = 0
+        peak = 0
+        calls = []
+
+        async def fake_get(url, headers):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            calls.append(url)
+            n = len(calls)
+            # Yield to the loop (asyncio.sleep itself is patched out)
+            loop = asyncio.get_running_loop()
+            tick = loop.create_future()
+            loop.call_soon(tick.set_result, None)
+            await tick
+            in_flight -= 1
+            feed = f"""<rss><channel><item>
+<title>Raft $500</title><link>https://cl.example/{n}</link>
+</item></channel></rss>"""
+            return MagicMock(headers={}, content=feed.encode())
+
+        client = MagicMock()
+        client.get = fake_get
+        with patch.object(self.scraper, "_get_client") as mock_gc, \
+                patch("scrapers.craigslist.settings") as mock_settings:
+            mock_gc.return_value.__aenter__.return_value = client
+            mock_settings.craigslist_regions = ["seattle", "portland", "boise"]
+            items = self.scraper.scrape()
+
+        assert mock_gc.call_count == 1
+        assert len(calls) == 3 * 2 * 4
+        assert 1 < peak <= self.scraper._max_concurrency
+        assert [i.data["region"] for i in items[:8]] == ["seattle"] * 8
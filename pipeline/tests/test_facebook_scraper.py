@@ -13,13 +13,15 @@ Mocks HTTP responses with respx and verifies:
 - scrape() integration: Graph API path and public path
 """
 
+import asyncio
+
 import httpx
 import respx
 import pytest
 import time
 import json
 from datetime import datetime, timezone, timedelta
-from unittest.mock import patch, MagicMock, PropertyMock
+from unittest.mock import AsyncMock, patch, MagicMock, PropertyMock
 
 from scrapers.facebook import (
     FacebookScraper,
@@ -34,6 +36,21 @@ from scrapers.base import BaseScraper, ScrapedItem
 from config.settings import settings
 
 
+def run(coro):
+    """Run a scraper coroutine to completion."""
+    return asyncio.run(coro)
+
+
+@pytest.fixture(autouse=True)
+def _clear_river_cache():
+    """The river cache is class-level; keep tests from sharing it."""
+    FacebookScraper._river_cache_entry = None
+    FacebookScraper._river_automaton = None
+    FacebookScraper._river_automaton_source = None
+    yield
+    FacebookScraper._river_cache_entry = None
+
+
 # ─── Dynamic timestamp helpers ──────────────────────────────
 
 def _recent_ts(hours_ago: int = 1) -> str:
@@ -166,7 +183,7 @@ class TestFacebookScraperInit:
 
     def test_has_http_client(self):
         scraper = FacebookScraper()
-        assert isinstance(scraper._client, httpx.Client)
+        assert isinstance(scraper._client, httpx.AsyncClient)
 
     def test_rate_limit_delay_from_settings(self):
         scraper = FacebookScraper()
@@ -177,6 +194,10 @@ class TestFacebookScraperInit:
         ua = scraper._client.headers.get("User-Agent", "")
         assert "Mobile" in ua
 
+    def test_client_uses_http2_transport(self):
+        scraper = FacebookScraper()
+        assert scraper._client._transport._pool._http2 is True
+
     def test_client_follows_redirects(self):
         scraper = FacebookScraper()
         assert scraper._client.follow_redirects is True
@@ -252,6 +273,32 @@ class TestFacebookConditionClassification:
         result = self.scraper._classify_condition("Great flow for kayaking.")
         assert "water_temp" not in result
 
+    def test_uses_supplied_lowercase_text(self):
+        text = "Conditions are EXCELLENT!"
+        result = self.scraper._classify_condition(text, text.lower())
+        assert result["quality"] == "excellent"
+
+    # ── Combined metric scan ──
+
+    def test_skips_metric_scan_without_hint_tokens(self):
+        with patch("scrapers.facebook._METRICS_RE") as metrics_re:
+            result = self.scraper._classify_condition("Great day, 900 people showed up!")
+        metrics_re.finditer.assert_not_called()
+        assert "flow_rate" not in result
+
+    def test_extracts_all_metrics_from_one_post(self):
+        result = self.scraper._classify_condition(
+            "Flow at 2,400 cfs, stage: 5.1 ft, water temp: 48F."
+        )
+        assert result["flow_rate"] == 2400.0
+        assert result["gauge_height"] == 5.1
+        assert result["water_temp"] == 48.0
+
+    def test_earlier_pattern_wins_over_earlier_text(self):
+        # "flow: 900" comes first in the text, but the cfs pattern is listed first
+        result = self.scraper._classify_condition("Flow: 900 earlier, now 1200 cfs.")
+        assert result["flow_rate"] == 1200.0
+
     # ── Quality classification ──
 
     def test_quality_excellent(self):
@@ -283,6 +330,11 @@ class TestFacebookConditionClassification:
         result = self.scraper._classify_condition("Excellent conditions but a bit dangerous near the dam.")
         assert result["quality"] == "excellent"
 
+    def test_later_category_keyword_earlier_in_text(self):
+        """Precedence follows CONDITION_KEYWORDS order, not position in the text."""
+        result = self.scraper._classify_condition("Low and bony, but the scenery was amazing.")
+        assert result["quality"] == "excellent"
+
     # ── Combined extraction ──
 
     def test_extracts_all_fields(self):
@@ -345,6 +397,12 @@ class TestFacebookTimestampParsing:
         expected = datetime.now(timezone.utc) - timedelta(days=3)
         assert abs((dt - expected).total_seconds()) < 5
 
+    def test_relative_time_inside_longer_text(self):
+        dt = self.scraper._parse_timestamp("Posted 5 MINS AGO · Public")
+        assert dt is not None
+        expected = datetime.now(timezone.utc) - timedelta(minutes=5)
+        assert abs((dt - expected).total_seconds()) < 5
+
     def test_yesterday(self):
         dt = self.scraper._parse_timestamp("yesterday")
         assert dt is not None
@@ -492,6 +550,49 @@ class TestFacebookRiverMentionDetection:
         )
         assert len(items[0].data["links"]) == 5
 
+    def test_same_name_in_two_states_matches_both(self):
+        self.scraper._river_cache = MOCK_RIVERS + [
+            {"id": "river-4", "name": "Salmon River", "state": "OR", "region": "Northwest"},
+        ]
+        items = self.scraper._extract_river_mentions(
+            text="Salmon River is up.",
+            author="Author", source_url="https://fb.com/x",
+            images=[], links=[], timestamp=None,
+        )
+        assert {i.data["river_id"] for i in items} == {"river-2", "river-4"}
+
+    def test_only_scans_head_of_long_posts(self):
+        text = "Colorado River at 900 cfs. " + "x " * 1500 + "Salmon River at 50 cfs."
+        items = self.scraper._extract_river_mentions(
+            text=text,
+            author="Test User",
+            source_url="https://fb.com/post/10",
+            images=[], links=[], timestamp=None,
+        )
+        assert [i.data["river_name"] for i in items] == ["Colorado River"]
+        assert items[0].data["flow_rate"] == 900.0
+        assert len(items[0].data["post_text"]) == 1000
+
+    def test_classifies_post_once_for_multiple_rivers(self):
+        with patch.object(
+            self.scraper, "_classify_condition", wraps=self.scraper._classify_condition
+        ) as classify:
+            items = self.scraper._extract_river_mentions(
+                text="Colorado River and Salmon River both at 900 cfs.",
+                author="Test User",
+                source_url="https://fb.com/post/9",
+                images=[], links=[], timestamp=None,
+            )
+        assert len(items) == 2
+        classify.assert_called_once()
+        assert all(i.data["flow_rate"] == 900.0 for i in items)
+        assert items[0].scraped_at == items[1].scraped_at
+
+    def test_river_automaton_reused_until_cache_changes(self):
+        first = self.scraper._get_river_automaton(MOCK_RIVERS)
+        assert self.scraper._get_river_automaton(MOCK_RIVERS) is first
+        assert self.scraper._get_river_automaton(list(MOCK_RIVERS)) is not first
+
     def test_empty_rivers_cache_returns_empty(self):
         self.scraper._river_cache = []
         items = self.scraper._extract_river_mentions(
@@ -543,6 +644,24 @@ class TestFacebookPostParsing:
         items = self.scraper._parse_posts(SAMPLE_GRAPH_OLD_POST["data"], "testpage")
         assert len(items) == 0
 
+    def test_skips_old_utc_posts_without_parsing(self):
+        with patch.object(self.scraper, "_parse_timestamp") as parse:
+            items = self.scraper._parse_posts(SAMPLE_GRAPH_OLD_POST["data"], "testpage")
+        assert items == []
+        parse.assert_not_called()
+
+    def test_skips_old_posts_with_other_offsets(self):
+        old = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
+        recent = (datetime.now(timezone.utc) - timedelta(hours=1)).astimezone(
+            timezone(timedelta(hours=-7))
+        ).isoformat()
+        posts = [
+            {"id": "1", "message": "Colorado River is up.", "created_time": old},
+            {"id": "2", "message": "Salmon River is up.", "created_time": recent},
+        ]
+        items = self.scraper._parse_posts(posts, "testpage")
+        assert [i.data["river_name"] for i in items] == ["Salmon River"]
+
     def test_extracts_author_name(self):
         items = self.scraper._parse_posts(SAMPLE_GRAPH_RESPONSE["data"], "testpage")
         colorado_item = [i for i in items if i.data["river_name"] == "Colorado River"][0]
@@ -600,15 +719,22 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(200, json=SAMPLE_GRAPH_RESPONSE)
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert len(items) == 2
 
+    @respx.mock
+    def test_malformed_json_returns_empty(self):
+        respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
+            return_value=httpx.Response(200, content=b"{not json")
+        )
+        assert run(self.scraper._fetch_page_posts_api("testpage")) == []
+
     @respx.mock
     def test_includes_access_token_in_params(self):
         route = respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(200, json=SAMPLE_GRAPH_EMPTY)
         )
-        self.scraper._fetch_page_posts_api("testpage")
+        run(self.scraper._fetch_page_posts_api("testpage"))
         assert route.called
         request = route.calls[0].request
         assert "access_token=test-token" in str(request.url)
@@ -618,7 +744,7 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(401, json={"error": {"message": "Expired token"}})
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
 
     @respx.mock
@@ -626,16 +752,16 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(403, json={"error": {"message": "Invalid token"}})
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_429_rate_limit(self, mock_sleep):
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(429, headers={"Retry-After": "30"})
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
         mock_sleep.assert_called()
 
@@ -644,7 +770,7 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
 
     @respx.mock
@@ -652,7 +778,7 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             return_value=httpx.Response(500)
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
 
     @respx.mock
@@ -660,7 +786,7 @@ class TestFacebookGraphAPIFetching:
         respx.get("https://graph.facebook.com/v19.0/testpage/posts").mock(
             side_effect=RuntimeError("something broke")
         )
-        items = self.scraper._fetch_page_posts_api("testpage")
+        items = run(self.scraper._fetch_page_posts_api("testpage"))
         assert items == []
 
 
@@ -678,7 +804,7 @@ class TestFacebookPublicPageScraping:
         respx.get("https://m.facebook.com/testpage").mock(
             return_value=httpx.Response(200, text=SAMPLE_HTML_PAGE)
         )
-        items = self.scraper._fetch_page_public("testpage")
+        items = run(self.scraper._fetch_page_public("testpage"))
         # Should find Green River and/or Colorado River mentions
         assert len(items) >= 1
 
@@ -687,7 +813,7 @@ class TestFacebookPublicPageScraping:
         respx.get("https://m.facebook.com/testpage").mock(
             return_value=httpx.Response(404)
         )
-        items = self.scraper._fetch_page_public("testpage")
+        items = run(self.scraper._fetch_page_public("testpage"))
         assert items == []
 
     @respx.mock
@@ -695,7 +821,7 @@ class TestFacebookPublicPageScraping:
         respx.get("https://m.facebook.com/testpage").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        items = self.scraper._fetch_page_public("testpage")
+        items = run(self.scraper._fetch_page_public("testpage"))
         assert items == []
 
     @respx.mock
@@ -703,7 +829,7 @@ class TestFacebookPublicPageScraping:
         respx.get("https://m.facebook.com/testpage").mock(
             return_value=httpx.Response(503)
         )
-        items = self.scraper._fetch_page_public("testpage")
+        items = run(self.scraper._fetch_page_public("testpage"))
         assert items == []
 
     @respx.mock
@@ -711,21 +837,88 @@ class TestFacebookPublicPageScraping:
         respx.get("https://m.facebook.com/testpage").mock(
             return_value=httpx.Response(200, text=SAMPLE_HTML_EMPTY)
         )
-        items = self.scraper._fetch_page_public("testpage")
+        items = run(self.scraper._fetch_page_public("testpage"))
         assert items == []
 
+    def test_parse_post_html_empty_body_returns_none(self):
+        assert self.scraper._parse_post_html("") is None
+
+    @respx.mock
+    def test_decodes_page_with_header_charset(self):
+        """A UTF-8 page without <meta charset> must not be read as latin-1."""
+        self.scraper._river_cache = MOCK_RIVERS + [
+            {"id": "river-4", "name": "Río Grande", "state": "NM", "region": "Southwest"},
+        ]
+        html = '<html><body><div data-ft="1"><p>Café on the Río Grande — 500 cfs and 62°F water</p></div></body></html>'
+        respx.get("https://m.facebook.com/testpage").mock(
+            return_value=httpx.Response(
+                200,
+                content=html.encode("utf-8"),
+                headers={"Content-Type": "text/html; charset=utf-8"},
+            )
+        )
+        [item] = run(self.scraper._fetch_page_public("testpage"))
+        assert item.data["river_name"] == "Río Grande"
+        assert item.data["post_text"] == "Café on the Río Grande — 500 cfs and 62°F water"
+        assert item.data["water_temp"] == 62.0
+
+    @respx.mock
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
+    def test_retry_after_pauses_host_bucket(self, mock_sleep):
+        respx.get("https://m.facebook.com/testpage").mock(side_effect=[
+            httpx.Response(429, headers={"Retry-After": "30"}),
+            httpx.Response(200, text=SAMPLE_HTML_PAGE),
+        ])
+        run(self.scraper._fetch_page_public("testpage"))
+        mock_sleep.assert_not_awaited()
+        run(self.scraper._fetch_page_public("testpage"))
+        mock_sleep.assert_awaited_once()
+        assert mock_sleep.await_args.args[0] > 29
+
+    @respx.mock
+    def test_empty_response_body_returns_empty(self):
+        respx.get("https://m.facebook.com/testpage").mock(
+            return_value=httpx.Response(200, content=b"")
+        )
+        assert run(self.scraper._fetch_page_public("testpage")) == []
+
+    def test_extract_posts_caps_images_and_links(self):
+        imgs = "".join(f'<img src="https://example.com/{i}.jpg"/>' for i in range(8))
+        anchors = "".join(f'<a href="https://example.com/r{i}">r</a>' for i in range(8))
+        html = f'<div data-ft="1"><p>Green River.</p><img src="https://x.com/static/a.png"/>{imgs}{anchors}</div>'
+        doc = self.scraper._parse_post_html(html)
+        [item] = self.scraper._extract_posts_from_html(doc, "page")
+        assert item.data["images"] == [f"https://example.com/{i}.jpg" for i in range(5)]
+        assert item.data["links"] == [f"https://example.com/r{i}" for i in range(5)]
+
+    def test_extract_posts_falls_back_to_articles(self):
+        html = "<html><body><article><p>Green River is running.</p></article></body></html>"
+        doc = self.scraper._parse_post_html(html)
+        items = self.scraper._extract_posts_from_html(doc, "page")
+        assert [i.data["river_name"] for i in items] == ["Green River"]
+
+    def test_extract_posts_reads_story_text_author_and_permalink(self):
+        html = """<div data-ft="1"><h3><strong> Rafter </strong></h3>
+        <div class="x story_body y"><p>Green River:</p> <span>900 cfs</span></div>
+        <a href="/story.php?id=9">Full story</a>
+        <a href="https://example.com/r">Report</a><a href="https://facebook.com/x">FB</a></div>"""
+        doc = self.scraper._parse_post_html(html)
+        [item] = self.scraper._extract_posts_from_html(doc, "page")
+        assert item.data["post_text"] == "Green River:900 cfs"
+        assert item.data["author"] == "Rafter"
+        assert item.source_url == "https://m.facebook.com/story.php?id=9"
+        assert item.data["links"] == ["https://example.com/r"]
+
     def test_extract_posts_ignores_empty_text(self):
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(SAMPLE_HTML_PAGE, "html.parser")
-        items = self.scraper._extract_posts_from_html(soup, "testpage")
+        doc = self.scraper._parse_post_html(SAMPLE_HTML_PAGE)
+        items = self.scraper._extract_posts_from_html(doc, "testpage")
         # All items should have non-empty text
         for item in items:
             assert item.data["post_text"]
 
     def test_extract_posts_gets_author(self):
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(SAMPLE_HTML_PAGE, "html.parser")
-        items = self.scraper._extract_posts_from_html(soup, "testpage")
+        doc = self.scraper._parse_post_html(SAMPLE_HTML_PAGE)
+        items = self.scraper._extract_posts_from_html(doc, "testpage")
         if items:
             # Author should be a non-empty string
             assert items[0].data["author"]
@@ -734,9 +927,8 @@ class TestFacebookPublicPageScraping:
         """Images with 'emoji' or 'static' in URL should be excluded."""
         html = """<div data-ft="true"><p>Colorado River is great!</p>
         <img src="https://fb.com/emoji/1.png" /><img src="https://example.com/real.jpg" /></div>"""
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(html, "html.parser")
-        items = self.scraper._extract_posts_from_html(soup, "page")
+        doc = self.scraper._parse_post_html(html)
+        items = self.scraper._extract_posts_from_html(doc, "page")
         if items:
             for img in items[0].data["images"]:
                 assert "emoji" not in img
@@ -750,73 +942,73 @@ class TestFacebookRateLimiting:
     def setup_method(self):
         self.scraper = FacebookScraper()
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_handle_rate_limit_with_retry_after(self, mock_sleep):
         response = httpx.Response(429, headers={"Retry-After": "60"})
-        self.scraper._handle_rate_limit(response)
+        run(self.scraper._handle_rate_limit(response))
         mock_sleep.assert_called_once_with(60)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_handle_rate_limit_caps_at_300(self, mock_sleep):
         response = httpx.Response(429, headers={"Retry-After": "600"})
-        self.scraper._handle_rate_limit(response)
+        run(self.scraper._handle_rate_limit(response))
         mock_sleep.assert_called_once_with(300)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_handle_rate_limit_no_retry_after_header(self, mock_sleep):
         response = httpx.Response(429)
-        self.scraper._handle_rate_limit(response)
+        run(self.scraper._handle_rate_limit(response))
         mock_sleep.assert_called_once_with(60)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_handle_rate_limit_invalid_retry_after(self, mock_sleep):
         response = httpx.Response(429, headers={"Retry-After": "not-a-number"})
-        self.scraper._handle_rate_limit(response)
+        run(self.scraper._handle_rate_limit(response))
         mock_sleep.assert_called_once_with(60)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_high_call_count(self, mock_sleep):
         """Should triple delay when usage > 75%."""
         usage = json.dumps({"call_count": 80})
         response = httpx.Response(200, headers={"X-App-Usage": usage})
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_called_once_with(self.scraper._rate_limit_delay * 3)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_medium_call_count(self, mock_sleep):
         """Should double delay when usage > 50%."""
         usage = json.dumps({"call_count": 55})
         response = httpx.Response(200, headers={"X-App-Usage": usage})
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_called_once_with(self.scraper._rate_limit_delay * 2)
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_low_call_count(self, mock_sleep):
         """No extra delay when usage < 50%."""
         usage = json.dumps({"call_count": 30})
         response = httpx.Response(200, headers={"X-App-Usage": usage})
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_not_called()
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_no_header(self, mock_sleep):
         response = httpx.Response(200)
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_not_called()
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_business_header(self, mock_sleep):
         """Should also read X-Business-Use-Case-Usage header."""
         usage = json.dumps({"call_count": 90})
         response = httpx.Response(200, headers={"X-Business-Use-Case-Usage": usage})
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_called_once()
 
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_check_usage_invalid_json(self, mock_sleep):
         """Should not crash on invalid JSON in usage header."""
         response = httpx.Response(200, headers={"X-App-Usage": "not-json"})
-        self.scraper._check_usage_headers(response)
+        run(self.scraper._check_usage_headers(response))
         mock_sleep.assert_not_called()
 
 
@@ -829,7 +1021,7 @@ class TestFacebookErrorHandling:
         self.scraper = FacebookScraper()
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_returns_empty_on_total_failure(self, mock_sleep):
         """scrape() should return [] not raise on total failure."""
         self.scraper._access_token = ""
@@ -841,7 +1033,7 @@ class TestFacebookErrorHandling:
         assert items == []
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     def test_continues_on_single_page_failure(self, mock_sleep):
         """If one page fails, should continue to next."""
         self.scraper._access_token = "token"
@@ -864,13 +1056,28 @@ class TestFacebookErrorHandling:
             items = self.scraper.scrape()
             assert items == []
 
-    def test_scrape_resets_river_cache(self):
-        """River cache should be reset after scrape."""
+    def test_scrape_keeps_river_cache_for_next_cycle(self):
+        """River cache outlives a scrape so the next cycle skips the DB."""
         self.scraper._river_cache = MOCK_RIVERS
         self.scraper._access_token = ""
         with patch.object(self.scraper, "_scrape_public_pages", return_value=[]):
             self.scraper.scrape()
-        assert self.scraper._river_cache is None
+        assert self.scraper._river_cache is MOCK_RIVERS
+
+    def test_scrape_closes_client_and_reopens_next_cycle(self):
+        self.scraper._access_token = ""
+        with patch.object(self.scraper, "_scrape_public_pages", return_value=[]):
+            self.scraper.scrape()
+            first = self.scraper._client
+            assert first.is_closed
+            self.scraper.scrape()
+        assert self.scraper._client is not first
+
+    def test_scrape_closes_client_on_failure(self):
+        self.scraper._access_token = "token"
+        with patch.object(self.scraper, "_scrape_graph_api", side_effect=RuntimeError("boom")):
+            self.scraper.scrape()
+        assert self.scraper._client.is_closed
 
 
 # ─── Tracked Rivers ─────────────────────────────────────────
@@ -920,6 +1127,22 @@ class TestFacebookTrackedRivers:
         result = self.scraper._get_tracked_rivers()
         assert result == MOCK_RIVERS
 
+    def test_cache_shared_with_new_instances(self):
+        self.scraper._river_cache = MOCK_RIVERS
+        assert FacebookScraper()._get_tracked_rivers() is MOCK_RIVERS
+
+    @patch("scrapers.facebook.SessionLocal")
+    def test_requeries_after_ttl_expires(self, mock_session_cls):
+        session = MagicMock()
+        mock_session_cls.return_value = session
+        session.query.return_value.all.return_value = []
+        self.scraper._river_cache = MOCK_RIVERS
+
+        with patch("scrapers.facebook.time.monotonic", return_value=time.monotonic() + 3601):
+            result = self.scraper._get_tracked_rivers()
+        assert result == []
+        assert mock_session_cls.call_count == 1
+
 
 # ─── Integration: scrape() ───────────────────────────────────
 
@@ -930,7 +1153,7 @@ class TestFacebookScrapeIntegration:
         self.scraper = FacebookScraper()
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.facebook.SessionLocal")
     def test_scrape_with_token_uses_graph_api(self, mock_session_cls, mock_sleep):
         self.scraper._access_token = "valid-token"
@@ -948,7 +1171,7 @@ class TestFacebookScrapeIntegration:
         assert len(items) >= 2  # At least Colorado + Salmon per page
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.facebook.SessionLocal")
     def test_scrape_without_token_uses_public(self, mock_session_cls, mock_sleep):
         self.scraper._access_token = ""
@@ -966,7 +1189,7 @@ class TestFacebookScrapeIntegration:
         assert isinstance(items, list)
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
+    @patch("scrapers.facebook.asyncio.sleep", new_callable=AsyncMock)
     @patch("scrapers.facebook.SessionLocal")
     def test_scrape_returns_scraped_items(self, mock_session_cls, mock_sleep):
         self.scraper._access_token = "token"
@@ -987,8 +1210,7 @@ class TestFacebookScrapeIntegration:
             assert item.data.get("river_name") is not None
 
     @respx.mock
-    @patch("scrapers.facebook.time.sleep")
-    def test_scrape_sleeps_between_pages(self, mock_sleep):
+    def test_scrape_fetches_pages_through_host_bucket(self):
         self.scraper._access_token = "token"
         self.scraper._river_cache = MOCK_RIVERS
 
@@ -997,8 +1219,35 @@ class TestFacebookScrapeIntegration:
                 return_value=httpx.Response(200, json=SAMPLE_GRAPH_EMPTY)
             )
 
-        self.scraper.scrape()
-        assert mock_sleep.call_count >= len(DEFAULT_PAGES)
+        with patch("scrapers.base.TokenBucket.acquire_async", new_callable=AsyncMock) as acquire:
+            self.scraper.scrape()
+        assert acquire.await_count == len(DEFAULT_PAGES)
+        assert set(self.scraper._rate_limiters) == {"graph.facebook.com"}
+
+    @respx.mock
+    def test_scrape_fetches_pages_concurrently(self):
+        self.scraper._access_token = "token"
+        self.scraper._river_cache = MOCK_RIVERS
+        in_flight = 0
+        peak = 0
+
+        async def slow_page(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            loop = asyncio.get_running_loop()
+            tick = loop.create_future()
+            loop.call_soon(tick.set_result, None)
+            await tick
+            in_flight -= 1
+            return httpx.Response(200, json=SAMPLE_GRAPH_EMPTY)
+
+        for page in DEFAULT_PAGES:
+            respx.get(f"https://graph.facebook.com/v19.0/{page}/posts").mock(side_effect=slow_page)
+
+        with patch("scrapers.base.TokenBucket.acquire_async", new_callable=AsyncMock):
+            self.scraper.scrape()
+        assert peak == len(DEFAULT_PAGES)
 
 
 # ─── Constants Validation ────────────────────────────────────
@@ -1011,6 +1260,16 @@ class TestFacebookConstants:
         for p in FLOW_RATE_PATTERNS:
             assert isinstance(p, re.Pattern)
 
+    def test_text_patterns_are_lowercase_and_case_sensitive(self):
+        import re
+        patterns = (
+            FLOW_RATE_PATTERNS + GAUGE_HEIGHT_PATTERNS + WATER_TEMP_PATTERNS
+            + [p for p, _ in RELATIVE_TIME_PATTERNS]
+        )
+        for p in patterns:
+            assert not p.flags & re.IGNORECASE
+            assert p.pattern == p.pattern.lower()
+
     def test_condition_keywords_all_lowercase(self):
         for quality, keywords in CONDITION_KEYWORDS.items():
             for kw in keywords:
@@ -0,0 +1,77 @@
+"""
+Tests for the shared Aho-Corasick keyword helpers (scrapers/keywords.py).
+"""
+
+from unittest.mock import MagicMock
+
+from scrapers.keywords import (
+    best_keyword_match, has_keyword, keyword_automaton, whole_word_matches,
+)
+
+
+class TestKeywordAutomaton:
+    """Tests for keyword_automaton."""
+
+    def test_first_value_wins_for_duplicate_keyword(self):
+        automaton = keyword_automaton([("raft", (0, "raft")), ("raft", (5, "other"))])
+        assert automaton.get("raft") == (0, "raft")
+
+    def test_matches_substrings(self):
+        automaton = keyword_automaton([("oar", (0, "paddle"))])
+        assert [value for _, value in automaton.iter("cataract oars")] == [(0, "paddle")]
+
+
+class TestHasKeyword:
+    """Tests for has_keyword."""
+
+    def test_hit(self):
+        assert has_keyword(keyword_automaton([("kayak", None)]), "used kayak") is True
+
+    def test_miss(self):
+        assert has_keyword(keyword_automaton([("kayak", None)]), "mountain bike") is False
+
+    def test_empty_text(self):
+        assert has_keyword(keyword_automaton([("kayak", None)]), "") is False
+
+
+class TestBestKeywordMatch:
+    """Tests for best_keyword_match."""
+
+    def test_stops_at_top_priority_hit(self):
+        consumed = []
+
+        def hits():
+            for hit in [(5, (1, "warning")), (9, (0, "danger")), (20, (1, "warning"))]:
+                consumed.append(hit)
+                yield hit
+
+        automaton = MagicMock()
+        automaton.iter.return_value = hits()
+        assert best_keyword_match(automaton, "text", "info") == "danger"
+        assert len(consumed) == 2
+
+    def test_default_without_hits(self):
+        automaton = MagicMock()
+        automaton.iter.return_value = iter(())
+        assert best_keyword_match(automaton, "text", "info") == "info"
+
+
+class TestWholeWordMatches:
+    """Tests for whole_word_matches."""
+
+    def setup_method(self):
+        self.automaton = keyword_automaton(
+            [("green river", ("green river", "green")), ("st. croix", ("st. croix", "croix"))]
+        )
+
+    def test_bounded_hit(self):
+        assert list(whole_word_matches(self.automaton, "on the green river today")) == ["green"]
+
+    def test_hit_at_text_edges(self):
+        assert list(whole_word_matches(self.automaton, "green river")) == ["green"]
+
+    def test_rejects_embedded_hit(self):
+        assert list(whole_word_matches(self.automaton, "evergreen rivers")) == []
+
+    def test_punctuation_is_a_boundary(self):
+        assert list(whole_word_matches(self.automaton, "(st. croix)")) == ["croix"]
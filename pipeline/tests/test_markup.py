@@ -0,0 +1,22 @@
+"""
+Tests for the shared lxml helpers (scrapers/markup.py).
+"""
+
+import lxml.html
+
+from scrapers.markup import element_text
+
+
+class TestElementText:
+    """Tests for element_text."""
+
+    def test_joins_stripped_text_nodes(self):
+        el = lxml.html.fromstring("<div> Green <b> River </b>\n<i>900 cfs</i> </div>")
+        assert element_text(el) == "GreenRiver900 cfs"
+
+    def test_separator_skips_whitespace_only_nodes(self):
+        el = lxml.html.fromstring("<div><p>Class IV</p>\n  <p>Big water</p></div>")
+        assert element_text(el, " ") == "Class IV Big water"
+
+    def test_empty_element(self):
+        assert element_text(lxml.html.fromstring("<p></p>")) == ""
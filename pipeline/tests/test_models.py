@@ -6,8 +6,10 @@ relationship definitions. These are structural tests that don't
 require a database connection.
 """
 
+import json
 from datetime import datetime
 from unittest.mock import MagicMock
+from models.database import engine, _json_dumps
 from models.models import (
     River,
     RiverCondition,
@@ -148,3 +150,15 @@ class TestScrapeLogModel:
         for col_name in ["source", "status", "started_at"]:
             col = ScrapeLog.__table__.columns[col_name]
             assert col.nullable is False, f"{col_name} should be non-nullable"
+
+
+class TestJsonColumnSerialization:
+    def test_engine_uses_orjson_serializer(self):
+        assert engine.dialect._json_serializer is _json_dumps
+
+    def test_round_trips_raw_readings(self):
+        raw = {"site_code": "09380000", "00060": 12800.0, "datetime": "2026-02-24T10:15:00"}
+        assert json.loads(_json_dumps(raw)) == raw
+
+    def test_accepts_non_string_keys(self):
+        assert json.loads(_json_dumps({1: "a"})) == {"1": "a"}
@@ -26,7 +26,8 @@ class TestDefaultValues:
             if k not in (
                 "DATABASE_URL", "SCRAPE_INTERVAL_MINUTES",
                 "RAFT_WATCH_INTERVAL_MINUTES", "REQUEST_TIMEOUT",
-                "RATE_LIMIT_DELAY", "CRAIGSLIST_REGIONS",
+                "RATE_LIMIT_DELAY", "CACHE_DIR", "CRAIGSLIST_REGIONS",
+                "RIVER_CACHE_TTL_SECONDS", "RIDB_CATALOG_TTL_SECONDS",
                 "USGS_BASE_URL", "AW_BASE_URL",
                 "NEXT_PUBLIC_VAPID_PUBLIC_KEY", "VAPID_PRIVATE_KEY",
                 "VAPID_SUBJECT", "RESEND_API_KEY",
@@ -61,6 +62,19 @@ class TestDefaultValues:
         s = self._make_settings()
         assert s.rate_limit_delay == 2.0
 
+    def test_default_cache_dir_is_under_tmp(self):
+        import tempfile
+        s = self._make_settings()
+        assert s.cache_dir == os.path.join(tempfile.gettempdir(), "waterwatcher")
+
+    def test_default_river_cache_ttl(self):
+        s = self._make_settings()
+        assert s.river_cache_ttl_seconds == 3600
+
+    def test_default_ridb_catalog_ttl(self):
+        s = self._make_settings()
+        assert s.ridb_catalog_ttl_seconds == 86400
+
     def test_default_craigslist_regions(self):
         s = self._make_settings()
         assert isinstance(s.craigslist_regions, list)
@@ -110,7 +124,8 @@ class TestOverrides:
             if k not in (
                 "DATABASE_URL", "SCRAPE_INTERVAL_MINUTES",
                 "RAFT_WATCH_INTERVAL_MINUTES", "REQUEST_TIMEOUT",
-                "RATE_LIMIT_DELAY", "CRAIGSLIST_REGIONS",
+                "RATE_LIMIT_DELAY", "CACHE_DIR", "CRAIGSLIST_REGIONS",
+                "RIVER_CACHE_TTL_SECONDS", "RIDB_CATALOG_TTL_SECONDS",
                 "USGS_BASE_URL", "AW_BASE_URL",
                 "NEXT_PUBLIC_VAPID_PUBLIC_KEY", "VAPID_PRIVATE_KEY",
                 "VAPID_SUBJECT", "RESEND_API_KEY",
@@ -143,6 +158,18 @@ class TestOverrides:
         s = self._make_settings({"RATE_LIMIT_DELAY": "0.5"})
         assert s.rate_limit_delay == 0.5
 
+    def test_override_cache_dir(self):
+        s = self._make_settings({"CACHE_DIR": "/var/cache/waterwatcher"})
+        assert s.cache_dir == "/var/cache/waterwatcher"
+
+    def test_override_river_cache_ttl(self):
+        s = self._make_settings({"RIVER_CACHE_TTL_SECONDS": "600"})
+        assert s.river_cache_ttl_seconds == 600
+
+    def test_override_ridb_catalog_ttl(self):
+        s = self._make_settings({"RIDB_CATALOG_TTL_SECONDS": "3600"})
+        assert s.ridb_catalog_ttl_seconds == 3600
+
     def test_override_craigslist_regions(self):
         s = self._make_settings({"CRAIGSLIST_REGIONS": "sacramento,reno"})
         assert s.craigslist_regions == ["sacramento", "reno"]
@@ -172,7 +199,8 @@ class TestTypeCoercion:
             if k not in (
                 "DATABASE_URL", "SCRAPE_INTERVAL_MINUTES",
                 "RAFT_WATCH_INTERVAL_MINUTES", "REQUEST_TIMEOUT",
-                "RATE_LIMIT_DELAY", "CRAIGSLIST_REGIONS",
+                "RATE_LIMIT_DELAY", "CACHE_DIR", "CRAIGSLIST_REGIONS",
+                "RIVER_CACHE_TTL_SECONDS", "RIDB_CATALOG_TTL_SECONDS",
             )
         }
         env.update(env_overrides)
@@ -218,7 +246,8 @@ class TestEdgeCases:
             if k not in (
                 "DATABASE_URL", "SCRAPE_INTERVAL_MINUTES",
                 "RAFT_WATCH_INTERVAL_MINUTES", "REQUEST_TIMEOUT",
-                "RATE_LIMIT_DELAY", "CRAIGSLIST_REGIONS",
+                "RATE_LIMIT_DELAY", "CACHE_DIR", "CRAIGSLIST_REGIONS",
+                "RIVER_CACHE_TTL_SECONDS", "RIDB_CATALOG_TTL_SECONDS",
             )
         }
         env.update(env_overrides)
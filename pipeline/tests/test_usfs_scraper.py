@@ -9,16 +9,18 @@ Mocks HTTP responses with respx and verifies:
 - Severity classification
 - River name extraction from facility names
 - Date parsing in RIDB formats
-- Rate limiting (sleep delays between requests)
+- Rate limiting (token bucket per request, backoff on 429)
 - Error handling (timeouts, HTTP errors, missing fields)
 - scrape() integration: combines facility + rec area alerts
 """
 
+import asyncio
+
 import httpx
 import respx
 import pytest
-from datetime import datetime, timezone
-from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from scrapers.usfs import (
     USFSScraper,
@@ -30,6 +32,26 @@ from scrapers.base import BaseScraper, ScrapedItem
 from config.settings import settings
 
 
+def run(coro):
+    """Run a scraper coroutine to completion."""
+    return asyncio.run(coro)
+
+
+@pytest.fixture(autouse=True)
+def _clear_rate_limits():
+    """RIDB token buckets are shared per process; keep tests from sharing them."""
+    USFSScraper.clear_rate_limits()
+    yield
+    USFSScraper.clear_rate_limits()
+
+
+@pytest.fixture(autouse=True)
+def _no_catalog_file():
+    """Keep the RIDB listing cache in memory so tests don't share it."""
+    with patch.object(settings, "cache_dir", ""):
+        yield
+
+
 # ─── Sample RIDB responses ──────────────────────────────────
 
 SAMPLE_FACILITIES = {
@@ -113,7 +135,12 @@ class TestUSFSScraperInit:
     @patch.object(settings, "ridb_api_key", "test-key")
     def test_has_http_client(self):
         scraper = USFSScraper()
-        assert isinstance(scraper._client, httpx.Client)
+        assert isinstance(scraper._client, httpx.AsyncClient)
+
+    @patch.object(settings, "ridb_api_key", "key")
+    def test_client_uses_http2(self):
+        scraper = USFSScraper()
+        assert scraper._client._transport._pool._http2
 
     @patch.object(settings, "ridb_api_key", "my-key-123")
     def test_client_sends_api_key_header(self):
@@ -130,6 +157,11 @@ class TestUSFSScraperInit:
         scraper = USFSScraper()
         assert "application/json" in scraper._client.headers.get("Accept", "")
 
+    @patch.object(settings, "ridb_api_key", "key")
+    def test_client_does_not_follow_redirects(self):
+        scraper = USFSScraper()
+        assert scraper._client.follow_redirects is False
+
 
 # ─── API Key Gating ─────────────────────────────────────────
 
@@ -152,7 +184,7 @@ class TestUSFSAPIKeyGating:
 
     @patch.object(settings, "ridb_api_key", "valid-key")
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_proceeds_with_key(self, mock_sleep):
         scraper = USFSScraper()
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
@@ -198,6 +230,13 @@ class TestUSFSAlertTypeClassification:
     def test_general_fallback(self):
         assert self.scraper._classify_alert_type("General info", "Nothing special") == "general"
 
+    def test_map_order_beats_text_order(self):
+        # "campground" appears first in the text, but "closure" is listed first
+        assert self.scraper._classify_alert_type("Campground closure", "") == "closure"
+
+    def test_uses_precomputed_lowercase_text(self):
+        assert self.scraper._classify_alert_type("", "", "fire ban in effect") == "fire_restriction"
+
 
 # ─── Severity Classification ────────────────────────────────
 
@@ -232,6 +271,12 @@ class TestUSFSSeverityClassification:
     def test_danger_priority_over_warning(self):
         assert self.scraper._classify_severity("Closed area, restricted access", "") == "danger"
 
+    def test_danger_priority_when_warning_comes_first(self):
+        assert self.scraper._classify_severity("Caution", "road closed ahead") == "danger"
+
+    def test_uses_precomputed_lowercase_text(self):
+        assert self.scraper._classify_severity("", "", "use caution") == "warning"
+
 
 # ─── River Name Extraction ──────────────────────────────────
 
@@ -271,6 +316,16 @@ class TestUSFSRiverNameExtraction:
     def test_extract_from_text_canyon(self):
         assert self.scraper._extract_river_name_from_text("Hells Canyon visitor center") == "Hells Canyon"
 
+    def test_extract_from_text_river_beats_earlier_creek(self):
+        text = "Eagle Creek joins the Snake River"
+        assert self.scraper._extract_river_name_from_text(text) == "Snake River"
+
+    def test_extract_from_text_is_memoized(self):
+        USFSScraper._extract_river_name_from_text.cache_clear()
+        self.scraper._extract_river_name_from_text("Rogue River access")
+        self.scraper._extract_river_name_from_text("Rogue River access")
+        assert USFSScraper._extract_river_name_from_text.cache_info().hits == 1
+
     def test_extract_from_text_none_for_no_match(self):
         assert self.scraper._extract_river_name_from_text("Mountain campground") is None
 
@@ -320,6 +375,21 @@ class TestUSFSDateParsing:
         dt = self.scraper._parse_date("2026-01-15")
         assert dt.tzinfo is not None
 
+    def test_iso_fractional_seconds(self):
+        dt = self.scraper._parse_date("2026-03-01T12:00:00.250Z")
+        assert dt == datetime(2026, 3, 1, 12, 0, 0, 250000, tzinfo=timezone.utc)
+
+    def test_iso_space_separator(self):
+        dt = self.scraper._parse_date(" 2026-03-01 08:30:00 ")
+        assert dt == datetime(2026, 3, 1, 8, 30, tzinfo=timezone.utc)
+
+    def test_offset_preserved(self):
+        dt = self.scraper._parse_date("2026-03-01T12:00:00-06:00")
+        assert dt.utcoffset() == timedelta(hours=-6)
+
+    def test_malformed_iso_falls_through_to_none(self):
+        assert self.scraper._parse_date("2026-13-45") is None
+
 
 # ─── Facility Alert Parsing ─────────────────────────────────
 
@@ -427,7 +497,7 @@ class TestUSFSFetchFacilityAlerts:
         self.scraper = USFSScraper()
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_fetches_facilities_and_alerts(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             return_value=httpx.Response(200, json=SAMPLE_FACILITIES)
@@ -440,30 +510,30 @@ class TestUSFSFetchFacilityAlerts:
             return_value=httpx.Response(200, json={"RECDATA": []})
         )
 
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert len(items) == 1
         assert items[0].data["river_name"] == "Salmon River"
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_facilities_timeout(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_facilities_http_error(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             return_value=httpx.Response(500)
         )
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_facility_alert_timeout(self, mock_sleep):
         """Individual facility alert timeout doesn't crash the scraper."""
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
@@ -474,32 +544,82 @@ class TestUSFSFetchFacilityAlerts:
         respx.get(f"{RIDB_BASE_URL}/facilities/F1/alerts").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_handles_malformed_facility_alert_json(self, mock_sleep):
+        respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json={
+                "RECDATA": [{"FacilityID": "F1", "FacilityName": "Snake River Launch"}]
+            })
+        )
+        respx.get(f"{RIDB_BASE_URL}/facilities/F1/alerts").mock(
+            return_value=httpx.Response(200, content=b"<html>maintenance</html>")
+        )
+        items = run(self.scraper._fetch_facility_alerts())
+        assert items == []
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_skips_facility_without_id(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             return_value=httpx.Response(200, json={
                 "RECDATA": [{"FacilityName": "No ID here"}]
             })
         )
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_non_list_recdata(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             return_value=httpx.Response(200, json={"RECDATA": "not a list"})
         )
-        items = self.scraper._fetch_facility_alerts()
+        items = run(self.scraper._fetch_facility_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
-    def test_rate_limits_between_facility_requests(self, mock_sleep):
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_reuses_cached_facility_listing(self, mock_sleep):
+        route = respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json=SAMPLE_FACILITIES)
+        )
+        respx.get(url__regex=rf"{RIDB_BASE_URL}/facilities/FAC-00\d/alerts").mock(
+            return_value=httpx.Response(200, json={"RECDATA": []})
+        )
+        run(self.scraper._fetch_facility_alerts())
+        run(self.scraper._fetch_facility_alerts())
+        assert route.call_count == 1
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_refresh_catalog_refetches_listing(self, mock_sleep):
+        route = respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json=SAMPLE_FACILITIES)
+        )
+        respx.get(url__regex=rf"{RIDB_BASE_URL}/facilities/FAC-00\d/alerts").mock(
+            return_value=httpx.Response(200, json={"RECDATA": []})
+        )
+        run(self.scraper._fetch_facility_alerts())
+        self.scraper.refresh_catalog()
+        run(self.scraper._fetch_facility_alerts())
+        assert route.call_count == 2
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_empty_listing_is_not_cached(self, mock_sleep):
+        route = respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json={"RECDATA": []})
+        )
+        run(self.scraper._fetch_facility_alerts())
+        run(self.scraper._fetch_facility_alerts())
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_rate_limits_every_request(self):
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
             return_value=httpx.Response(200, json=SAMPLE_FACILITIES)
         )
@@ -510,9 +630,90 @@ class TestUSFSFetchFacilityAlerts:
             return_value=httpx.Response(200, json={"RECDATA": []})
         )
 
-        self.scraper._fetch_facility_alerts()
-        # Should sleep between each facility request
-        assert mock_sleep.call_count >= 2
+        with patch("scrapers.base.TokenBucket.acquire_async", new_callable=AsyncMock) as acquire:
+            run(self.scraper._fetch_facility_alerts())
+        # One token for the facility list plus one per facility
+        assert acquire.await_count == 3
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_retries_429_with_exponential_backoff(self, mock_sleep):
+        respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            side_effect=[
+                httpx.Response(429),
+                httpx.Response(429),
+                httpx.Response(200, json={"RECDATA": []}),
+            ]
+        )
+        with patch("scrapers.base.TokenBucket.acquire_async", new_callable=AsyncMock):
+            items = run(self.scraper._fetch_facility_alerts())
+        assert items == []
+        backoffs = [c.args[0] for c in mock_sleep.await_args_list]
+        assert backoffs == [1.0, 2.0]
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_429_honours_retry_after(self, mock_sleep):
+        respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            side_effect=[
+                httpx.Response(429, headers={"Retry-After": "5"}),
+                httpx.Response(200, json={"RECDATA": []}),
+            ]
+        )
+        run(self.scraper._fetch_facility_alerts())
+        waits = [c.args[0] for c in mock_sleep.await_args_list]
+        # The bucket waits out Retry-After; no extra exponential backoff
+        assert len(waits) == 1
+        assert 4.0 < waits[0] <= 5.0
+
+    @patch.object(settings, "ridb_api_key", "key")
+    def test_instances_share_rate_limiter(self):
+        other = USFSScraper()
+        url = f"{RIDB_BASE_URL}/facilities"
+        assert other._rate_limiter(url) is self.scraper._rate_limiter(url)
+
+    def test_rate_limiter_follows_rate_limit_delay(self):
+        with patch.object(settings, "rate_limit_delay", 0.25):
+            bucket = self.scraper._rate_limiter(f"{RIDB_BASE_URL}/facilities")
+        assert bucket.rate == 4.0
+
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        route = respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(429)
+        )
+        items = run(self.scraper._fetch_facility_alerts())
+        assert items == []
+        assert route.call_count == self.scraper._max_retries + 1
+
+    @respx.mock
+    def test_fetches_facility_alerts_concurrently(self):
+        facilities = {"RECDATA": [
+            {"FacilityID": f"F{i}", "FacilityName": f"Launch {i}"} for i in range(5)
+        ]}
+        respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json=facilities)
+        )
+        in_flight = peak = 0
+
+        async def slow_alerts(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            loop = asyncio.get_running_loop()
+            tick = loop.create_future()
+            loop.call_soon(tick.set_result, None)
+            await tick
+            in_flight -= 1
+            return httpx.Response(200, json={"RECDATA": []})
+
+        respx.get(url__regex=rf"{RIDB_BASE_URL}/facilities/F\d/alerts").mock(
+            side_effect=slow_alerts
+        )
+        with patch("scrapers.base.TokenBucket.acquire_async", new_callable=AsyncMock):
+            run(self.scraper._fetch_facility_alerts())
+        assert peak == 5
 
 
 # ─── Fetch Rec Area Alerts (HTTP mocked) ────────────────────
@@ -525,7 +726,7 @@ class TestUSFSFetchRecAreaAlerts:
         self.scraper = USFSScraper()
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_fetches_rec_areas_and_alerts(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/recareas").mock(
             return_value=httpx.Response(200, json=SAMPLE_REC_AREAS)
@@ -539,38 +740,38 @@ class TestUSFSFetchRecAreaAlerts:
             return_value=httpx.Response(200, json=SAMPLE_REC_AREA_ALERTS)
         )
 
-        items = self.scraper._fetch_rec_area_alerts()
+        items = run(self.scraper._fetch_rec_area_alerts())
         # Only REC-002 has an alert with Deschutes River
         river_names = [i.data["river_name"] for i in items]
         assert "Deschutes River" in river_names
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_rec_areas_timeout(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/recareas").mock(
             side_effect=httpx.TimeoutException("timeout")
         )
-        items = self.scraper._fetch_rec_area_alerts()
+        items = run(self.scraper._fetch_rec_area_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_handles_rec_areas_http_error(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/recareas").mock(
             return_value=httpx.Response(403)
         )
-        items = self.scraper._fetch_rec_area_alerts()
+        items = run(self.scraper._fetch_rec_area_alerts())
         assert items == []
 
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_skips_rec_area_without_id(self, mock_sleep):
         respx.get(f"{RIDB_BASE_URL}/recareas").mock(
             return_value=httpx.Response(200, json={
                 "RECDATA": [{"RecAreaName": "No ID"}]
             })
         )
-        items = self.scraper._fetch_rec_area_alerts()
+        items = run(self.scraper._fetch_rec_area_alerts())
         assert items == []
 
 
@@ -581,7 +782,7 @@ class TestUSFSScrapeIntegration:
 
     @patch.object(settings, "ridb_api_key", "test-key")
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_combines_facility_and_rec_alerts(self, mock_sleep):
         scraper = USFSScraper()
 
@@ -610,7 +811,7 @@ class TestUSFSScrapeIntegration:
 
     @patch.object(settings, "ridb_api_key", "test-key")
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_returns_empty_on_total_failure(self, mock_sleep):
         scraper = USFSScraper()
         respx.get(f"{RIDB_BASE_URL}/facilities").mock(
@@ -625,7 +826,7 @@ class TestUSFSScrapeIntegration:
 
     @patch.object(settings, "ridb_api_key", "test-key")
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_all_items_have_river_name(self, mock_sleep):
         scraper = USFSScraper()
 
@@ -648,7 +849,7 @@ class TestUSFSScrapeIntegration:
 
     @patch.object(settings, "ridb_api_key", "test-key")
     @respx.mock
-    @patch("scrapers.usfs.time.sleep")
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
     def test_scrape_data_required_fields(self, mock_sleep):
         scraper = USFSScraper()
 
@@ -673,6 +874,25 @@ class TestUSFSScrapeIntegration:
             assert "title" in item.data
 
 
+    @patch.object(settings, "ridb_api_key", "test-key")
+    @respx.mock
+    @patch("scrapers.usfs.asyncio.sleep", new_callable=AsyncMock)
+    def test_scrape_closes_client_and_reopens_next_cycle(self, mock_sleep):
+        scraper = USFSScraper()
+        respx.get(f"{RIDB_BASE_URL}/facilities").mock(
+            return_value=httpx.Response(200, json={"RECDATA": []})
+        )
+        respx.get(f"{RIDB_BASE_URL}/recareas").mock(
+            return_value=httpx.Response(200, json={"RECDATA": []})
+        )
+
+        scraper.scrape()
+        first = scraper._client
+        assert first.is_closed
+        scraper.scrape()
+        assert scraper._client is not first
+
+
 # ─── Edge Cases ─────────────────────────────────────────────
 
 class TestUSFSEdgeCases:
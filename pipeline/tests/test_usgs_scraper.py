@@ -10,23 +10,33 @@ Mocks HTTP responses with realistic USGS JSON data and verifies:
 - Malformed/unexpected response structures
 """
 
+import time
+
 import httpx
 import respx
 import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-from scrapers.usgs import USGSScraper
+from scrapers.usgs import SHARD_SIZE, USGSScraper
 from scrapers.base import ScrapedItem
 from config.settings import settings
 from tests.conftest import (
-    USGS_RESPONSE_JSON,
+    USGS_RESPONSE_BYTES,
     USGS_EMPTY_RESPONSE,
     USGS_MALFORMED_RESPONSE,
     make_mock_river,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_gauge_cache():
+    """Gauge IDs are cached on the class; keep tests from sharing them."""
+    USGSScraper.clear_gauge_cache()
+    yield
+    USGSScraper.clear_gauge_cache()
+
+
 class TestUSGSScraper:
     """Tests for USGSScraper."""
 
@@ -48,7 +58,7 @@ class TestUSGSScraper:
 
         url_pattern = f"{settings.usgs_base_url}/iv/"
         respx.get(url_pattern).mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -67,7 +77,7 @@ class TestUSGSScraper:
         ]
 
         respx.get(f"{settings.usgs_base_url}/iv/").mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -84,7 +94,7 @@ class TestUSGSScraper:
         ]
 
         respx.get(f"{settings.usgs_base_url}/iv/").mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -104,7 +114,7 @@ class TestUSGSScraper:
         ]
 
         respx.get(f"{settings.usgs_base_url}/iv/").mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -123,7 +133,7 @@ class TestUSGSScraper:
         ]
 
         respx.get(f"{settings.usgs_base_url}/iv/").mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -220,7 +230,7 @@ class TestUSGSScraper:
         ]
 
         respx.get(f"{settings.usgs_base_url}/iv/").mock(
-            return_value=httpx.Response(200, json=USGS_RESPONSE_JSON)
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
         )
 
         items = self.scraper.scrape()
@@ -243,3 +253,128 @@ class TestUSGSScraper:
         # Should not crash — may return empty list or raise handled error
         items = self.scraper.scrape()
         assert isinstance(items, list)
+
+
+class TestUSGSClient:
+    """Tests for the shared pooled HTTP client."""
+
+    def teardown_method(self):
+        USGSScraper.close()
+
+    def test_client_shared_across_instances(self):
+        assert USGSScraper()._get_client() is USGSScraper()._get_client()
+
+    def test_client_uses_http2(self):
+        assert USGSScraper._get_client()._transport._pool._http2
+
+    def test_close_releases_client_and_reopens_on_demand(self):
+        first = USGSScraper._get_client()
+        USGSScraper.close()
+        assert first.is_closed
+        assert USGSScraper._get_client() is not first
+
+    @respx.mock
+    @patch("scrapers.usgs.SessionLocal")
+    def test_scrape_reuses_client_across_cycles(self, mock_session_cls):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(usgs_gauge_id="09380000"),
+        ]
+        respx.get(f"{settings.usgs_base_url}/iv/").mock(
+            return_value=httpx.Response(200, content=USGS_RESPONSE_BYTES)
+        )
+
+        USGSScraper().scrape()
+        first = USGSScraper._client
+        USGSScraper().scrape()
+        assert USGSScraper._client is first
+        assert not first.is_closed
+
+
+class TestUSGSGaugeIdCache:
+    """Tests for the cached tracked-gauge lookup."""
+
+    def _mock_rivers(self, mock_session_cls, *gauge_ids):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(usgs_gauge_id=g) for g in gauge_ids
+        ]
+        return mock_session
+
+    @patch("scrapers.usgs.SessionLocal")
+    def test_selects_only_gauge_id_column(self, mock_session_cls):
+        from models import River
+        session = self._mock_rivers(mock_session_cls, "09380000")
+        assert USGSScraper()._get_tracked_gauge_ids() == ["09380000"]
+        session.query.assert_called_once_with(River.usgs_gauge_id)
+        session.close.assert_called_once()
+
+    @patch("scrapers.usgs.SessionLocal")
+    def test_reuses_ids_across_instances(self, mock_session_cls):
+        self._mock_rivers(mock_session_cls, "09380000")
+        USGSScraper()._get_tracked_gauge_ids()
+        USGSScraper()._get_tracked_gauge_ids()
+        assert mock_session_cls.call_count == 1
+
+    @patch("scrapers.usgs.SessionLocal")
+    def test_requeries_after_ttl(self, mock_session_cls):
+        self._mock_rivers(mock_session_cls, "09380000")
+        USGSScraper()._get_tracked_gauge_ids()
+        later = time.monotonic() + settings.river_cache_ttl_seconds + 1
+        with patch("scrapers.usgs.time.monotonic", return_value=later):
+            USGSScraper()._get_tracked_gauge_ids()
+        assert mock_session_cls.call_count == 2
+
+    @patch("scrapers.usgs.SessionLocal")
+    def test_clear_gauge_cache_forces_requery(self, mock_session_cls):
+        self._mock_rivers(mock_session_cls, "09380000")
+        USGSScraper()._get_tracked_gauge_ids()
+        USGSScraper.clear_gauge_cache()
+        USGSScraper()._get_tracked_gauge_ids()
+        assert mock_session_cls.call_count == 2
+
+
+class TestUSGSSharding:
+    """Tests for splitting large gauge sets across parallel requests."""
+
+    def _mock_rivers(self, mock_session_cls, gauge_ids):
+        mock_session = MagicMock()
+        mock_session_cls.return_value = mock_session
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            make_mock_river(usgs_gauge_id=g) for g in gauge_ids
+        ]
+
+    @respx.mock
+    @patch("scrapers.usgs.SessionLocal")
+    def test_splits_gauge_ids_into_shards(self, mock_session_cls):
+        gauge_ids = [f"{i:08d}" for i in range(SHARD_SIZE * 2 + 10)]
+        self._mock_rivers(mock_session_cls, gauge_ids)
+        route = respx.get(f"{settings.usgs_base_url}/iv/").mock(
+            return_value=httpx.Response(200, json=USGS_EMPTY_RESPONSE)
+        )
+
+        USGSScraper().scrape()
+        shards = sorted(
+            (call.request.url.params["sites"].split(",") for call in route.calls),
+            key=lambda sites: sites[0],
+        )
+        assert [len(s) for s in shards] == [SHARD_SIZE, SHARD_SIZE, 10]
+        assert [g for s in shards for g in s] == gauge_ids
+
+    @respx.mock
+    @patch("scrapers.usgs.SessionLocal")
+    def test_failed_shard_keeps_other_shards(self, mock_session_cls):
+        gauge_ids = ["09380000"] + [f"{i:08d}" for i in range(SHARD_SIZE)]
+        self._mock_rivers(mock_session_cls, gauge_ids)
+
+        def by_shard(request):
+            if request.url.params["sites"].startswith("09380000"):
+                return httpx.Response(200, content=USGS_RESPONSE_BYTES)
+            return httpx.Response(503)
+
+        respx.get(f"{settings.usgs_base_url}/iv/").mock(side_effect=by_shard)
+
+        items = USGSScraper().scrape()
+        assert "09380000" in {i.data["usgs_gauge_id"] for i in items}
@@ -38,6 +38,14 @@ def _make_timeseries_entry(site_code, param_code, values):
     }
 
 
+@pytest.fixture(autouse=True)
+def _clear_gauge_cache():
+    """Gauge IDs are cached on the class; keep tests from sharing them."""
+    USGSScraper.clear_gauge_cache()
+    yield
+    USGSScraper.clear_gauge_cache()
+
+
 def _make_usgs_response(*timeseries):
     """Build a full USGS JSON response body."""
     return {"value": {"timeSeries": list(timeseries)}}
@@ -106,6 +114,22 @@ class TestMalformedResponses:
         items = self.scraper.scrape()
         assert items == []
 
+    @respx.mock
+    @patch("scrapers.usgs.SessionLocal")
+    def test_timeseries_with_empty_values_container(self, mock_session_cls):
+        """An empty outer 'values' list skips that entry, not the whole batch."""
+        _setup_scraper_mock(mock_session_cls, ["09380000", "13317000"])
+        empty = _make_timeseries_entry("09380000", "00060", [])
+        empty["values"] = []
+        ok = _make_timeseries_entry("13317000", "00060",
+                                     [{"value": "2150", "dateTime": "2026-01-01T00:00:00"}])
+        respx.get(f"{settings.usgs_base_url}/iv/").mock(
+            return_value=httpx.Response(200, json=_make_usgs_response(empty, ok))
+        )
+        items = self.scraper.scrape()
+        assert [item.data["usgs_gauge_id"] for item in items] == ["13317000"]
+        assert items[0].data["flow_rate"] == 2150.0
+
     @respx.mock
     @patch("scrapers.usgs.SessionLocal")
     def test_timeseries_missing_source_info(self, mock_session_cls):